@@ -12,6 +12,16 @@ load_dotenv()
 ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID")  # Get from https://developer.adzuna.com/
 ADZUNA_APP_KEY = os.getenv("ADZUNA_APP_KEY")
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")  # Get from https://rapidapi.com/
+# LinkedIn Job Search API on RapidAPI (separate subscription; defaults to the
+# same RapidAPI key)
+LINKEDIN_RAPIDAPI_KEY = os.getenv("LINKEDIN_RAPIDAPI_KEY") or RAPIDAPI_KEY
+# Credentials by the names scrapers declare in register_scraper(auth=...)
+SCRAPER_CREDENTIALS = {
+    "rapidapi_key": RAPIDAPI_KEY,
+    "adzuna_app_id": ADZUNA_APP_ID,
+    "adzuna_app_key": ADZUNA_APP_KEY,
+    "linkedin_api_key": LINKEDIN_RAPIDAPI_KEY,
+}
 
 # OpenAI configuration
 OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
@@ -40,6 +50,79 @@ REPORT_RECIPIENT = os.getenv("REPORT_RECIPIENT", EMAIL_USER)
 JOB_KEYWORDS = "Data Engineer", "Software Engineer", "Cloud Architect" 
 JOB_LOCATION = "United States"
 NUM_PAGES = 5
+# Worker threads for concurrent multi-source / multi-keyword scraping
+SCRAPE_MAX_WORKERS = int(os.getenv("SCRAPE_MAX_WORKERS", "8"))
+# Keep-alive HTTP session settings shared by all scrapers
+SCRAPER_SESSION_OPTIONS = {
+    "pool_size": int(os.getenv("SCRAPER_POOL_SIZE", "10")),
+    "connect_timeout": float(os.getenv("SCRAPER_CONNECT_TIMEOUT", "5")),
+    # Backup request once a page outlives this latency percentile (0 = off)
+    "hedge_percentile": float(os.getenv("SCRAPER_HEDGE_PERCENTILE", "0.9")),
+}
+# Stop paginating a (source, keyword) once a page's expected number of good
+# new jobs (new postings x learned H1B pass rate x match rate) drops below
+# ADAPTIVE_PAGING_MIN_YIELD; unused pages go to still-productive queries.
+# Off by default: until a few runs have recorded outcomes the rates are
+# priors, and it would silently cut pages below num_pages
+ADAPTIVE_PAGING = os.getenv("ADAPTIVE_PAGING", "0") == "1"
+ADAPTIVE_PAGING_MIN_YIELD = float(os.getenv("ADAPTIVE_PAGING_MIN_YIELD", "0.5"))
+# Extra scraper modules to import; each registers its source with
+# @register_scraper (comma-separated module paths)
+SCRAPER_PLUGINS = [
+    module.strip()
+    for module in os.getenv("SCRAPER_PLUGINS", "").split(",")
+    if module.strip()
+]
+# Time budget (seconds) for the interactive Streamlit scrape; sources still
+# running when it expires are cut off and reported as incomplete (0 = none)
+SCRAPE_DEADLINE_SECONDS = float(os.getenv("SCRAPE_DEADLINE_SECONDS", "90"))
+# On-disk cache of scraped result pages (TTL is set per source)
+SCRAPER_CACHE_ENABLED = os.getenv("SCRAPER_CACHE_ENABLED", "1") == "1"
+SCRAPER_CACHE_MAX_MB = int(os.getenv("SCRAPER_CACHE_MAX_MB", "200"))
+# Compressed archive of every downloaded results page, so parsers can be
+# re-run later without refetching (python -m src.scrapers.page_archive)
+SCRAPER_ARCHIVE_ENABLED = os.getenv("SCRAPER_ARCHIVE_ENABLED", "1") == "1"
+SCRAPER_ARCHIVE_KEEP_DAYS = int(os.getenv("SCRAPER_ARCHIVE_KEEP_DAYS", "90"))
+# Persist per-key API call counts and cap metered sources (JSearch) to budget
+QUOTA_TRACKING_ENABLED = os.getenv("QUOTA_TRACKING_ENABLED", "1") == "1"
+# Scheduled/CLI runs only process postings not seen in earlier runs
+INCREMENTAL_SCRAPING = os.getenv("INCREMENTAL_SCRAPING", "1") == "1"
+# Download full Indeed job descriptions in the background (search cards
+# only carry a snippet); detail pages share Indeed's rate limit
+INDEED_DETAIL_OPTIONS = {
+    "fetch_details": os.getenv("INDEED_FETCH_DETAILS", "0") == "1",
+    "detail_workers": int(os.getenv("INDEED_DETAIL_WORKERS", "2")),
+    "max_details": int(os.getenv("INDEED_MAX_DETAILS", "50")),
+    # Result-page parser: auto | selectolax | lxml | html.parser
+    "parser_backend": os.getenv("INDEED_HTML_PARSER", "auto"),
+}
+# Terms excluded from every source query (comma-separated); clearance
+# roles require US citizenship
+SCRAPE_EXCLUDE_TERMS = [
+    term.strip()
+    for term in os.getenv("SCRAPE_EXCLUDE_TERMS", "clearance").split(",")
+    if term.strip()
+]
+
+# H1B filter AI stage: concurrent OpenAI checks, kept under the account's
+# requests/tokens-per-minute limits (0 = no client-side limit), with up to
+# H1B_AI_BATCH_SIZE jobs per prompt (1 = one prompt per job)
+H1B_AI_OPTIONS = {
+    "max_workers": int(os.getenv("H1B_AI_MAX_WORKERS", "8")),
+    "requests_per_minute": int(os.getenv("H1B_AI_RPM", "500")),
+    "tokens_per_minute": int(os.getenv("H1B_AI_TPM", "200000")),
+    "batch_size": int(os.getenv("H1B_AI_BATCH_SIZE", "10")),
+    "batch_token_budget": int(os.getenv("H1B_AI_BATCH_TOKENS", "3000")),
+}
+# Reuse AI eligibility verdicts for postings already checked (same title,
+# company and description) until they are this many days old
+H1B_VERDICT_CACHE_ENABLED = os.getenv("H1B_VERDICT_CACHE_ENABLED", "1") == "1"
+H1B_VERDICT_CACHE_TTL_DAYS = float(os.getenv("H1B_VERDICT_CACHE_TTL_DAYS", "30"))
+# Local classifier trained from those verdicts (python -m
+# src.filters.eligibility_model train); jobs it scores below this confidence
+# still go to the AI check
+H1B_LOCAL_MODEL_ENABLED = os.getenv("H1B_LOCAL_MODEL_ENABLED", "1") == "1"
+H1B_LOCAL_MODEL_THRESHOLD = float(os.getenv("H1B_LOCAL_MODEL_THRESHOLD", "0.9"))
 
 # Create output directories
 (OUTPUT_DIR / "reports").mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,121 @@
+"""
+Micro-benchmark for the Indeed result-page parsers.
+
+Parses saved Indeed result pages (the /jobs responses in the Indeed
+cassette, the raw page archive, or a directory of .html files) with every
+installed backend plus the old full-page BeautifulSoup parse, checks that
+all backends extract the same cards, and reports pages/s.
+
+The cassette pages hold nothing but cards; --chrome-kb wraps each one in
+that many KB of synthetic head scripts, navigation and footer, the bulk of
+a live results page and what the html.parser backend skips.
+
+Usage:
+    python -m scripts.bench_indeed_parser --repeat 200
+    python -m scripts.bench_indeed_parser --chrome-kb 300 --repeat 20
+    python -m scripts.bench_indeed_parser --archive data/raw_pages
+    python -m scripts.bench_indeed_parser --pages-dir data/indeed_pages
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.scrapers.html_parsing import SoupCardParser, available_backends, get_card_parser
+from src.scrapers.page_archive import PageArchive
+from src.scrapers.replay import CASSETTE_DIR, load_cassette
+
+
+class FullPageSoupParser(SoupCardParser):
+    """Previous behaviour: build the whole page tree, then search it."""
+
+    name = "bs4 full page"
+    skip_to_cards = False
+
+    def __init__(self):
+        super().__init__()
+        self._strainer = None
+
+
+def load_pages(cassette: Path, pages_dir=None, archive_dir=None) -> list:
+    if archive_dir:
+        archive = PageArchive(archive_dir)
+        pages = [
+            body
+            for entry, body in archive.iter_pages(source="Indeed")
+            if entry.status == 200
+        ]
+        archive.close()
+        return pages
+    if pages_dir:
+        return [p.read_bytes() for p in sorted(Path(pages_dir).glob("*.html"))]
+    interactions = load_cassette(cassette)["interactions"]
+    return [
+        i["response"]["body"].encode("utf-8")
+        for i in interactions
+        if i["request"]["path"].rstrip("/").endswith("/jobs")
+        and i["response"]["status"] == 200
+    ]
+
+
+def add_chrome(page: bytes, kb: int) -> bytes:
+    """Surround the page body with ~``kb`` KB of script and navigation markup."""
+    third = kb * 1024 // 3
+    script = b"<script>" + b"window.data={items:[1,2,3],s:'x'};" * (third // 34) + b"</script>"
+    nav = b'<div class="nav"><ul><li><a href="/n">Link</a></li></ul></div>' * (third // 60)
+    head = b"<html><head>" + script + b"</head><body>" + nav
+    body = page.split(b"<body>", 1)[-1]
+    return head + body.replace(b"</body>", nav + b"</body>")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Indeed HTML parser benchmark")
+    parser.add_argument("--cassette", type=Path, default=CASSETTE_DIR / "indeed.json")
+    parser.add_argument("--pages-dir", type=Path, help="Directory of saved .html pages")
+    parser.add_argument("--archive", type=Path, help="Raw page archive root")
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument(
+        "--chrome-kb", type=int, default=0, help="Synthetic page chrome per page"
+    )
+    args = parser.parse_args()
+
+    pages = load_pages(args.cassette, args.pages_dir, args.archive)
+    if args.chrome_kb:
+        pages = [add_chrome(page, args.chrome_kb) for page in pages]
+    if not pages:
+        print("❌ No result pages found")
+        return
+
+    parsers = [FullPageSoupParser()] + [get_card_parser(b) for b in available_backends()]
+    reference = [parsers[0].parse(page) for page in pages]
+    cards = sum(len(rows) for rows in reference)
+    size_kb = sum(len(page) for page in pages) / 1024
+    print(f"📄 {len(pages)} pages, {cards} cards, {size_kb:.0f} KB, x{args.repeat}")
+
+    results = {}
+    for card_parser in parsers:
+        if [card_parser.parse(page) for page in pages] != reference:
+            print(f"  ⚠️  {card_parser.name} output differs from BeautifulSoup")
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for page in pages:
+                card_parser.parse(page)
+        results[card_parser.name] = time.perf_counter() - start
+
+    print("\n" + "=" * 50)
+    print(" 📊 INDEED PARSER BENCHMARK")
+    print("=" * 50)
+    baseline = results[parsers[0].name]
+    total = len(pages) * args.repeat
+    for name, elapsed in results.items():
+        print(
+            f"{name:<15} {elapsed:7.3f}s  {total / elapsed:8.1f} pages/s  "
+            f"{baseline / elapsed:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
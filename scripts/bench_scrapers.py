@@ -0,0 +1,120 @@
+"""
+Benchmark ScraperManager against the local replay stand-ins.
+
+Runs the same multi-keyword query plan (see ScraperManager.plan_tasks)
+serially and concurrently against the recorded cassettes (tests/cassettes)
+with simulated latency, errors and server-side rate limits, so
+concurrency/throughput changes can be compared without touching the live
+APIs. Both modes must return the same jobs before a speed-up is reported.
+
+Each mode gets its own set of stand-ins. Rate-limit buckets, circuit
+breakers and latency trackers are keyed by host, so fresh ports mean the
+second mode starts with none of the first mode's token debt, open
+breakers or hedging history.
+
+Usage:
+    python -m scripts.bench_scrapers --latency 0.3 --error-rate 0.05 --rps 5
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.filters.job_dedup import job_fingerprint
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.replay import CASSETTE_DIR, ReplayHarness
+from src.scrapers.scraper_manager import ScraperManager
+
+
+def run_once(args, concurrent: bool) -> tuple:
+    """(jobs, seconds, server stats) for one run against fresh stand-ins"""
+    with ReplayHarness(
+        args.cassettes,
+        latency=args.latency,
+        latency_jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rps,
+        seed=args.seed,
+    ) as harness:
+        for server in harness.servers.values():
+            configure_rate_limit(server.host, args.rps, max(1, int(args.rps)))
+        manager = ScraperManager("replay-key", "replay-id", "replay-key")
+        harness.attach_manager(manager)
+        start = time.perf_counter()
+        try:
+            if concurrent:
+                jobs = manager.scrape_keywords(args.keywords, "United States", args.pages)
+            else:
+                jobs = []
+                for query, scraper, max_results in manager.plan_tasks(
+                    args.keywords, args.pages
+                ):
+                    jobs.extend(
+                        scraper.search_jobs(
+                            query, "United States", max_results=max_results
+                        )
+                    )
+            elapsed = time.perf_counter() - start
+        finally:
+            manager.close()
+        stats = {source: server.stats for source, server in harness.servers.items()}
+    return jobs, elapsed, stats
+
+
+def job_set(jobs) -> Counter:
+    return Counter((job["source"], job_fingerprint(job)) for job in jobs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper throughput benchmark")
+    parser.add_argument("--cassettes", type=Path, default=CASSETTE_DIR)
+    parser.add_argument(
+        "--keywords",
+        nargs="+",
+        default=["Data Engineer", "Analytics Engineer", "ML Engineer"],
+    )
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.3)
+    parser.add_argument("--jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--rps", type=float, default=5.0, help="Client and server rate limit per host"
+    )
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    results = {}
+    for mode, concurrent in (("serial", False), ("concurrent", True)):
+        print(f"\n⏱️  Running {mode} scrape...")
+        results[mode] = run_once(args, concurrent)
+
+    print("\n" + "=" * 50)
+    print(" 📊 SCRAPER BENCHMARK")
+    print("=" * 50)
+    for mode, (jobs, elapsed, _) in results.items():
+        print(
+            f"{mode:<12} {len(jobs):>5} jobs  {elapsed:7.2f}s  "
+            f"{len(jobs) / elapsed:7.1f} jobs/s"
+        )
+    for mode, (_, _, stats) in results.items():
+        for source, server_stats in stats.items():
+            print(f"{mode:<12} {source:<12} {server_stats}")
+
+    serial, concurrent = results["serial"], results["concurrent"]
+    missing = job_set(serial[0]) - job_set(concurrent[0])
+    extra = job_set(concurrent[0]) - job_set(serial[0])
+    if missing or extra:
+        print(
+            f"\n❌ Modes returned different jobs ({sum(missing.values())} only "
+            f"serial, {sum(extra.values())} only concurrent), no speed-up reported"
+        )
+        sys.exit(1)
+    print(f"\n🚀 Speed-up: {serial[1] / concurrent[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Compact job record shared by scrapers, filters, matcher and reports.
+
+Jobs used to travel as plain dicts, one per posting, each carrying its own
+copy of every key plus a hash table sized for growth. Job keeps the same
+dict-style API (``job["title"]``, ``job.get(...)``, ``job["match_score"] = x``,
+``"url" in job``) so existing code keeps working, but stores known fields in
+``__slots__``:
+
+- no per-instance ``__dict__``; unknown keys go to a small overflow dict
+- ``source`` and ``company`` strings are interned (a few hundred distinct
+  values shared across tens of thousands of jobs)
+- the description can be materialized lazily from a loader (e.g. a detail
+  page fetched only for jobs that survive the cheap filters)
+
+jobs_to_columns() turns a list of jobs into column lists for pandas or CSV.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional
+
+# Known fields, in report column order. "description" is stored separately
+# so it can be loaded lazily.
+FIELDS = (
+    "id",
+    "title",
+    "company",
+    "location",
+    "description",
+    "url",
+    "source",
+    "posted_at",
+    "posted_at_raw",
+    "search_keyword",
+    "matched_keywords",
+    "sources",
+    "source_urls",
+    "search_keywords",
+    "sponsorship_score",
+    "h1b_eligible",
+    "eligibility_reason",
+    "match_score",
+    "strengths",
+    "gaps",
+    "match_summary",
+    "gap_skills",
+    "gap_use_case",
+    "resume_path",
+)
+_SLOT_FIELDS = tuple(f for f in FIELDS if f != "description")
+_SLOT_SET = frozenset(_SLOT_FIELDS)
+_INTERNED = frozenset(("source", "company"))
+
+
+class Job(MutableMapping):
+    """One job posting; a MutableMapping with slotted storage."""
+
+    __slots__ = _SLOT_FIELDS + ("_description", "_description_loader", "_extra")
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None, **fields):
+        self._description: Optional[str] = None
+        self._description_loader: Optional[Callable[[], str]] = None
+        self._extra: Optional[Dict[str, Any]] = None
+        if data:
+            for key, value in data.items():
+                self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    # --- description -------------------------------------------------
+    @property
+    def description(self) -> str:
+        """
+        Job description, loaded on first access if a loader is set. A failed
+        or empty load keeps the previous text (e.g. the search snippet).
+        """
+        if self._description_loader is not None:
+            loader, self._description_loader = self._description_loader, None
+            try:
+                loaded = loader()
+            except Exception as e:
+                print(f"  ⚠️  Description load failed for {self.get('title')!r}: {e}")
+                loaded = None
+            if loaded:
+                self._description = loaded
+        return self._description if self._description is not None else ""
+
+    @description.setter
+    def description(self, value: Optional[str]):
+        self._description = value
+        self._description_loader = None
+
+    def set_description_loader(self, loader: Callable[[], str]):
+        """Replace the description with ``loader()`` on first access."""
+        self._description_loader = loader
+
+    @property
+    def description_loaded(self) -> bool:
+        return self._description_loader is None
+
+    @property
+    def description_preview(self) -> str:
+        """Current description text without triggering a pending load."""
+        return self._description or ""
+
+    # --- mapping protocol --------------------------------------------
+    def __getitem__(self, key: str) -> Any:
+        if key in _SLOT_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if key == "description":
+            if self._description is None and self._description_loader is None:
+                raise KeyError(key)
+            return self.description
+        if self._extra and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in _SLOT_SET:
+            if key in _INTERNED and isinstance(value, str):
+                value = sys.intern(value)
+            setattr(self, key, value)
+        elif key == "description":
+            self.description = value
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in _SLOT_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif key == "description":
+            if self._description is None and self._description_loader is None:
+                raise KeyError(key)
+            self._description = None
+            self._description_loader = None
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in _SLOT_SET:
+            return hasattr(self, key)
+        if key == "description":
+            return self._description is not None or self._description_loader is not None
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for key in FIELDS:
+            if key in self:
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    # --- conversions -------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy (materializes a lazy description)."""
+        return {key: self[key] for key in self}
+
+    def __reduce__(self):
+        # Loaders (bound to HTTP sessions) are not picklable; materialize
+        return (Job, (self.to_dict(),))
+
+    def __repr__(self) -> str:
+        return (
+            f"Job({self.get('title')!r}, company={self.get('company')!r}, "
+            f"source={self.get('source')!r})"
+        )
+
+
+# Older name used by the CSV-driven daily pipeline
+JobPosting = Job
+
+
+def jobs_to_columns(
+    jobs: Iterable[Mapping[str, Any]], fields: Optional[List[str]] = None
+) -> Dict[str, list]:
+    """
+    Column-oriented view of ``jobs`` ({field: [value per job]}), e.g. for
+    ``pd.DataFrame(jobs_to_columns(jobs))``. By default every field set on
+    any job is included, known fields first in FIELDS order.
+    """
+    jobs = list(jobs)
+    if fields is None:
+        present = set()
+        extra: List[str] = []
+        for job in jobs:
+            for key in job:
+                if key not in present:
+                    present.add(key)
+                    if key not in FIELDS:
+                        extra.append(key)
+        fields = [f for f in FIELDS if f in present] + extra
+    return {field: [job.get(field) for job in jobs] for field in fields}
+
+
+def jobs_from_columns(columns: Mapping[str, list]) -> List[Job]:
+    """Inverse of jobs_to_columns; None values are left unset."""
+    names = list(columns)
+    rows = zip(*(columns[name] for name in names)) if names else ()
+    return [
+        Job({name: value for name, value in zip(names, row) if value is not None})
+        for row in rows
+    ]
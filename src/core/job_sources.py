@@ -3,22 +3,13 @@
 from __future__ import annotations
 
 import csv
-from dataclasses import dataclass
 from pathlib import Path
 from typing import List
 
+from src.core.job import Job, JobPosting  # noqa: F401 (JobPosting: old name)
 
-DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
-@dataclass
-class JobPosting:
-    id: str
-    title: str
-    company: str
-    location: str
-    url: str
-    description: str
-    sponsorship_score: float = 0.0  # will fill later
+DATA_DIR = Path(__file__).resolve().parents[2] / "data"
 
 
 def load_h1b_sponsors() -> List[str]:
@@ -31,29 +22,30 @@ def load_h1b_sponsors() -> List[str]:
     return sponsors
 
 
-def load_jobs_from_csv(path: Path | None = None) -> List[JobPosting]:
-    """Load jobs from a CSV file into JobPosting objects."""
+def load_jobs_from_csv(path: Path | None = None) -> List[Job]:
+    """Load jobs from a CSV file into Job records."""
     if path is None:
         path = DATA_DIR / "jobs_sample.csv"
 
-    jobs: List[JobPosting] = []
+    jobs: List[Job] = []
     with path.open("r", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
             jobs.append(
-                JobPosting(
+                Job(
                     id=str(row.get("id", "")).strip(),
                     title=(row.get("title") or "").strip(),
                     company=(row.get("company") or "").strip(),
                     location=(row.get("location") or "").strip(),
                     url=(row.get("url") or "").strip(),
                     description=(row.get("description") or "").strip(),
+                    sponsorship_score=0.0,  # will fill later
                 )
             )
     return jobs
 
 
-def compute_sponsorship_score(job: JobPosting, sponsor_names: List[str]) -> float:
+def compute_sponsorship_score(job: Job, sponsor_names: List[str]) -> float:
     """
     Simple heuristic:
     - If company name matches or contains any sponsor name -> high score.
@@ -92,7 +84,7 @@ def compute_sponsorship_score(job: JobPosting, sponsor_names: List[str]) -> floa
     return max(0.0, min(1.0, score))
 
 
-def get_candidate_jobs() -> List[JobPosting]:
+def get_candidate_jobs() -> List[Job]:
     """Load jobs and compute sponsorship_score for each."""
     sponsor_names = load_h1b_sponsors()
     jobs = load_jobs_from_csv()
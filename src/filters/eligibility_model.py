@@ -0,0 +1,270 @@
+"""
+Local first-tier H1B eligibility classifier.
+
+Most postings that survive the rule stage are easy calls ("Python, Spark,
+benefits" - eligible; "must be a US citizen to obtain a clearance" - not).
+A small model learned from the AI verdicts already in the VerdictCache
+answers those on the CPU; only postings it is unsure about go to the LLM.
+
+Model: signed hashed word unigrams + bigrams (binary presence) of the
+title and the first 800 description characters - the text the AI prompt
+sees - fed to a class-balanced, L2-regularized logistic regression trained
+with full-batch Adagrad in numpy (no scikit-learn needed). A job is decided locally when the
+predicted probability of either class reaches the confidence threshold.
+
+Usage:
+    python -m src.filters.eligibility_model train --threshold 0.9
+    python -m src.filters.eligibility_model eval
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.filters.job_dedup import normalize_text
+from src.filters.verdict_cache import DESCRIPTION_CHARS, VerdictCache
+from src.scrapers.response_cache import CACHE_DIR
+
+MODEL_PATH = CACHE_DIR / "h1b_eligibility_model.npz"
+# Below this many verdicts (or without both classes) no model is saved
+MIN_TRAINING_VERDICTS = 200
+
+
+def job_features(job: dict, dim: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(indices, values) of the hashed n-gram presence vector of a job."""
+    title = normalize_text(job.get("title")).split()
+    words = normalize_text((job.get("description") or "")[:DESCRIPTION_CHARS]).split()
+    tokens = [f"t:{w}" for w in title]
+    for seq in (title, words):
+        tokens.extend(seq)
+        tokens.extend(f"{a} {b}" for a, b in zip(seq, seq[1:]))
+    counts: dict = {}
+    for token in set(tokens):
+        h = zlib.crc32(token.encode("utf-8"))
+        index = h % dim
+        # Signed hashing: collisions cancel out instead of piling up
+        counts[index] = counts.get(index, 0.0) + (1.0 if h & 0x80000000 else -1.0)
+    indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+    values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+    return indices, values
+
+
+@dataclass
+class Evaluation:
+    """Holdout metrics at one confidence threshold."""
+
+    threshold: float
+    examples: int
+    coverage: float  # share decided locally
+    accuracy: float  # of the local decisions
+    eligible_recall: float  # eligible jobs decided locally and kept
+    excluded_recall: float  # ineligible jobs decided locally and dropped
+
+    def __str__(self):
+        return (
+            f"threshold {self.threshold:.2f}: {self.coverage:6.1%} decided locally, "
+            f"accuracy {self.accuracy:6.1%}, kept {self.eligible_recall:6.1%} of "
+            f"eligible, dropped {self.excluded_recall:6.1%} of ineligible "
+            f"({self.examples} jobs)"
+        )
+
+
+class EligibilityModel:
+    """Hashed n-gram logistic regression; predicts P(eligible)."""
+
+    def __init__(self, dim: int = 2 ** 18, l2: float = 1e-5):
+        self.dim = dim
+        self.l2 = l2
+        self.weights = np.zeros(dim)
+        self.bias = 0.0
+        self.meta: dict = {}
+
+    # --- training ----------------------------------------------------
+    def fit(
+        self,
+        jobs: Sequence[dict],
+        labels: Sequence[bool],
+        iterations: int = 200,
+        lr: float = 0.5,
+    ) -> "EligibilityModel":
+        rows, cols, vals = [], [], []
+        for row, job in enumerate(jobs):
+            indices, values = job_features(job, self.dim)
+            rows.append(np.full(len(indices), row))
+            cols.append(indices)
+            vals.append(values)
+        rows, cols, vals = (np.concatenate(a) for a in (rows, cols, vals))
+        y = np.asarray(labels, dtype=np.float64)
+        n = len(y)
+        # Class-balanced weights so the rarer "ineligible" class still counts
+        positives = y.sum()
+        sample_weight = np.where(
+            y == 1, n / (2 * max(positives, 1)), n / (2 * max(n - positives, 1))
+        ) / n
+
+        self.weights = np.zeros(self.dim)
+        self.bias = 0.0
+        # Adagrad: rare decisive n-grams ("no sponsorship") get large steps
+        grad_sq = np.full(self.dim, 1e-8)
+        bias_sq = 1e-8
+        for _ in range(iterations):
+            z = np.bincount(rows, weights=self.weights[cols] * vals, minlength=n) + self.bias
+            error = (_sigmoid(z) - y) * sample_weight
+            grad = np.bincount(cols, weights=error[rows] * vals, minlength=self.dim)
+            grad += self.l2 * self.weights
+            grad_sq += grad * grad
+            self.weights -= lr * grad / np.sqrt(grad_sq)
+            bias_grad = error.sum()
+            bias_sq += bias_grad * bias_grad
+            self.bias -= lr * bias_grad / np.sqrt(bias_sq)
+        return self
+
+    # --- prediction --------------------------------------------------
+    def predict_proba(self, job: dict) -> float:
+        """Probability that ``job`` is H1B-eligible."""
+        indices, values = job_features(job, self.dim)
+        return float(_sigmoid(self.weights[indices] @ values + self.bias))
+
+    def decide(self, job: dict, threshold: float) -> Optional[Tuple[bool, float]]:
+        """(is_eligible, confidence) when confident enough, else None."""
+        p = self.predict_proba(job)
+        if p >= threshold:
+            return True, p
+        if 1 - p >= threshold:
+            return False, 1 - p
+        return None
+
+    def evaluate(self, jobs: Sequence[dict], labels: Sequence[bool], threshold: float) -> Evaluation:
+        decided = correct = kept = dropped = 0
+        for job, label in zip(jobs, labels):
+            verdict = self.decide(job, threshold)
+            if verdict is None:
+                continue
+            decided += 1
+            correct += verdict[0] == label
+            kept += label and verdict[0]
+            dropped += (not label) and (not verdict[0])
+        eligible = sum(1 for label in labels if label)
+        return Evaluation(
+            threshold=threshold,
+            examples=len(labels),
+            coverage=decided / len(labels) if labels else 0.0,
+            accuracy=correct / decided if decided else 0.0,
+            eligible_recall=kept / eligible if eligible else 0.0,
+            excluded_recall=dropped / (len(labels) - eligible) if len(labels) > eligible else 0.0,
+        )
+
+    # --- persistence -------------------------------------------------
+    def save(self, path: Optional[Path] = None):
+        path = Path(path) if path else MODEL_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            np.savez_compressed(
+                f,
+                weights=self.weights,
+                bias=self.bias,
+                l2=self.l2,
+                meta=json.dumps(self.meta),
+            )
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "EligibilityModel":
+        with np.load(Path(path) if path else MODEL_PATH) as data:
+            model = cls(dim=len(data["weights"]), l2=float(data["l2"]))
+            model.weights = data["weights"]
+            model.bias = float(data["bias"])
+            model.meta = json.loads(str(data["meta"]))
+        return model
+
+
+def _sigmoid(z):
+    return 1.0 / (1.0 + np.exp(-np.clip(z, -30, 30)))
+
+
+def _split(examples: List[Tuple[dict, bool]], holdout: float, seed: int = 13):
+    examples = list(examples)
+    random.Random(seed).shuffle(examples)
+    cut = int(len(examples) * (1 - holdout))
+    return examples[:cut], examples[cut:]
+
+
+def train_from_cache(
+    cache: VerdictCache,
+    prompt_version: str,
+    threshold: float,
+    holdout: float = 0.2,
+) -> Optional[EligibilityModel]:
+    """
+    Fit on the cached AI verdicts of ``prompt_version``: report holdout
+    metrics, then refit on everything. None when there is too little data.
+    """
+    examples = cache.labelled(prompt_version)
+    eligible = sum(1 for _, label in examples if label)
+    print(f"📋 {len(examples)} cached verdicts ({eligible} eligible)")
+    if len(examples) < MIN_TRAINING_VERDICTS or eligible in (0, len(examples)):
+        print(f"⚠️ Need at least {MIN_TRAINING_VERDICTS} verdicts of both classes")
+        return None
+
+    train, test = _split(examples, holdout)
+    model = EligibilityModel().fit(*zip(*train))
+    jobs, labels = zip(*test)
+    print(f"📊 Holdout ({len(test)} jobs):")
+    for t in sorted({0.7, 0.8, 0.9, 0.95, threshold}):
+        marker = "→" if t == threshold else " "
+        print(f"  {marker} {model.evaluate(jobs, labels, t)}")
+
+    model = EligibilityModel().fit(*zip(*examples))
+    model.meta = {
+        "prompt_version": prompt_version,
+        "examples": len(examples),
+        "trained_at": time.time(),
+    }
+    return model
+
+
+def main():
+    from src.filters.h1b_filter import PROMPT_VERSION
+
+    parser = argparse.ArgumentParser(description="Local H1B eligibility model")
+    parser.add_argument("--model", type=Path, default=MODEL_PATH)
+    parser.add_argument("--cache", type=Path, help="Verdict cache (default: .scraper_cache)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    tr = sub.add_parser("train", help="Fit on cached AI verdicts and save")
+    tr.add_argument("--holdout", type=float, default=0.2)
+    # Verdicts newer than the model are mostly jobs it escalated, so this is
+    # a pessimistic check
+    ev = sub.add_parser("eval", help="Score the saved model on verdicts newer than it")
+    for p in (tr, ev):
+        p.add_argument("--threshold", type=float, default=0.9)
+    args = parser.parse_args()
+
+    cache = VerdictCache(args.cache)
+    if args.command == "train":
+        model = train_from_cache(cache, PROMPT_VERSION, args.threshold, args.holdout)
+        if model is not None:
+            model.save(args.model)
+            print(f"💾 Saved to {args.model}")
+    elif not args.model.exists():
+        print(f"❌ No model at {args.model}, run train first")
+    elif args.command == "eval":
+        model = EligibilityModel.load(args.model)
+        examples = cache.labelled(PROMPT_VERSION, since=model.meta.get("trained_at"))
+        if not examples:
+            print("❌ No AI verdicts newer than the model")
+        else:
+            jobs, labels = zip(*examples)
+            print(f"📊 {model.evaluate(jobs, labels, args.threshold)}")
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,84 @@
+import hashlib
+import json
 import re
-from openai import OpenAI
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from openai import OpenAI, RateLimitError
+
+from src.filters.rule_matcher import EXCLUDE, RuleMatcher
+from src.filters.verdict_cache import verdict_key
+from src.scrapers.rate_limiter import TokenBucket
+
+AI_MODEL = "gpt-4o-mini"
+AI_MAX_TOKENS = 150
+# Reply tokens budgeted per job in a batched prompt
+AI_BATCH_REPLY_TOKENS = 60
+
+AI_CRITERIA = """Look for:
+1. Explicit requirements: "Green Card required", "US Citizen only", "No visa sponsorship"
+2. Implicit restrictions: "Must have permanent US work authorization", "No sponsorship available"
+3. Positive signals: "Visa sponsorship available", "H1B welcome", no restrictions mentioned"""
+
+# Bump when the prompt templates change; cached verdicts of other versions
+# are ignored
+AI_PROMPT_REVISION = 1
+PROMPT_VERSION = "{}:{}:{}".format(
+    AI_MODEL,
+    AI_PROMPT_REVISION,
+    hashlib.sha256(AI_CRITERIA.encode("utf-8")).hexdigest()[:8],
+)
+AI_FAILED_REASON = "AI check failed, defaulting to eligible"
+
 
 class H1BFilter:
     """Filters jobs to exclude GC/Citizen-only postings"""
     
-    def __init__(self, openai_api_key):
+    def __init__(
+        self,
+        openai_api_key,
+        max_workers=8,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        max_retries=2,
+        batch_size=1,
+        batch_token_budget=3000,
+        verdict_cache=None,
+        local_model=None,
+        local_threshold=0.9,
+    ):
+        """
+        Args:
+            openai_api_key: OpenAI key for the AI check
+            max_workers: AI checks in flight at once (1 = one at a time)
+            requests_per_minute / tokens_per_minute: client-side limits
+                matching the account's OpenAI tier (None = unlimited)
+            max_retries: retries of an AI check rejected with HTTP 429
+            batch_size: jobs per AI prompt (1 = one prompt per job)
+            batch_token_budget: max estimated prompt tokens per batch
+            verdict_cache: VerdictCache reused across runs (None = no cache)
+            local_model: EligibilityModel answering confident cases before
+                the AI check (None = every job goes to the AI)
+            local_threshold: probability the local model needs to decide
+        """
         self.client = OpenAI(api_key=openai_api_key)
+        self.max_workers = max(1, int(max_workers))
+        self.max_retries = max_retries
+        self.batch_size = max(1, int(batch_size))
+        self.batch_token_budget = batch_token_budget
+        self.verdict_cache = verdict_cache
+        self.local_model = local_model
+        self.local_threshold = local_threshold
+        self._request_limiter = (
+            TokenBucket(requests_per_minute / 60, burst=self.max_workers)
+            if requests_per_minute
+            else None
+        )
+        self._token_limiter = (
+            TokenBucket(tokens_per_minute / 60, burst=tokens_per_minute // 60)
+            if tokens_per_minute
+            else None
+        )
         
         # Common phrases that indicate NO H1B sponsorship
         self.exclude_patterns = [
@@ -24,16 +97,36 @@ class H1BFilter:
             r'security clearance.*required',
             r'active.*clearance'
         ]
-        
+
+        # Phrases that welcome visa holders, unless negated in the same sentence
+        # (see RuleMatcher). They only explain a rule-only pass: the AI still
+        # checks these jobs, since the rest of the posting may exclude them
+        self.positive_patterns = [
+            r'\bh-?1-?b (visa )?(sponsorship|transfer)s? (is |are )?(available|offered|provided|supported)',
+            r'\bh-?1-?b (candidates |holders )?(are )?welcome',
+            r'visa sponsorship (is )?(available|offered|provided)',
+            r'\b(will|can|able to|happy to) sponsor (h-?1-?b|visas?|work visas?)\b',
+        ]
+
+        # All rules compiled once into a single-pass matcher
+        self.rule_matcher = RuleMatcher(self.exclude_patterns, self.positive_patterns)
+
+    def match_rules(self, job):
+        """First exclusion (or else positive signal) rule firing on a job, or None"""
+        combined_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
+        return self.rule_matcher.match(combined_text)
+
     def is_h1b_friendly_rule_based(self, job):
         """Quick rule-based filter using regex patterns"""
-        combined_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
-        
-        for pattern in self.exclude_patterns:
-            if re.search(pattern, combined_text, re.IGNORECASE):
-                return False, f"Excluded: Found pattern '{pattern}'"
-                
-        return True, "No exclusion patterns found"
+        return self._rule_verdict(self.match_rules(job))
+
+    @staticmethod
+    def _rule_verdict(hit):
+        if hit is None:
+            return True, "No exclusion patterns found"
+        if hit.kind == EXCLUDE:
+            return False, f"Excluded: Found pattern '{hit.pattern}'"
+        return True, f"Positive signal: Found pattern '{hit.pattern}'"
         
     def is_h1b_friendly_ai(self, job):
         """
@@ -46,10 +139,7 @@ Job Title: {job.get('title', 'N/A')}
 Company: {job.get('company', 'N/A')}
 Description: {job.get('description', '')[:800]}
 
-Look for:
-1. Explicit requirements: "Green Card required", "US Citizen only", "No visa sponsorship"
-2. Implicit restrictions: "Must have permanent US work authorization", "No sponsorship available"
-3. Positive signals: "Visa sponsorship available", "H1B welcome", no restrictions mentioned
+{AI_CRITERIA}
 
 Answer in this format:
 ELIGIBLE: Yes/No
@@ -58,13 +148,7 @@ REASON: Brief explanation
 Be conservative - if unsure, mark as "Yes" (eligible)."""
         
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=150
-            )
-            
+            response = self._create_completion(prompt, AI_MAX_TOKENS)
             result = response.choices[0].message.content.strip()
             
             # Parse response
@@ -76,8 +160,182 @@ Be conservative - if unsure, mark as "Yes" (eligible)."""
             
         except Exception as e:
             print(f"  ⚠️  AI filter error: {e}")
-            return True, "AI check failed, defaulting to eligible"
+            return True, AI_FAILED_REASON
             
+    def is_h1b_friendly_ai_batch(self, jobs):
+        """
+        Classify several jobs with one prompt (shared instructions, JSON reply)
+        Returns: list of (is_eligible, reason) or None per job, None where the
+        model returned nothing usable for that job
+        """
+        postings = "\n\n".join(
+            f"""### Job {idx}
+Job Title: {job.get('title', 'N/A')}
+Company: {job.get('company', 'N/A')}
+Description: {job.get('description', '')[:800]}"""
+            for idx, job in enumerate(jobs, 1)
+        )
+        prompt = f"""You are an H1B visa eligibility expert. For each job posting below, determine if it excludes H1B visa holders.
+
+{AI_CRITERIA}
+
+Be conservative - if unsure, mark as eligible.
+
+Answer with only a JSON array containing one object per job:
+[{{"id": 1, "eligible": true, "reason": "Brief explanation"}}]
+
+{postings}"""
+
+        try:
+            response = self._create_completion(
+                prompt, AI_BATCH_REPLY_TOKENS * len(jobs) + 50
+            )
+            items = _parse_json_array(response.choices[0].message.content)
+        except Exception as e:
+            print(f"  ⚠️  AI batch filter error: {e}")
+            return [None] * len(jobs)
+
+        results = [None] * len(jobs)
+        for item in items:
+            try:
+                idx = int(item["id"]) - 1
+                eligible = item["eligible"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            if not 0 <= idx < len(jobs):
+                continue
+            if isinstance(eligible, str):
+                eligible = eligible.strip().lower() in ("yes", "true")
+            results[idx] = (bool(eligible), str(item.get("reason") or "").strip())
+        return results
+
+    def _pack_batches(self, jobs):
+        """Consecutive index ranges of jobs, each within batch_size and the token budget"""
+        batches, current, tokens = [], [], 0
+        for idx, job in enumerate(jobs):
+            # ~4 characters per token
+            size = (len(job.get('title') or '') + len(job.get('company') or '')
+                    + min(len(job.get('description') or ''), 800)) // 4 + 20
+            if current and (
+                len(current) >= self.batch_size
+                or tokens + size > self.batch_token_budget
+            ):
+                batches.append(current)
+                current, tokens = [], 0
+            current.append(idx)
+            tokens += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def _create_completion(self, prompt, max_tokens):
+        """Chat completion within the rpm/tpm limits, retrying 429s"""
+        # ~4 characters per token, plus the reply
+        tokens = len(prompt) // 4 + max_tokens
+        for attempt in range(self.max_retries + 1):
+            if self._request_limiter:
+                self._request_limiter.acquire()
+            if self._token_limiter:
+                self._token_limiter.acquire(tokens)
+            try:
+                return self.client.chat.completions.create(
+                    model=AI_MODEL,
+                    messages=[{"role": "user", "content": prompt}],
+                    temperature=0.3,
+                    max_tokens=max_tokens
+                )
+            except RateLimitError:
+                if attempt == self.max_retries:
+                    raise
+                # Every worker backs off, not just this one
+                backoff = 2 ** attempt * 5
+                for limiter in (self._request_limiter, self._token_limiter):
+                    if limiter:
+                        limiter.pause(backoff)
+                if not (self._request_limiter or self._token_limiter):
+                    time.sleep(backoff)
+
+    def check_jobs_ai(self, jobs):
+        """
+        AI verdict for every job: cached verdicts first, then the local model
+        for confident cases, then AI checks for the rest (one per distinct
+        posting), up to max_workers at a time
+        Returns: list of (is_eligible, reason) in the order of jobs
+        """
+        keys = [verdict_key(job, PROMPT_VERSION) for job in jobs]
+        decided = {}
+        if self.verdict_cache is not None:
+            decided = self.verdict_cache.get_many(keys)
+            if decided:
+                print(f"  💾 {sum(k in decided for k in keys)} verdicts from cache")
+
+        # Identical postings (reposts, other keywords) share one check
+        pending = {}
+        for key, job in zip(keys, jobs):
+            if key not in decided:
+                pending.setdefault(key, job)
+
+        if self.local_model is not None and pending:
+            local = {}
+            for key, job in pending.items():
+                verdict = self.local_model.decide(job, self.local_threshold)
+                if verdict is not None:
+                    eligible, confidence = verdict
+                    label = "eligible" if eligible else "not eligible"
+                    local[key] = (eligible, f"Local model: {label} (confidence {confidence:.2f})")
+            if local:
+                print(f"  🧮 {len(local)} decided by the local model, "
+                      f"{len(pending) - len(local)} escalated to AI")
+            decided.update(local)
+            pending = {key: job for key, job in pending.items() if key not in local}
+
+        fresh = dict(zip(pending, self._check_jobs_uncached(list(pending.values()))))
+        # Only AI answers are cached: they are also the local model's labels
+        if self.verdict_cache is not None:
+            self.verdict_cache.put_many(
+                PROMPT_VERSION,
+                [
+                    (key, pending[key], eligible, reason)
+                    for key, (eligible, reason) in fresh.items()
+                    if reason != AI_FAILED_REASON
+                ],
+            )
+        decided.update(fresh)
+        return [decided[key] for key in keys]
+
+    def _check_jobs_uncached(self, jobs):
+        if self.batch_size == 1 or len(jobs) < 2:
+            return self._map(self.is_h1b_friendly_ai, jobs)
+
+        batches = self._pack_batches(jobs)
+        results = [None] * len(jobs)
+        batch_results = self._map(
+            self.is_h1b_friendly_ai_batch,
+            [[jobs[idx] for idx in batch] for batch in batches],
+        )
+        for batch, verdicts in zip(batches, batch_results):
+            for idx, verdict in zip(batch, verdicts):
+                results[idx] = verdict
+
+        # Jobs the model skipped or garbled get their own prompt
+        missing = [idx for idx, verdict in enumerate(results) if verdict is None]
+        if missing:
+            print(f"  🔁 {len(missing)} jobs missing from batch replies, checking singly")
+            singles = self._map(self.is_h1b_friendly_ai, [jobs[idx] for idx in missing])
+            for idx, verdict in zip(missing, singles):
+                results[idx] = verdict
+        return results
+
+    def _map(self, func, items):
+        """func over items on up to max_workers threads, results in order"""
+        if self.max_workers == 1 or len(items) < 2:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)),
+            thread_name_prefix="h1b-ai",
+        ) as pool:
+            return list(pool.map(func, items))
+
     def filter_jobs(self, jobs, use_ai=True):
         """
         Filter jobs and return only H1B-friendly ones
@@ -87,21 +345,37 @@ Be conservative - if unsure, mark as "Yes" (eligible)."""
         
         print(f"\n🔍 Filtering {len(jobs)} jobs for H1B eligibility...")
         
-        for idx, job in enumerate(jobs, 1):
-            print(f"  [{idx}/{len(jobs)}] Checking: {job.get('title', 'N/A')[:50]}...")
-            
-            # First: Quick rule-based filter
-            rule_eligible, rule_reason = self.is_h1b_friendly_rule_based(job)
-            
+        # First: Quick rule-based filter on every job
+        rule_results = []
+        for job in jobs:
+            rule_hit = self.match_rules(job)
+            rule_results.append((rule_hit, *self._rule_verdict(rule_hit)))
+
+        # Second: AI-based deep check (optional, slower but more accurate) for
+        # the rule survivors, run concurrently
+        ai_indexes = [
+            idx
+            for idx, (_, rule_eligible, _) in enumerate(rule_results)
+            if use_ai and rule_eligible
+        ]
+        if ai_indexes:
+            print(f"  🤖 AI check for {len(ai_indexes)} jobs ({self.max_workers} in flight)")
+        ai_results = dict(
+            zip(ai_indexes, self.check_jobs_ai([jobs[idx] for idx in ai_indexes]))
+        )
+
+        for idx, job in enumerate(jobs):
+            print(f"  [{idx + 1}/{len(jobs)}] Checking: {job.get('title', 'N/A')[:50]}...")
+            _, rule_eligible, rule_reason = rule_results[idx]
+
             if not rule_eligible:
                 job['h1b_eligible'] = False
                 job['eligibility_reason'] = rule_reason
                 print(f"    ❌ {rule_reason}")
                 continue  # Skip this job
-                
-            # Second: AI-based deep check (optional, slower but more accurate)
-            if use_ai:
-                ai_eligible, ai_reason = self.is_h1b_friendly_ai(job)
+
+            if idx in ai_results:
+                ai_eligible, ai_reason = ai_results[idx]
                 job['h1b_eligible'] = ai_eligible
                 job['eligibility_reason'] = ai_reason
                 
@@ -118,3 +392,15 @@ Be conservative - if unsure, mark as "Yes" (eligible)."""
                 
         print(f"\n✅ Filtered: {len(filtered)} H1B-eligible jobs out of {len(jobs)}")
         return filtered
+
+
+def _parse_json_array(text):
+    """JSON array from a model reply (tolerates code fences / a wrapping object)"""
+    text = (text or "").strip()
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end < start:
+        raise ValueError("no JSON array in reply")
+    items = json.loads(text[start:end + 1])
+    if not isinstance(items, list):
+        raise ValueError("reply is not a JSON array")
+    return items
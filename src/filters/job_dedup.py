@@ -0,0 +1,253 @@
+"""
+Cross-source job deduplication.
+
+The same posting usually comes back from several boards (and again under
+several keywords). Collapsing those copies before the H1B filter and the
+matcher saves one LLM call per duplicate.
+
+Two jobs are considered the same posting when any of these hold:
+1. Their canonical URLs (tracking params, fragments, www. removed) or
+   source job IDs are equal
+2. Normalized title + company + location are equal
+3. Same normalized company and title with compatible locations (one
+   location's words contain the other's, e.g. "Austin, TX" and "Austin,
+   TX, United States"), or description word-shingle Jaccard similarity
+   above a threshold
+
+A job without a known location only merges through rule 1 or the
+description similarity: "N/A" says nothing about where the job is.
+
+The first copy is kept; later copies only add provenance (sources, URLs,
+search keywords) and may upgrade a snippet to a longer description.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.core.job import Job
+
+
+# Query params that only track the click, never identify the posting
+_TRACKING_PARAMS = {
+    "from", "tk", "advn", "adid", "vjs", "ref", "refid", "trk", "trackingid",
+    "source", "src", "campaign", "gclid", "fbclid",
+}
+_COMPANY_SUFFIXES = {
+    "inc", "llc", "ltd", "corp", "corporation", "co", "company", "plc",
+    "lp", "llp", "gmbh", "group", "holdings", "the",
+}
+_PLACEHOLDERS = {"", "n/a", "na", "none", "null"}
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+SHINGLE_SIZE = 5
+MIN_SHINGLES = 8
+
+
+def canonicalize_url(url: Optional[str]) -> str:
+    """Lower-case host, drop www/fragment/tracking params, sort the query."""
+    if not url or url.strip().lower() in _PLACEHOLDERS:
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=False)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith("utm_")
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", host, path, urlencode(query), ""))
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lower-case, strip punctuation and collapse whitespace."""
+    if not text or text.strip().lower() in _PLACEHOLDERS:
+        return ""
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def normalize_company(company: Optional[str]) -> str:
+    words = normalize_text(company).split()
+    return " ".join(w for w in words if w not in _COMPANY_SUFFIXES)
+
+
+def normalize_location(location: Optional[str]) -> str:
+    # JSearch builds "City, ST" and yields "N/A, " when both are missing
+    parts = (normalize_text(part) for part in (location or "").split(","))
+    return " ".join(part for part in parts if part)
+
+
+def shingle_hashes(text: Optional[str], size: int = SHINGLE_SIZE) -> Set[int]:
+    """Hashes of overlapping word ``size``-grams of the normalized text."""
+    words = normalize_text(text).split()
+    if len(words) < size:
+        return set()
+    return {
+        int.from_bytes(
+            hashlib.blake2b(
+                " ".join(words[i : i + size]).encode("utf-8"), digest_size=8
+            ).digest(),
+            "big",
+        )
+        for i in range(len(words) - size + 1)
+    }
+
+
+def jaccard(a: Set[int], b: Set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def job_fingerprint(job: dict) -> str:
+    """
+    Stable identity of a posting across sources and runs:
+    hash of normalized title + company + location.
+    """
+    raw = "|".join(
+        (
+            normalize_text(job.get("title")),
+            normalize_company(job.get("company")),
+            normalize_location(job.get("location")),
+        )
+    )
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _description(job: dict) -> str:
+    # Never force a lazy (still downloading) description just to dedupe
+    if isinstance(job, Job):
+        return job.description_preview
+    return job.get("description") or ""
+
+
+def _job_keywords(job: dict) -> List[str]:
+    # Merged queries tag every phrase a job matched
+    if job.get("matched_keywords"):
+        return job["matched_keywords"]
+    return [job["search_keyword"]] if job.get("search_keyword") else []
+
+
+def _locations_compatible(a: str, b: str) -> bool:
+    """Same place at different precision; unknown locations never match."""
+    if not a or not b:
+        return False
+    words_a, words_b = set(a.split()), set(b.split())
+    return words_a <= words_b or words_b <= words_a
+
+
+def _source_id(job: dict) -> Optional[tuple]:
+    job_id = str(job.get("id") or "").strip()
+    return (job.get("source"), job_id) if job_id else None
+
+
+class JobDeduplicator:
+    """
+    Incremental deduplicator: feed jobs with add(), read unique ones from
+    ``jobs``. Each kept job gets provenance fields:
+    ``sources``, ``source_urls`` and ``search_keywords``.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.8):
+        self.similarity_threshold = similarity_threshold
+        self.jobs: List[dict] = []
+        self.duplicates = 0
+        self._by_url: Dict[str, int] = {}
+        self._by_id: Dict[tuple, int] = {}
+        self._by_fingerprint: Dict[str, int] = {}
+        self._by_company: Dict[str, List[int]] = {}
+        self._keys: List[tuple] = []  # (title, location, shingles) per kept job
+
+    def _find(self, url: str, source_id: Optional[tuple], fingerprint: str,
+              company: str, title: str, location: str,
+              shingles: Set[int]) -> Optional[int]:
+        if url and url in self._by_url:
+            return self._by_url[url]
+        if source_id and source_id in self._by_id:
+            return self._by_id[source_id]
+        if location and fingerprint in self._by_fingerprint:
+            return self._by_fingerprint[fingerprint]
+        for idx in self._by_company.get(company, ()) if company else ():
+            other_title, other_location, other_shingles = self._keys[idx]
+            if title == other_title and _locations_compatible(location, other_location):
+                return idx
+            if (
+                len(shingles) >= MIN_SHINGLES
+                and len(other_shingles) >= MIN_SHINGLES
+                and jaccard(shingles, other_shingles) >= self.similarity_threshold
+            ):
+                return idx
+        return None
+
+    def add(self, job: dict) -> bool:
+        """Add a job. Returns True if it is new, False if it was merged."""
+        url = canonicalize_url(job.get("url"))
+        source_id = _source_id(job)
+        fingerprint = job_fingerprint(job)
+        company = normalize_company(job.get("company"))
+        title = normalize_text(job.get("title"))
+        location = normalize_location(job.get("location"))
+        shingles = shingle_hashes(_description(job))
+
+        idx = self._find(url, source_id, fingerprint, company, title, location, shingles)
+        if idx is None:
+            idx = len(self.jobs)
+            job["sources"] = [job.get("source")]
+            job["source_urls"] = [job.get("url")]
+            job["search_keywords"] = list(_job_keywords(job))
+            self.jobs.append(job)
+            self._keys.append((title, location, shingles))
+            if company:
+                self._by_company.setdefault(company, []).append(idx)
+            new = True
+        else:
+            self._merge(self.jobs[idx], job)
+            self.duplicates += 1
+            new = False
+
+        if url:
+            self._by_url.setdefault(url, idx)
+        if source_id:
+            self._by_id.setdefault(source_id, idx)
+        if location:
+            self._by_fingerprint.setdefault(fingerprint, idx)
+        return new
+
+    def _merge(self, kept: dict, dup: dict):
+        if dup.get("source") not in kept["sources"]:
+            kept["sources"].append(dup.get("source"))
+        if dup.get("url") not in kept["source_urls"]:
+            kept["source_urls"].append(dup.get("url"))
+        for keyword in _job_keywords(dup):
+            if keyword not in kept["search_keywords"]:
+                kept["search_keywords"].append(keyword)
+        # Prefer the fuller description (e.g. API text over an Indeed snippet),
+        # unless the kept copy is still loading its full text
+        if (
+            getattr(kept, "description_loaded", True)
+            and len(_description(dup)) > len(_description(kept))
+        ):
+            kept["description"] = _description(dup)
+        if not kept.get("posted_at") and dup.get("posted_at"):
+            kept["posted_at"] = dup["posted_at"]
+            kept["posted_at_raw"] = dup.get("posted_at_raw", "")
+
+
+def dedupe_jobs(jobs: Iterable[dict], similarity_threshold: float = 0.8) -> List[dict]:
+    """Collapse duplicate postings, keeping first-seen order."""
+    dedup = JobDeduplicator(similarity_threshold)
+    for job in jobs:
+        dedup.add(job)
+    print(
+        f"🧹 Deduplicated {len(dedup.jobs) + dedup.duplicates} jobs → "
+        f"{len(dedup.jobs)} unique ({dedup.duplicates} duplicates)"
+    )
+    return dedup.jobs
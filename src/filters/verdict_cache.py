@@ -0,0 +1,143 @@
+"""
+Persistent cache of H1B eligibility verdicts.
+
+The same posting comes back every day it stays open, and again from other
+boards and keywords; without a cache each copy costs another OpenAI call.
+Verdicts are keyed by a hash of what the AI check actually reads - the
+normalized title, company and first 800 description characters - plus the
+prompt version, so editing the prompt or switching models invalidates every
+old verdict instead of mixing answers from different prompts. Entries
+expire after ``ttl_days`` (postings do get edited). The posting text is
+stored next to each verdict so the verdicts can later serve as labelled data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.filters.job_dedup import normalize_company, normalize_text
+from src.scrapers.response_cache import CACHE_DIR
+
+# Description characters the AI prompt includes
+DESCRIPTION_CHARS = 800
+
+
+def verdict_key(job: dict, prompt_version: str) -> str:
+    """Content hash of the parts of ``job`` the eligibility prompt sees."""
+    text = "\x1f".join(
+        (
+            prompt_version,
+            normalize_text(job.get("title")),
+            normalize_company(job.get("company")),
+            normalize_text((job.get("description") or "")[:DESCRIPTION_CHARS]),
+        )
+    )
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class VerdictCache:
+    """SQLite store of (is_eligible, reason) per verdict_key (thread-safe)."""
+
+    def __init__(self, path: Optional[Path] = None, ttl_days: float = 30):
+        self.path = Path(path) if path else CACHE_DIR / "h1b_verdicts.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_days * 86400
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                prompt_version TEXT,
+                eligible INTEGER,
+                reason TEXT,
+                title TEXT,
+                company TEXT,
+                description TEXT,
+                created_at REAL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Tuple[bool, str]]:
+        """Fresh verdicts for whichever of ``keys`` are cached."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Tuple[bool, str]] = {}
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                rows = self._conn.execute(
+                    "SELECT key, eligible, reason FROM verdicts "
+                    f"WHERE created_at >= ? AND key IN ({','.join('?' * len(chunk))})",
+                    (cutoff, *chunk),
+                ).fetchall()
+                found.update((key, (bool(eligible), reason)) for key, eligible, reason in rows)
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, prompt_version: str, entries: Iterable[Tuple[str, dict, bool, str]]):
+        """Store (key, job, is_eligible, reason) verdicts."""
+        now = time.time()
+        rows = [
+            (
+                key,
+                prompt_version,
+                int(eligible),
+                reason,
+                job.get("title"),
+                job.get("company"),
+                (job.get("description") or "")[:DESCRIPTION_CHARS],
+                now,
+            )
+            for key, job, eligible, reason in entries
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO verdicts (key, prompt_version, eligible, "
+                "reason, title, company, description, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def labelled(
+        self, prompt_version: str, since: Optional[float] = None
+    ) -> List[Tuple[dict, bool]]:
+        """(job, is_eligible) for fresh verdicts of ``prompt_version``."""
+        cutoff = max(time.time() - self.ttl, since or 0)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT title, company, description, eligible FROM verdicts "
+                "WHERE prompt_version = ? AND created_at >= ? ORDER BY created_at",
+                (prompt_version, cutoff),
+            ).fetchall()
+        return [
+            ({"title": title, "company": company, "description": description}, bool(eligible))
+            for title, company, description, eligible in rows
+        ]
+
+    def purge(self, prompt_version: str):
+        """Delete expired verdicts and those from other prompt versions."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM verdicts WHERE created_at < ? OR prompt_version != ?",
+                (time.time() - self.ttl, prompt_version),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -4,7 +4,8 @@ from pathlib import Path
 import csv
 from typing import List, Dict, Any
 
-from src.core.job_sources import get_candidate_jobs, JobPosting
+from src.core.job import Job
+from src.core.job_sources import get_candidate_jobs
 from src.crews.job_match_crew import evaluate_job
 from src.crews.resume_builder_crew import generate_tailored_resume
 from src.crews.gap_analyzer_crew import analyze_gaps_for_learning
@@ -22,7 +23,7 @@ def run_daily_job_pipeline(
     Load candidate jobs, score them, filter by sponsorship + match score,
     optionally generate tailored resumes and gap plans, and write a CSV report.
     """
-    jobs: List[JobPosting] = get_candidate_jobs()
+    jobs: List[Job] = get_candidate_jobs()
 
     report_rows: List[Dict[str, Any]] = []
 
@@ -25,6 +25,26 @@ from config.settings import (  # Updated from config.h1b_settings
     JOB_KEYWORDS,
     JOB_LOCATION,
     NUM_PAGES,
+    SCRAPE_MAX_WORKERS,
+    SCRAPE_DEADLINE_SECONDS,
+    ADAPTIVE_PAGING,
+    ADAPTIVE_PAGING_MIN_YIELD,
+    SCRAPER_SESSION_OPTIONS,
+    SCRAPER_CACHE_ENABLED,
+    SCRAPER_CACHE_MAX_MB,
+    SCRAPER_ARCHIVE_ENABLED,
+    SCRAPER_ARCHIVE_KEEP_DAYS,
+    INCREMENTAL_SCRAPING,
+    QUOTA_TRACKING_ENABLED,
+    SCRAPE_EXCLUDE_TERMS,
+    INDEED_DETAIL_OPTIONS,
+    H1B_AI_OPTIONS,
+    H1B_VERDICT_CACHE_ENABLED,
+    H1B_VERDICT_CACHE_TTL_DAYS,
+    H1B_LOCAL_MODEL_ENABLED,
+    H1B_LOCAL_MODEL_THRESHOLD,
+    SCRAPER_CREDENTIALS,
+    SCRAPER_PLUGINS,
     JOBS_H1B_LIVE_CSV,
     H1B_REPORT_CSV,
     EMAIL_USER,
@@ -35,7 +55,16 @@ from config.settings import (  # Updated from config.h1b_settings
 )
 
 from src.scrapers.scraper_manager import ScraperManager
-from src.filters.h1b_filter import H1BFilter
+from src.scrapers.response_cache import ResponseCache
+from src.scrapers.page_archive import PageArchive
+from src.scrapers.seen_store import SeenJobsStore
+from src.scrapers.quota import QuotaLedger
+from src.scrapers.yield_controller import YieldController
+from src.filters.h1b_filter import PROMPT_VERSION, H1BFilter
+from src.filters.verdict_cache import VerdictCache
+from src.filters.eligibility_model import MODEL_PATH, EligibilityModel
+from src.filters.job_dedup import JobDeduplicator, dedupe_jobs
+from src.core.job import jobs_to_columns
 from src.rag.profile_rag import build_or_refresh_profile_index  # RAG support
 from src.crews.job_match_crew import evaluate_job  # Job matching
 from src.crews.resume_builder_crew import generate_tailored_resume  # Tailored resumes
@@ -54,6 +83,130 @@ def _resolve_date_filter(label: str):
     return None
 
 
+def _cancel_requested() -> bool:
+    """True when the Streamlit cancel button was pressed for this run."""
+    try:
+        import streamlit as st
+
+        return bool(getattr(st.session_state, "cancel_run", False))
+    except Exception:
+        return False
+
+
+def _match_job_with_gaps(job: dict, match_threshold: float) -> bool:
+    """
+    Score a job against the resume and attach strengths, gaps and the
+    per-job gap use-case text. Returns True if it clears the threshold.
+    """
+    try:
+        match_result = evaluate_job(job["description"])
+        match_score = match_result.get("match_score", 0)
+
+        job["match_score"] = match_score
+        job["strengths"] = match_result.get("strengths", [])
+        job["gaps"] = match_result.get("gaps", [])
+
+        # NEW: flatten gaps and generate per-job use-case text
+        job["gap_skills"] = "; ".join(job["gaps"])
+        try:
+            use_case_text = analyze_gaps_for_learning(
+                job["description"], match_result
+            )
+        except Exception:
+            use_case_text = ""
+        job["gap_use_case"] = use_case_text
+
+        return match_score >= match_threshold
+    except Exception:
+        job["match_score"] = 0
+        return False
+
+
+def _build_response_cache():
+    """Shared on-disk page cache for scrapers, or None when disabled."""
+    if not SCRAPER_CACHE_ENABLED:
+        return None
+    try:
+        return ResponseCache(max_bytes=SCRAPER_CACHE_MAX_MB * 1024 * 1024)
+    except Exception as e:
+        print(f"⚠️ Response cache unavailable: {e}")
+        return None
+
+
+def _build_page_archive():
+    """Raw results-page archive (old partitions pruned), or None when disabled."""
+    if not SCRAPER_ARCHIVE_ENABLED:
+        return None
+    try:
+        archive = PageArchive()
+        archive.prune(SCRAPER_ARCHIVE_KEEP_DAYS)
+        return archive
+    except Exception as e:
+        print(f"⚠️ Page archive unavailable: {e}")
+        return None
+
+
+def _build_verdict_cache():
+    """Persistent H1B verdict cache (stale entries purged), or None when disabled."""
+    if not H1B_VERDICT_CACHE_ENABLED:
+        return None
+    try:
+        cache = VerdictCache(ttl_days=H1B_VERDICT_CACHE_TTL_DAYS)
+        cache.purge(PROMPT_VERSION)
+        return cache
+    except Exception as e:
+        print(f"⚠️ Verdict cache unavailable: {e}")
+        return None
+
+
+def _build_local_model():
+    """Trained local eligibility model for the current prompt, or None."""
+    if not H1B_LOCAL_MODEL_ENABLED or not MODEL_PATH.exists():
+        return None
+    try:
+        model = EligibilityModel.load()
+    except Exception as e:
+        print(f"⚠️ Local eligibility model unavailable: {e}")
+        return None
+    if model.meta.get("prompt_version") != PROMPT_VERSION:
+        print("⚠️ Local eligibility model was trained on another prompt version, retrain it")
+        return None
+    return model
+
+
+def _build_h1b_filter(openai_api_key):
+    """H1BFilter with the AI options, verdict cache and local model."""
+    return H1BFilter(
+        openai_api_key,
+        verdict_cache=_build_verdict_cache(),
+        local_model=_build_local_model(),
+        local_threshold=H1B_LOCAL_MODEL_THRESHOLD,
+        **H1B_AI_OPTIONS,
+    )
+
+
+def _build_yield_controller():
+    """Marginal-yield page depth controller, or None when disabled."""
+    if not ADAPTIVE_PAGING:
+        return None
+    try:
+        return YieldController(min_yield=ADAPTIVE_PAGING_MIN_YIELD)
+    except Exception as e:
+        print(f"⚠️ Adaptive paging unavailable: {e}")
+        return None
+
+
+def _record_yield(controller, raw_jobs, h1b_jobs, matched_jobs):
+    """Feed this run's pass/match outcomes back into the page controller."""
+    if controller is None:
+        return
+    try:
+        controller.record_outcomes(raw_jobs, h1b_jobs, matched_jobs)
+    except Exception as e:
+        print(f"⚠️ Could not record yield stats: {e}")
+    controller.close()
+
+
 def run_h1b_job_finder(generate_resumes: bool = False, match_threshold: float = 0.65):
     """
     Main function: Scrape jobs, filter for H1B, match against resume, generate reports.
@@ -86,28 +239,50 @@ def run_h1b_job_finder(generate_resumes: bool = False, match_threshold: float =
         rapidapi_key=RAPIDAPI_KEY,
         adzuna_app_id=ADZUNA_APP_ID,
         adzuna_app_key=ADZUNA_APP_KEY,
+        max_workers=SCRAPE_MAX_WORKERS,
+        session_options=SCRAPER_SESSION_OPTIONS,
+        cache=_build_response_cache(),
+        quota_ledger=QuotaLedger() if QUOTA_TRACKING_ENABLED else None,
+        exclude_terms=SCRAPE_EXCLUDE_TERMS,
+        source_options={"indeed": INDEED_DETAIL_OPTIONS},
+        credentials=SCRAPER_CREDENTIALS,
+        plugins=SCRAPER_PLUGINS,
+        archive=_build_page_archive(),
+        yield_controller=_build_yield_controller(),
     )
 
+    # Daily runs are incremental: only postings we have not seen before
+    seen_store = SeenJobsStore() if INCREMENTAL_SCRAPING else None
 
-    # For CLI we keep a single keyword string and no date filter
-    raw_jobs = scraper.scrape_all(
-        JOB_KEYWORDS,
+    # For CLI: every configured keyword, no date filter
+    raw_jobs = scraper.scrape_keywords(
+        list(JOB_KEYWORDS),
         JOB_LOCATION,
         NUM_PAGES,
         posted_after=None,
+        seen_store=seen_store,
     )
+    scraped_jobs = raw_jobs
+
+    # Collapse cross-source / cross-keyword duplicates before any LLM calls
+    raw_jobs = dedupe_jobs(raw_jobs)
 
     print(f"✅ Found {len(raw_jobs)} total jobs")
 
     if not raw_jobs:
         print("❌ No jobs found. Check your scraper configuration.")
+        scraper.close()
+        if seen_store:
+            seen_store.close()
         return
 
     # Step 2: Filter for H1B eligibility
     print(f"\n[2/5] Filtering for H1B-friendly jobs...")
 
-    h1b_filter = H1BFilter(OPENAI_API_KEY)
+    h1b_filter = _build_h1b_filter(OPENAI_API_KEY)
     h1b_jobs = h1b_filter.filter_jobs(raw_jobs, use_ai=True)
+    # Background Indeed detail fetches are consumed by the filter above
+    scraper.close()
 
     print(f"✅ Found {len(h1b_jobs)} H1B-eligible jobs")
 
@@ -142,6 +317,7 @@ def run_h1b_job_finder(generate_resumes: bool = False, match_threshold: float =
             h1b_jobs.append(job)
 
     print(f"✅ Found {len(matched_jobs)} good matches (>= {match_threshold})")
+    _record_yield(scraper.yield_controller, raw_jobs, h1b_jobs, matched_jobs)
 
     # STEP 4: Generate tailored resumes (OPTIONAL)
     if generate_resumes and matched_jobs:
@@ -185,7 +361,7 @@ def run_h1b_job_finder(generate_resumes: bool = False, match_threshold: float =
     print(f"\n[5/5] Saving results...")
 
     if matched_jobs:
-        df = pd.DataFrame(matched_jobs)
+        df = pd.DataFrame(jobs_to_columns(matched_jobs))
         df["search_date"] = datetime.now().strftime("%Y-%m-%d %H:%M")
 
         # Save full data with match scores
@@ -209,6 +385,12 @@ def run_h1b_job_finder(generate_resumes: bool = False, match_threshold: float =
         report_df.to_csv(H1B_REPORT_CSV, index=False)
         print(f"✅ Report saved to: {H1B_REPORT_CSV}")
 
+    # Only now are this run's postings "seen": a run that failed before
+    # this point scrapes them again next time
+    if seen_store:
+        seen_store.commit(scraped_jobs)
+        seen_store.close()
+
     # Step 6: Send email (optional)
     if EMAIL_USER and EMAIL_PASSWORD and REPORT_RECIPIENT:
         print(f"\nSending email report to {REPORT_RECIPIENT}...")
@@ -250,6 +432,7 @@ def run_h1b_job_finder_streamlit(
     match_threshold: float = 0.65,
     date_filter: str = "Last 24 hours",
     sources: dict | None = None,
+    on_match=None,
 ):
     """
     Streamlit-compatible version - returns results dict instead of printing.
@@ -261,6 +444,10 @@ def run_h1b_job_finder_streamlit(
         num_pages: Number of pages to scrape per keyword.
         use_ai: Use AI filtering for H1B eligibility.
         match_threshold: Minimum match score.
+        sources: {source key: enabled} from the UI checkboxes (see
+            src/scrapers/registry.py); None uses each source's default.
+        on_match: Optional callback called with the matched jobs so far each
+            time a new match is found (results stream in while scraping).
 
     Returns:
         dict: {
@@ -268,6 +455,7 @@ def run_h1b_job_finder_streamlit(
             'h1b_jobs': list[dict],
             'matched_jobs': list[dict],
             'exclusion_rate': float,
+            'scrape_report': {source: completeness counts},
         }
     """
     from config.settings import (
@@ -275,11 +463,10 @@ def run_h1b_job_finder_streamlit(
         RAPIDAPI_KEY as UI_RAPID_KEY,
         ADZUNA_APP_ID,
         ADZUNA_APP_KEY,
+        SCRAPE_MAX_WORKERS,
+        SCRAPER_SESSION_OPTIONS,
     )
 
-    if sources is None:
-       sources = {"jsearch": True, "adzuna": True, "indeed": True}
-
     # Build RAG index (best-effort)
     try:
         build_or_refresh_profile_index()
@@ -288,27 +475,73 @@ def run_h1b_job_finder_streamlit(
 
     posted_after = _resolve_date_filter(date_filter)
 
-    # Step 1: Scrape jobs (supports multiple comma-separated keywords)
+    # Step 1: Scrape jobs (supports multiple comma-separated keywords,
+    # fanned out concurrently across keywords and sources)
     scraper = ScraperManager(
         rapidapi_key=UI_RAPID_KEY,
         adzuna_app_id=ADZUNA_APP_ID,
         adzuna_app_key=ADZUNA_APP_KEY,
+        max_workers=SCRAPE_MAX_WORKERS,
+        session_options=SCRAPER_SESSION_OPTIONS,
+        cache=_build_response_cache(),
+        quota_ledger=QuotaLedger() if QUOTA_TRACKING_ENABLED else None,
+        exclude_terms=SCRAPE_EXCLUDE_TERMS,
+        source_options={"indeed": INDEED_DETAIL_OPTIONS},
+        credentials=SCRAPER_CREDENTIALS,
+        plugins=SCRAPER_PLUGINS,
+        archive=_build_page_archive(),
+        yield_controller=_build_yield_controller(),
     )
     keyword_list = [k.strip() for k in (keywords or "").split(",") if k.strip()]
 
-    raw_jobs: list[dict] = []
-    for kw in keyword_list or [""]:
-        raw_jobs.extend(
-            scraper.scrape_all(
-                kw,
-                location,
-                num_pages,
-                posted_after=posted_after,
-                use_jsearch=sources.get("jsearch", True),
-                use_indeed=sources.get("indeed", True),
-                use_adzuna=sources.get("adzuna", True),
-            )
-        )
+    h1b_filter = _build_h1b_filter(UI_OPENAI_KEY)
+    # Same posting from several boards / keywords -> one job, one LLM call
+    dedup = JobDeduplicator()
+    h1b_jobs: list[dict] = []
+    matched_jobs: list[dict] = []
+
+    # Pages stream in as each source parses them: dedupe, filter (Step 2)
+    # and match (Step 3) every page right away instead of waiting for the
+    # slowest source to finish.
+    pages = scraper.iter_scrape(
+        keyword_list or [""],
+        location,
+        num_pages,
+        posted_after=posted_after,
+        sources=[key for key, on in sources.items() if on] if sources else None,
+        deadline=SCRAPE_DEADLINE_SECONDS or None,
+    )
+    try:
+        for page_jobs in pages:
+            if _cancel_requested():
+                break
+
+            new_jobs = [job for job in page_jobs if dedup.add(job)]
+            if not new_jobs:
+                continue
+
+            page_h1b_jobs = h1b_filter.filter_jobs(new_jobs, use_ai=use_ai)
+            h1b_jobs.extend(page_h1b_jobs)
+
+            for job in page_h1b_jobs:
+                # Allow Streamlit cancel button to stop further processing
+                if _cancel_requested():
+                    break
+                if _match_job_with_gaps(job, match_threshold):
+                    matched_jobs.append(job)
+                    if on_match:
+                        on_match(matched_jobs)
+    finally:
+        pages.close()
+        scraper.close()
+
+    raw_jobs = dedup.jobs
+    print(f"🧹 Deduplicated: {len(raw_jobs)} unique jobs ({dedup.duplicates} duplicates)")
+    # Only complete runs say how good each query's later pages are
+    if _cancel_requested():
+        _record_yield(scraper.yield_controller, [], [], [])
+    else:
+        _record_yield(scraper.yield_controller, raw_jobs, h1b_jobs, matched_jobs)
 
     if not raw_jobs:
         return {
@@ -316,47 +549,9 @@ def run_h1b_job_finder_streamlit(
             "h1b_jobs": [],
             "matched_jobs": [],
             "exclusion_rate": 0.0,
+            "scrape_report": scraper.last_report,
         }
 
-    # Step 2: Filter for H1B eligibility
-    h1b_filter = H1BFilter(UI_OPENAI_KEY)
-    h1b_jobs = h1b_filter.filter_jobs(raw_jobs, use_ai=use_ai)
-
-    # Step 3: Job matching
-    matched_jobs: list[dict] = []
-    for job in h1b_jobs:
-        # Allow Streamlit cancel button to stop further processing
-        try:
-            import streamlit as st
-
-            if getattr(st.session_state, "cancel_run", False):
-                break
-        except Exception:
-            pass
-
-        try:
-            match_result = evaluate_job(job["description"])
-            match_score = match_result.get("match_score", 0)
-
-            job["match_score"] = match_score
-            job["strengths"] = match_result.get("strengths", [])
-            job["gaps"] = match_result.get("gaps", [])
-
-            # NEW: flatten gaps and generate per-job use-case text
-            job["gap_skills"] = "; ".join(job["gaps"])
-            try:
-                use_case_text = analyze_gaps_for_learning(
-                    job["description"], match_result
-                )
-            except Exception:
-                use_case_text = ""
-            job["gap_use_case"] = use_case_text
-
-            if match_score >= match_threshold:
-                matched_jobs.append(job)
-        except Exception:
-            job["match_score"] = 0
-
     exclusion_rate = (
         (len(raw_jobs) - len(h1b_jobs)) / len(raw_jobs) * 100 if raw_jobs else 0.0
     )
@@ -366,6 +561,7 @@ def run_h1b_job_finder_streamlit(
         "h1b_jobs": h1b_jobs,
         "matched_jobs": matched_jobs,
         "exclusion_rate": exclusion_rate,
+        "scrape_report": scraper.last_report,
     }
 
 
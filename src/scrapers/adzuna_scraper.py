@@ -1,100 +1,134 @@
-import requests
+import json
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 
+from src.core.job import Job
 from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.query_planner import SearchQuery
+from src.scrapers.registry import register_scraper
 from src.utils.date_parsing import parse_any_posted_date
-from src.utils.job_filters import filter_by_date
 
 
+@register_scraper("adzuna", label="Adzuna", auth=("adzuna_app_id", "adzuna_app_key"))
 class AdzunaScraper(BaseScraper):
     """
     Adzuna Job Search API - FREE tier.
     Sign up: https://developer.adzuna.com/
     """
 
-    def __init__(self, app_id: str, app_key: str):
-        super().__init__()
+    name = "Adzuna"
+    requests_per_second = 1.0
+    burst = 2
+    cache_ttl = 3600
+    max_in_flight = 2
+
+    # results_per_page accepts up to 50
+    page_size = 20
+    max_page_size = 50
+    exact_page_size = True
+    sorts_by_date = True
+    # what + what_or can only express "<head word> AND any of <words>"
+    max_keywords_per_query = 5
+    merge_by_head_word = True
+
+    def __init__(self, app_id: str, app_key: str, **session_options):
+        super().__init__(**session_options)
         self.app_id = app_id
         self.app_key = app_key
         self.base_url = "https://api.adzuna.com/v1/api/jobs/us/search"
 
-    def search_jobs(
+    @property
+    def quota_key(self) -> Optional[str]:
+        return self.app_id
+
+    def is_configured(self) -> bool:
+        return bool(self.app_id and self.app_key)
+
+    def keyword_params(self, query: SearchQuery) -> dict:
+        """
+        One phrase → ``what``; phrases sharing a head word →
+        ``what=<head>`` + ``what_or=<remaining words>``.
+        """
+        params = {}
+        if query.merged:
+            head = query.keywords[0].split()[-1]
+            modifiers = []
+            for kw in query.keywords:
+                for word in kw.split()[:-1]:
+                    if word.lower() not in (m.lower() for m in modifiers):
+                        modifiers.append(word)
+            params["what"] = head
+            if modifiers:
+                params["what_or"] = " ".join(modifiers)
+        else:
+            params["what"] = query.keywords[0]
+        if query.exclude:
+            params["what_exclude"] = " ".join(query.exclude)
+        return params
+
+    def date_params(self, posted_after: Optional[datetime]) -> dict:
+        """Adzuna takes an exact day count; sort newest-first for early stop"""
+        if not posted_after:
+            return {}
+        return {"max_days_old": self.days_since(posted_after), "sort_by": "date"}
+
+    def fetch_page(
         self,
-        keywords: str,
+        keywords: Union[str, SearchQuery],
         location: str,
-        num_pages: int = 3,
+        page: int,
         posted_after: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        span: int = 1,
     ) -> List[dict]:
         """
-        Search jobs using Adzuna API.
-
-        Returns a list of dicts with keys:
-        - title, company, location, description, url, source
-        - posted_at (naive UTC datetime or None)
-        - posted_at_raw (original string from API)
+        Fetch one page of Adzuna results.
         """
         jobs: List[dict] = []
 
-        if not self.app_id or not self.app_key:
-            print("  ⚠️  Adzuna API credentials not provided")
+        url = f"{self.base_url}/{page}"
+        params = {
+            "app_id": self.app_id,
+            "app_key": self.app_key,
+            **self.keyword_params(SearchQuery.of(keywords)),
+            "where": location,
+            "results_per_page": page_size or self.page_size,
+            "content-type": "application/json",
+            **self.date_params(posted_after),
+        }
+
+        response = self._get(url, params=params)
+
+        if response.status_code != 200:
+            print(f"  ⚠️  Adzuna returned status {response.status_code}")
+            print(f"  Response: {response.text[:200]}")
             return jobs
 
-        results_per_page = 20
-
-        for page in range(1, num_pages + 1):
-            try:
-                print(f"  📡 Fetching Adzuna page {page}...")
-
-                url = f"{self.base_url}/{page}"
-                params = {
-                    "app_id": self.app_id,
-                    "app_key": self.app_key,
-                    "what": keywords,
-                    "where": location,
-                    "results_per_page": results_per_page,
-                    "content-type": "application/json",
-                }
-
-                response = requests.get(url, params=params, timeout=10)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get("results", [])
-
-                    print(f"  ✅ Found {len(results)} jobs on page {page}")
-
-                    for job in results:
-                        # Adzuna usually returns ISO date/time in "created"
-                        raw_date = job.get("created") or ""
-                        posted_at = parse_any_posted_date(raw_date)
-
-                        jobs.append(
-                            {
-                                "title": job.get("title", "N/A"),
-                                "company": job.get("company", {}).get(
-                                    "display_name", "N/A"
-                                ),
-                                "location": job.get("location", {}).get(
-                                    "display_name", "N/A"
-                                ),
-                                "description": job.get("description", ""),
-                                "url": job.get("redirect_url", "N/A"),
-                                "source": "Adzuna",
-                                "posted_at": posted_at,
-                                "posted_at_raw": raw_date,
-                            }
-                        )
-                else:
-                    print(f"  ⚠️  Adzuna returned status {response.status_code}")
-                    print(f"  Response: {response.text[:200]}")
-
-                self.delay(1, 2)
-
-            except Exception as e:
-                print(f"  ❌ Error fetching Adzuna page {page}: {e}")
-                continue
-
-        # Apply shared date filter
-        jobs = filter_by_date(jobs, posted_after)
+        self.archive_page(response, keywords, location, page)
+        return self.parse_page(response.content, page)
+
+    def parse_page(self, content: bytes, page: int) -> List[dict]:
+        jobs: List[dict] = []
+        results = json.loads(content).get("results", [])
+
+        print(f"  ✅ Found {len(results)} jobs on page {page}")
+
+        for job in results:
+            # Adzuna usually returns ISO date/time in "created"
+            raw_date = job.get("created") or ""
+            posted_at = parse_any_posted_date(raw_date)
+
+            jobs.append(
+                Job(
+                    title=job.get("title", "N/A"),
+                    company=job.get("company", {}).get("display_name", "N/A"),
+                    location=job.get("location", {}).get("display_name", "N/A"),
+                    description=job.get("description", ""),
+                    url=job.get("redirect_url", "N/A"),
+                    source="Adzuna",
+                    posted_at=posted_at,
+                    posted_at_raw=raw_date,
+                )
+            )
+
         return jobs
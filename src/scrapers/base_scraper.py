@@ -1,14 +1,105 @@
+import math
 import time
 import random
+import threading
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional, List, Sequence, Union
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.scrapers.hedging import get_latency_tracker, hedged_call
+from src.scrapers.page_archive import PageArchive
+from src.scrapers.query_planner import SearchQuery
+from src.scrapers.quota import QuotaExceeded, QuotaLedger
+from src.scrapers.rate_limiter import get_rate_limiter, parse_retry_after
+from src.scrapers.resilience import (
+    TRANSIENT_STATUSES,
+    CircuitOpenError,
+    RetryPolicy,
+    ScrapeStopped,
+    get_circuit_breaker,
+)
+from src.scrapers.response_cache import ResponseCache
+from src.scrapers.seen_store import SeenJobsStore
+from src.scrapers.yield_controller import YieldController
+from src.utils.job_filters import filter_by_date
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """
+    One planned API call: ``span`` consecutive pages of ``page_size``
+    results, starting at 1-based ``page`` (counted in ``page_size`` units).
+    """
+
+    page: int
+    page_size: int
+    span: int = 1
+
+    @property
+    def results(self) -> int:
+        return self.page_size * self.span
 
 
 class BaseScraper(ABC):
     """Base class for all job scrapers"""
 
-    def __init__(self):
+    # Display name used in logs and as the job "source" field
+    name = "Base"
+    # Token bucket for this source's host: sustained requests/second + burst
+    requests_per_second = 0.5
+    burst = 1
+    # Pause applied to the host when a 429/503 carries no Retry-After
+    default_backoff = 30.0
+    # Max pages of this source in flight at once (across keywords/threads)
+    max_in_flight = 1
+    # Read timeout in seconds
+    timeout = 10
+    # Retries for transient errors, and the per-host circuit breaker settings
+    retry_policy = RetryPolicy()
+    breaker_failure_threshold = 5
+    breaker_cooldown = 120.0
+    # Send a backup request once a call outlives this percentile of the
+    # host's recent latencies (see hedging.py); never before hedge_min_delay
+    # seconds. Backups need a free rate-limit token and are billed to quota.
+    hedge_requests = True
+    hedge_percentile = 0.9
+    hedge_min_delay = 1.0
+    # How long a cached results page is served without revalidation (seconds)
+    cache_ttl = 3600
+    # Metered sources: calls allowed per calendar month (None = unmetered)
+    monthly_quota: Optional[int] = None
+    # Quota units one request costs (see request_cost for multi-page calls)
+    call_cost = 1
+    # Results per page by default, the largest page size the source accepts
+    # (None = fixed size) and how many pages one call may return
+    page_size = 10
+    max_page_size: Optional[int] = None
+    max_pages_per_call = 1
+    # True when every page but the last is full, so a short page ends paging
+    exact_page_size = False
+    # Keyword phrases one query may combine (see query_planner); Adzuna-style
+    # sources can only merge phrases sharing their last word
+    max_keywords_per_query = 1
+    merge_by_head_word = False
+    # True when date_params() also asks the source for newest-first results,
+    # so a page made only of jobs older than posted_after ends pagination
+    sorts_by_date = False
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5,
+        read_timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        quota_ledger: Optional[QuotaLedger] = None,
+        archive: Optional[PageArchive] = None,
+        hedge_percentile: Optional[float] = None,
+    ):
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -16,18 +107,559 @@ class BaseScraper(ABC):
                 "Chrome/120.0.0.0 Safari/537.36"
             )
         }
+        # Politeness gate shared by every thread that scrapes this source
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        # Stop event of the page each thread is fetching (see iter_search)
+        self._fetching = threading.local()
+
+        # (connect, read) timeouts passed to every request
+        self.connect_timeout = connect_timeout
+        if read_timeout is not None:
+            self.timeout = read_timeout
+        # 0 turns hedging off for this scraper
+        if hedge_percentile is not None:
+            self.hedge_percentile = hedge_percentile
+        # Backup requests sent so far (see _timed_get)
+        self.hedged = 0
+
+        # Keep-alive session reused across pages and keywords, so repeated
+        # calls to the same host skip the TCP + TLS handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(
+            {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+        )
+
+        # Optional on-disk response cache (see response_cache.py)
+        self.cache = cache
+        # Optional API usage ledger every network call is debited from
+        self.quota_ledger = quota_ledger
+        # Optional CassetteRecorder (see replay.py) fed every final response
+        self.recorder = None
+        # Optional raw-page archive (see page_archive.py) for re-parsing
+        self.archive = archive
+
+    @property
+    def quota_key(self) -> Optional[str]:
+        """Credential the quota is tracked against (hashed by the ledger)"""
+        return None
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def is_configured(self) -> bool:
+        """Whether the scraper has the credentials it needs"""
+        return True
 
     @abstractmethod
+    def fetch_page(
+        self,
+        keywords: Union[str, SearchQuery],
+        location: str,
+        page: int,
+        posted_after: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        span: int = 1,
+    ) -> List[dict]:
+        """
+        Fetch and parse a single results page (1-based).
+
+        ``keywords`` (a phrase or SearchQuery) goes to the source via
+        keyword_params(); ``posted_after`` should be pushed down to the source via
+        date_params() where the API supports it. ``page_size`` and ``span``
+        come from plan_requests() and are only meaningful for sources that
+        declare ``max_page_size`` / ``max_pages_per_call``.
+
+        Returns the list of job dicts found on that page. Raising is fine;
+        the caller logs the error and moves on to the next page.
+        """
+        raise NotImplementedError
+
+    def parse_page(self, content: bytes, page: int) -> List[dict]:
+        """
+        Jobs in a raw results page body. Kept separate from fetch_page so
+        archived pages can be re-parsed without the network.
+        """
+        raise NotImplementedError
+
+    def archive_page(
+        self,
+        response: requests.Response,
+        keywords: Union[str, SearchQuery],
+        location: str,
+        page: int,
+        span: int = 1,
+    ):
+        """Keep a freshly downloaded 200 page in the archive, if any"""
+        if (
+            self.archive is None
+            or response.status_code != 200
+            or getattr(response, "from_cache", False)
+        ):
+            return
+        try:
+            self.archive.put(
+                self.name, SearchQuery.of(keywords), location, page, response, span=span
+            )
+        except Exception as e:
+            print(f"  ⚠️  Could not archive {self.name} page {page}: {e}")
+
+    def date_params(self, posted_after: Optional[datetime]) -> dict:
+        """Source-native query params restricting results to posted_after"""
+        return {}
+
+    def keyword_params(self, query: SearchQuery) -> dict:
+        """Source-native query params for the query's keywords/exclusions"""
+        raise NotImplementedError
+
+    @staticmethod
+    def days_since(posted_after: datetime) -> int:
+        """Whole days (rounded up, at least 1) between posted_after and now"""
+        # A few minutes of slack: the cutoff was computed when the run started
+        seconds = (datetime.now() - posted_after).total_seconds() - 300
+        return max(1, math.ceil(seconds / 86400))
+
+    def plan_requests(self, max_results: int) -> List[PageRequest]:
+        """
+        Fewest calls that cover the first ``max_results`` results, using the
+        largest page size and pages-per-call the source allows. Calls are
+        balanced (60 results at max 50 → 2 × 30, not 50 + 50).
+        """
+        if max_results <= 0:
+            return []
+        if self.max_page_size and self.max_page_size > self.page_size:
+            calls = math.ceil(max_results / self.max_page_size)
+            size = math.ceil(max_results / calls)
+            return [PageRequest(page, size) for page in range(1, calls + 1)]
+
+        pages = math.ceil(max_results / self.page_size)
+        calls = math.ceil(pages / self.max_pages_per_call)
+        span = math.ceil(pages / calls)
+        return [
+            PageRequest(start, self.page_size, min(span, pages - start + 1))
+            for start in range(1, pages + 1, span)
+        ]
+
+    def request_cost(self, request: PageRequest) -> int:
+        """Quota units the given call costs"""
+        return self.call_cost
+
+    def plan_cost(self, max_results: int) -> int:
+        """Quota units needed to fetch ``max_results`` results"""
+        return sum(self.request_cost(r) for r in self.plan_requests(max_results))
+
+    def enrich(self, jobs: List[dict]):
+        """
+        Hook run on each page's surviving jobs just before they are yielded
+        (e.g. to start background detail fetches). No-op by default.
+        """
+
+    def fetch_page_politely(
+        self,
+        keywords: Union[str, SearchQuery],
+        location: str,
+        page: int,
+        posted_after: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        span: int = 1,
+    ) -> List[dict]:
+        """
+        Fetch one page while holding this source's politeness slot.
+
+        Request pacing itself is handled by the host's rate limiter in
+        _get, so concurrent callers never exceed the source's allowed rate
+        while other sources are free to run in the meantime.
+        """
+        with self._slots:
+            try:
+                print(f"  📡 Fetching {self.name} page {page}...")
+                return self.fetch_page(
+                    keywords,
+                    location,
+                    page,
+                    posted_after=posted_after,
+                    page_size=page_size,
+                    span=span,
+                )
+            except (QuotaExceeded, CircuitOpenError, ScrapeStopped):
+                raise
+            except Exception as e:
+                print(f"  ❌ Error fetching {self.name} page {page}: {e}")
+                return []
+
+    def _get(
+        self,
+        url: str,
+        cost: Optional[int] = None,
+        ttl: Optional[float] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Cached GET over the pooled session.
+
+        A cached page younger than ``ttl`` (default ``cache_ttl``) is
+        returned without any
+        network call; stale entries are revalidated with If-None-Match /
+        If-Modified-Since. Everything else goes through _send, debiting
+        ``cost`` quota units (default ``call_cost``).
+        """
+        key = None
+        cached = None
+        if self.cache is not None:
+            key = self.cache.make_key(self.name, url, kwargs.get("params"))
+            cached = self.cache.get(key)
+            if cached and cached.age < (self.cache_ttl if ttl is None else ttl):
+                return cached.to_response(url)
+            if cached:
+                kwargs["headers"] = {
+                    **(kwargs.get("headers") or {}),
+                    **cached.conditional_headers(),
+                }
+
+        response = self._send(url, cost=cost, **kwargs)
+
+        if key is not None:
+            if response.status_code == 304 and cached:
+                self.cache.touch(key)
+                return cached.to_response(url)
+            if response.status_code == 200:
+                self.cache.put(key, self.name, url, response)
+
+        return response
+
+    def _send(self, url: str, cost: Optional[int] = None, **kwargs) -> requests.Response:
+        """
+        Rate-limited, quota-accounted, retried network GET.
+
+        Each attempt acquires a token from the host's shared bucket and is
+        debited from the quota ledger (QuotaExceeded once the monthly quota
+        is spent). On 429/503 the whole host is paused for Retry-After
+        seconds (or ``default_backoff``). Timeouts, connection errors and
+        transient statuses are retried with jittered exponential backoff;
+        failures feed the host's circuit breaker, and calls to a host whose
+        breaker is open fail fast with CircuitOpenError. Once the stop event
+        of the search being fetched is set, no further attempt is sent
+        (ScrapeStopped).
+        """
+        host = urlparse(url).netloc
+        limiter = get_rate_limiter(host, self.requests_per_second, self.burst)
+        breaker = get_circuit_breaker(
+            host, self.breaker_failure_threshold, self.breaker_cooldown
+        )
+        kwargs.setdefault("timeout", (self.connect_timeout, self.timeout))
+        cost = self.call_cost if cost is None else cost
+
+        attempts = self.retry_policy.max_attempts
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+
+            if self._stopped():
+                raise ScrapeStopped(f"{self.name} scrape stopped")
+
+            # Claim the call (or the half-open trial) before spending a rate
+            # token or quota, so a rejected call costs nothing
+            if not breaker.allow():
+                raise CircuitOpenError(
+                    f"{self.name} circuit open after repeated failures"
+                )
+
+            settled = False
+            try:
+                limiter.acquire()
+                if not self._debit(cost):
+                    raise QuotaExceeded(
+                        f"{self.name} monthly quota of {self.monthly_quota} calls reached"
+                    )
+                try:
+                    response = self._timed_get(url, host, limiter, cost, **kwargs)
+                except (
+                    requests.ConnectionError,
+                    requests.Timeout,
+                    requests.exceptions.ChunkedEncodingError,
+                ) as e:
+                    breaker.record_failure()
+                    settled = True
+                    if last_attempt:
+                        raise
+                    wait = self.retry_policy.backoff(attempt)
+                    print(f"  🔁 {self.name} {type(e).__name__}, retrying in {wait:.1f}s")
+                    time.sleep(wait)
+                    continue
+
+                if response.status_code in (429, 503):
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    wait = retry_after if retry_after is not None else self.default_backoff
+                    print(f"  ⏳ {self.name} throttled ({response.status_code}), pausing {wait:.0f}s")
+                    limiter.pause(wait)
+
+                if response.status_code not in TRANSIENT_STATUSES:
+                    breaker.record_success()
+                    settled = True
+                    if self.recorder is not None:
+                        self.recorder.record(self.name, url, kwargs.get("params"), response)
+                    return response
+
+                # Throttling means the host is alive; only errors trip the breaker
+                if response.status_code != 429:
+                    breaker.record_failure()
+                    settled = True
+            finally:
+                # Any other exit (429, spent quota, unexpected exception) gives
+                # the half-open trial back instead of leaving the host blocked
+                if not settled:
+                    breaker.release()
+
+            if last_attempt:
+                return response
+            # 429/503 already paused the limiter; others back off here
+            if response.status_code not in (429, 503):
+                wait = self.retry_policy.backoff(attempt)
+                print(f"  🔁 {self.name} returned {response.status_code}, retrying in {wait:.1f}s")
+                time.sleep(wait)
+
+        return response
+
+    def _stopped(self) -> bool:
+        """True once the search this thread is fetching for was stopped"""
+        stop = getattr(self._fetching, "stop", None)
+        return stop is not None and stop.is_set()
+
+    def _debit(self, cost: int) -> bool:
+        """Charge ``cost`` quota units; False when the monthly quota is spent"""
+        return self.quota_ledger is None or self.quota_ledger.try_debit(
+            self.name, self.quota_key, cost, self.monthly_quota
+        )
+
+    def _timed_get(self, url: str, host: str, limiter, cost: int, **kwargs):
+        """
+        One GET whose latency feeds the host's tracker, hedged with a backup
+        request when it runs past the host's latency percentile.
+        """
+        tracker = get_latency_tracker(host)
+
+        def call():
+            start = time.monotonic()
+            response = self.session.get(url, **kwargs)
+            tracker.record(time.monotonic() - start)
+            return response
+
+        delay = None
+        if self.hedge_requests and self.hedge_percentile:
+            threshold = tracker.percentile(self.hedge_percentile)
+            if threshold is not None:
+                delay = max(threshold, self.hedge_min_delay)
+
+        def may_hedge() -> bool:
+            if self._stopped() or not (limiter.try_acquire() and self._debit(cost)):
+                return False
+            print(f"  🪁 {self.name} slower than {delay:.1f}s, sending a backup request")
+            return True
+
+        response, hedged = hedged_call(call, delay, may_hedge)
+        if hedged:
+            self.hedged += 1
+        return response
+
+    def iter_search(
+        self,
+        keywords: Union[str, Sequence[str], SearchQuery],
+        location: str,
+        num_pages: int = 3,
+        posted_after: Optional[datetime] = None,
+        seen_store: Optional[SeenJobsStore] = None,
+        max_results: Optional[int] = None,
+        yield_controller: Optional[YieldController] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Search jobs page by page, yielding each page's jobs as soon as it is
+        parsed so downstream stages can start before the last page arrives.
+
+        Up to ``max_results`` jobs (default ``num_pages`` default-size
+        pages) are fetched in the fewest calls plan_requests() allows; a
+        short page from a source with ``exact_page_size`` ends pagination.
+
+        ``keywords`` may be a merged SearchQuery (see query_planner); jobs
+        are tagged with the phrase(s) they match and unmatched ones dropped.
+
+        ``posted_after`` is pushed down to the source's own date filter and,
+        for sources returning newest-first, pagination stops at the first
+        page entirely older than the cutoff.
+
+        With a ``seen_store`` the search is incremental: already-known
+        postings are dropped, pagination stops at the first page that brings
+        nothing new (or, for a date-sorted search, only postings older than the
+        query's watermark). The
+        store is only read here: the caller records the jobs as seen with
+        ``seen_store.commit(jobs)`` once it has processed them.
+
+        With a ``yield_controller`` pagination also stops once a page's
+        expected number of good new jobs falls below its threshold, and a
+        query still productive at the end of its plan may fetch extra pages
+        from calls its source's other queries left unused.
+
+        Once ``stop`` is set no further request is sent, including retries
+        and backup requests of the page in flight, even if the caller is
+        not consuming pages any more.
+
+        Each yielded job is a dict with keys:
+        - title, company, location, description, url, source
+        - posted_at (naive UTC datetime or None)
+        - posted_at_raw (original string from the source)
+        """
+        if not self.is_configured():
+            print(f"  ⚠️  {self.name} credentials not provided, skipping")
+            return
+
+        search = SearchQuery.of(keywords)
+        query = SeenJobsStore.query_key(search.keywords, location)
+        watermark = seen_store.get_watermark(self.name, query) if seen_store else None
+        newest: Optional[datetime] = None
+        if max_results is None:
+            max_results = num_pages * self.page_size
+
+        try:
+            for request in self._page_requests(max_results, search, yield_controller):
+                page = request.page
+                if stop is not None and stop.is_set():
+                    return
+                self._fetching.stop = stop
+                try:
+                    page_jobs = self.fetch_page_politely(
+                        search,
+                        location,
+                        page,
+                        posted_after=posted_after,
+                        page_size=request.page_size,
+                        span=request.span,
+                    )
+                except ScrapeStopped:
+                    return
+                except (QuotaExceeded, CircuitOpenError) as e:
+                    print(f"  ⛔ {e}, stopping pagination")
+                    return
+                finally:
+                    self._fetching.stop = None
+                if yield_controller is not None:
+                    yield_controller.charge(self.name, search, self.request_cost(request))
+                last_page = self.exact_page_size and len(page_jobs) < request.results
+
+                dates = [j["posted_at"] for j in page_jobs if j.get("posted_at")]
+                if dates:
+                    newest = max([newest, *dates]) if newest else max(dates)
+                fully_dated = len(dates) == len(page_jobs) > 0
+
+                if (
+                    posted_after is not None
+                    and self.sorts_by_date
+                    and fully_dated
+                    and max(dates) < posted_after
+                ):
+                    print(
+                        f"  ⏹️  {self.name} page {page} is older than the date "
+                        "filter, stopping pagination"
+                    )
+                    return
+
+                exhausted = False
+                if seen_store is not None:
+                    page_jobs = seen_store.filter_new(page_jobs)
+                    # Only meaningful when the page came back newest-first
+                    older_than_watermark = (
+                        watermark is not None
+                        and self.sorts_by_date
+                        and posted_after is not None
+                        and fully_dated
+                        and max(dates) <= watermark
+                    )
+                    exhausted = not page_jobs or older_than_watermark
+
+                page_jobs = search.assign_keywords(page_jobs)
+
+                # Apply shared date filter
+                page_jobs = filter_by_date(page_jobs, posted_after)
+                productive = (
+                    yield_controller is None
+                    or yield_controller.observe(self.name, search, page_jobs)
+                )
+                if page_jobs:
+                    self.enrich(page_jobs)
+                    yield page_jobs
+
+                if exhausted:
+                    print(
+                        f"  ⏹️  {self.name} page {page} has no new postings, "
+                        "stopping pagination"
+                    )
+                    return
+                if last_page or not productive:
+                    return
+        finally:
+            if seen_store is not None and newest:
+                seen_store.stage_watermark(self.name, query, newest)
+            if yield_controller is not None:
+                yield_controller.finish(self.name, search)
+
+    def _page_requests(
+        self,
+        max_results: int,
+        search: SearchQuery,
+        yield_controller: Optional[YieldController],
+    ) -> Iterator[PageRequest]:
+        """The planned calls, then single-page extensions the controller grants"""
+        plan = self.plan_requests(max_results)
+        if yield_controller is None:
+            yield from plan
+            return
+        yield_controller.register(
+            self.name, search, sum(self.request_cost(r) for r in plan)
+        )
+        yield from plan
+        last = plan[-1] if plan else None
+        while last is not None:
+            extra = PageRequest(last.page + last.span, last.page_size)
+            if not yield_controller.grant(self.name, search, self.request_cost(extra)):
+                return
+            yield extra
+            last = extra
+
     def search_jobs(
         self,
         keywords: str,
         location: str,
         num_pages: int = 3,
         posted_after: Optional[datetime] = None,
-    ):
-        """Each scraper implements its own search logic"""
-        raise NotImplementedError
+        seen_store: Optional[SeenJobsStore] = None,
+        max_results: Optional[int] = None,
+        yield_controller: Optional[YieldController] = None,
+    ) -> List[dict]:
+        """
+        Search jobs and return every page's results as one list
+        (see iter_search for the paging rules).
+        """
+        return [
+            job
+            for page_jobs in self.iter_search(
+                keywords,
+                location,
+                num_pages,
+                posted_after=posted_after,
+                seen_store=seen_store,
+                max_results=max_results,
+                yield_controller=yield_controller,
+            )
+            for job in page_jobs
+        ]
 
     def delay(self, min_sec: float = 2, max_sec: float = 5):
-        """Random delay to avoid rate limiting"""
+        """Random delay (superseded by the per-host rate limiter in _get)"""
         time.sleep(random.uniform(min_sec, max_sec))
@@ -0,0 +1,60 @@
+"""
+Background fetcher for full job descriptions.
+
+Search result pages (Indeed in particular) only carry a one-line snippet,
+so the H1B filter and matcher miss sponsorship language further down the
+posting. DetailFetcher downloads detail pages on a small bounded pool while
+list pages keep being scraped, and plugs each result into the job's lazy
+description: the first reader of ``job["description"]`` gets the full text
+(waiting only if that page is still in flight), and falls back to the
+snippet if the download fails or times out.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from src.core.job import Job
+
+
+class DetailFetcher:
+    """
+    Args:
+        fetch: Callable returning the full description for a detail URL
+            (expected to go through the scraper's cached, rate-limited _get).
+        max_workers: Detail pages downloaded at once.
+        timeout: Longest a reader waits for one description (seconds).
+        max_jobs: Cap on detail pages fetched over the fetcher's lifetime.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], str],
+        max_workers: int = 2,
+        timeout: float = 60.0,
+        max_jobs: Optional[int] = None,
+    ):
+        self.fetch = fetch
+        self.timeout = timeout
+        self.max_jobs = max_jobs
+        self.submitted = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="job-details"
+        )
+
+    def attach(self, job: Job, url: str) -> bool:
+        """Start fetching ``url`` and make it the job's description source."""
+        with self._lock:
+            if self.max_jobs is not None and self.submitted >= self.max_jobs:
+                return False
+            self.submitted += 1
+        future: Future = self._pool.submit(self.fetch, url)
+        job.set_description_loader(lambda: future.result(timeout=self.timeout))
+        return True
+
+    def close(self):
+        # Jobs still waiting on a cancelled fetch keep their snippet
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,91 @@
+"""
+Hedged requests for slow job boards.
+
+Each host keeps a sliding window of recent response times. When a request
+has been outstanding longer than the host's chosen latency percentile (p90
+by default), an identical backup request is sent and whichever answer
+arrives first is used; the straggler's response is discarded. A few percent
+extra requests cut the long tail that otherwise decides how long a
+multi-source scrape takes.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeout
+from typing import Callable, Dict, Optional, Tuple
+
+
+class LatencyTracker:
+    """Sliding window of response times for one host (thread-safe)."""
+
+    def __init__(self, window: int = 50, min_samples: int = 5):
+        self.min_samples = min_samples
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """``q``-quantile (0-1) of recent latencies, None until warmed up."""
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+# Requests (and their backups) run here so the caller can stop waiting on
+# a straggler; sized well above the sum of every source's max_in_flight
+_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="hedged-get")
+
+
+def hedged_call(
+    call: Callable[[], object],
+    delay: Optional[float],
+    may_hedge: Callable[[], bool],
+) -> Tuple[object, bool]:
+    """
+    Run ``call``; if it has not finished after ``delay`` seconds and
+    ``may_hedge()`` agrees (rate limit / quota permitting), run it a second
+    time and return the first successful result.
+
+    Returns (result, hedged). An exception is raised only when every copy
+    failed.
+    """
+    if delay is None:
+        return call(), False
+
+    primary: Future = _pool.submit(call)
+    try:
+        return primary.result(timeout=delay), False
+    except FutureTimeout:
+        pass
+    if not may_hedge():
+        return primary.result(), False
+
+    backup: Future = _pool.submit(call)
+    done, _ = wait((primary, backup), return_when=FIRST_COMPLETED)
+    first = done.pop()
+    if first.exception() is None:
+        return first.result(), True
+    other = backup if first is primary else primary
+    return other.result(), True
+
+
+# -------------------------------------------------------------------
+# Process-wide registry of trackers, one per host
+# -------------------------------------------------------------------
+_trackers: Dict[str, LatencyTracker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_latency_tracker(host: str) -> LatencyTracker:
+    """Return the shared latency window for ``host``, creating it on first use."""
+    with _registry_lock:
+        tracker = _trackers.get(host)
+        if tracker is None:
+            tracker = _trackers[host] = LatencyTracker()
+        return tracker
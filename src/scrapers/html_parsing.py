@@ -0,0 +1,309 @@
+"""
+Pluggable HTML backends for Indeed result pages.
+
+Parsing used to be BeautifulSoup's pure-Python ``html.parser`` over the
+whole page followed by a dozen ``card.find(...)`` fallbacks per card, which
+is the CPU hot spot of a many-page scrape. Each backend here implements the
+same selector chains (first selector that matches wins, in the order below)
+and returns plain field dicts:
+
+- ``selectolax``: Lexbor C parser (selectolax.lexbor) + CSS selectors (fastest)
+- ``lxml``: libxml2 parser + precompiled XPath expressions
+- ``html.parser``: BeautifulSoup over the page from the first card on
+  (the head and its scripts are never tokenized), restricted by a
+  SoupStrainer to the card subtrees so the navigation and footer are never
+  turned into Python objects. Card-only pages (like the test cassettes)
+  gain nothing; live pages are mostly such chrome.
+
+selectolax and lxml are optional; get_card_parser("auto") picks the fastest
+one installed.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# (tag, attribute, value): "class" matches one class token, other
+# attributes match exactly. Order = fallback order.
+Selector = Tuple[str, str, str]
+
+CARD_SELECTORS: Sequence[Selector] = (
+    ("div", "class", "job_seen_beacon"),
+    ("td", "class", "resultContent"),
+)
+FIELD_SELECTORS: Dict[str, Sequence[Selector]] = {
+    "title": (("h2", "class", "jobTitle"), ("a", "class", "jcs-JobTitle")),
+    "company": (
+        ("span", "data-testid", "company-name"),
+        ("span", "class", "companyName"),
+    ),
+    "location": (
+        ("div", "data-testid", "text-location"),
+        ("div", "class", "companyLocation"),
+    ),
+    "description": (
+        ("div", "class", "job-snippet"),
+        ("div", "class", "jobCardShelfContainer"),
+    ),
+    "date": (("span", "class", "date"), ("span", "data-testid", "myJobsStateDate")),
+}
+FIELDS = ("title", "company", "location", "description", "date", "href")
+# "href" comes from the title element if it is the link, else its first <a>
+
+
+def _css(selector: Selector) -> str:
+    tag, attr, value = selector
+    if attr == "class":
+        return f"{tag}.{value}"
+    return f'{tag}[{attr}="{value}"]'
+
+
+def _xpath(selector: Selector, scope: str = ".//") -> str:
+    tag, attr, value = selector
+    if attr == "class":
+        return (
+            f"{scope}{tag}[contains(concat(' ', normalize-space(@class), ' '), "
+            f"' {value} ')]"
+        )
+    return f'{scope}{tag}[@{attr}="{value}"]'
+
+
+class CardParser:
+    """Parses a results page into one field dict per job card."""
+
+    name = "base"
+
+    def parse(self, html) -> List[dict]:
+        raise NotImplementedError
+
+
+# -------------------------------------------------------------------
+# selectolax
+# -------------------------------------------------------------------
+class SelectolaxCardParser(CardParser):
+    name = "selectolax"
+
+    def __init__(self):
+        try:
+            from selectolax.lexbor import LexborHTMLParser as HTMLParser
+        except ImportError:  # selectolax < 0.3
+            from selectolax.parser import HTMLParser
+
+        self._parser = HTMLParser
+        self._cards = [_css(s) for s in CARD_SELECTORS]
+        self._fields = {
+            field: [_css(s) for s in chain] for field, chain in FIELD_SELECTORS.items()
+        }
+
+    @staticmethod
+    def _text(node) -> str:
+        return node.text(deep=True, separator="", strip=True)
+
+    def parse(self, html) -> List[dict]:
+        if not html:
+            return []
+        tree = self._parser(html)
+        cards = []
+        for selector in self._cards:
+            cards = tree.css(selector)
+            if cards:
+                break
+
+        results = []
+        for card in cards:
+            row: Dict[str, Optional[str]] = {}
+            title_node = None
+            for field, chain in self._fields.items():
+                node = None
+                for selector in chain:
+                    node = card.css_first(selector)
+                    if node is not None:
+                        break
+                row[field] = self._text(node) if node is not None else None
+                if field == "title":
+                    title_node = node
+            # css_first also matches the node itself (a.jcs-JobTitle)
+            link = title_node.css_first("a") if title_node is not None else None
+            row["href"] = link.attributes.get("href") if link is not None else None
+            results.append(row)
+        return results
+
+
+# -------------------------------------------------------------------
+# lxml
+# -------------------------------------------------------------------
+class LxmlCardParser(CardParser):
+    name = "lxml"
+
+    def __init__(self):
+        from lxml import etree, html as lxml_html
+
+        self._fromstring = lxml_html.fromstring
+        # Without a meta charset libxml2 would guess latin-1 for bytes
+        self._bytes_parser = lxml_html.HTMLParser(encoding="utf-8")
+        self._cards = [etree.XPath(_xpath(s, "//")) for s in CARD_SELECTORS]
+        self._fields = {
+            field: [etree.XPath(f"({_xpath(s)})[1]") for s in chain]
+            for field, chain in FIELD_SELECTORS.items()
+        }
+        self._link = etree.XPath("(descendant-or-self::a)[1]")
+
+    @staticmethod
+    def _text(node) -> str:
+        return "".join(t.strip() for t in node.itertext() if t.strip())
+
+    def parse(self, html) -> List[dict]:
+        if not html:
+            return []
+        if isinstance(html, bytes):
+            tree = self._fromstring(html, parser=self._bytes_parser)
+        else:
+            tree = self._fromstring(html)
+        cards = []
+        for xpath in self._cards:
+            cards = xpath(tree)
+            if cards:
+                break
+
+        results = []
+        for card in cards:
+            row: Dict[str, Optional[str]] = {}
+            title_node = None
+            for field, chain in self._fields.items():
+                node = None
+                for xpath in chain:
+                    found = xpath(card)
+                    if found:
+                        node = found[0]
+                        break
+                row[field] = self._text(node) if node is not None else None
+                if field == "title":
+                    title_node = node
+            links = self._link(title_node) if title_node is not None else []
+            link = links[0] if links else None
+            row["href"] = link.get("href") if link is not None else None
+            results.append(row)
+        return results
+
+
+# -------------------------------------------------------------------
+# BeautifulSoup (always available)
+# -------------------------------------------------------------------
+class SoupCardParser(CardParser):
+    name = "html.parser"
+    # Start tokenizing at the first card instead of the top of the page
+    skip_to_cards = True
+
+    def __init__(self):
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        self._soup = BeautifulSoup
+        # Only build objects for card subtrees
+        self._strainer = SoupStrainer(
+            name=sorted({tag for tag, _, _ in CARD_SELECTORS}),
+            class_=[value for _, _, value in CARD_SELECTORS],
+        )
+
+    @staticmethod
+    def _find(node, selector: Selector):
+        tag, attr, value = selector
+        if attr == "class":
+            return node.find(tag, class_=value)
+        return node.find(tag, {attr: value})
+
+    def _card_start(self, html, tag: str, value: str) -> Optional[int]:
+        """
+        Offset of the opening tag before the first mention of a card class:
+        every such card lies after it. None when the class is not on the
+        page at all.
+        """
+        if not self.skip_to_cards:
+            return 0
+        marker, opening = value, f"<{tag}"
+        if isinstance(html, bytes):
+            marker, opening = marker.encode(), opening.encode()
+        found = html.find(marker)
+        if found < 0:
+            return None
+        return max(0, html.rfind(opening, 0, found))
+
+    def parse(self, html) -> List[dict]:
+        if not html:
+            return []
+        cards = []
+        soups = {}
+        for tag, _, value in CARD_SELECTORS:
+            start = self._card_start(html, tag, value)
+            if start is None:
+                continue
+            if start not in soups:
+                soups[start] = self._soup(
+                    html[start:], "html.parser", parse_only=self._strainer
+                )
+            # Empty if the class was only mentioned (e.g. in a script)
+            cards = soups[start].find_all(tag, class_=value)
+            if cards:
+                break
+
+        results = []
+        for card in cards:
+            row: Dict[str, Optional[str]] = {}
+            title_node = None
+            for field, chain in FIELD_SELECTORS.items():
+                node = None
+                for selector in chain:
+                    node = self._find(card, selector)
+                    if node is not None:
+                        break
+                row[field] = node.get_text(strip=True) if node is not None else None
+                if field == "title":
+                    title_node = node
+            if title_node is None or title_node.name == "a":
+                link = title_node
+            else:
+                link = title_node.find("a")
+            row["href"] = link.get("href") if link is not None else None
+            results.append(row)
+        return results
+
+
+_BACKENDS = {
+    "selectolax": SelectolaxCardParser,
+    "lxml": LxmlCardParser,
+    "html.parser": SoupCardParser,
+}
+
+
+def available_backends() -> List[str]:
+    """Installed backends, fastest first."""
+    names = []
+    for name, cls in _BACKENDS.items():
+        try:
+            cls()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def get_card_parser(backend: str = "auto") -> CardParser:
+    """
+    Return a parser for ``backend`` ("auto", "selectolax", "lxml" or
+    "html.parser"). A requested backend that is not installed falls back
+    to the best available one.
+    """
+    order = list(_BACKENDS)
+    if backend != "auto":
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown HTML parser backend: {backend}")
+        order.remove(backend)
+        order.insert(0, backend)
+    for name in order:
+        try:
+            parser = _BACKENDS[name]()
+        except ImportError:
+            if name == backend:
+                print(f"⚠️ {backend} not installed, falling back")
+            continue
+        return parser
+    raise RuntimeError("No HTML parser backend available")
@@ -1,163 +1,162 @@
-import requests
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
 
 from bs4 import BeautifulSoup
 
+from src.core.job import Job
 from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.detail_fetcher import DetailFetcher
+from src.scrapers.html_parsing import get_card_parser
+from src.scrapers.query_planner import SearchQuery
+from src.scrapers.registry import register_scraper
 from src.utils.date_parsing import parse_any_posted_date
-from src.utils.job_filters import filter_by_date
 
 
+@register_scraper("indeed", label="Indeed")
 class IndeedScraper(BaseScraper):
-    def __init__(self):
-        super().__init__()
+    name = "Indeed"
+    sorts_by_date = True
+    requests_per_second = 0.33
+    burst = 1
+    cache_ttl = 30 * 60
+    # Job detail pages rarely change once posted
+    detail_cache_ttl = 7 * 24 * 3600
+
+    def __init__(
+        self,
+        fetch_details: bool = False,
+        detail_workers: int = 2,
+        max_details: Optional[int] = None,
+        parser_backend: str = "auto",
+        **session_options,
+    ):
+        """
+        With ``fetch_details`` each surviving card's full description is
+        downloaded in the background (see detail_fetcher.py). Detail pages
+        share the www.indeed.com rate limit with result pages.
+        ``parser_backend`` picks the result-page HTML parser
+        ("auto", "selectolax", "lxml" or "html.parser").
+        """
+        super().__init__(**session_options)
         self.base_url = "https://www.indeed.com"
-
-    def search_jobs(
+        self.parser = get_card_parser(parser_backend)
+        self.details = (
+            DetailFetcher(
+                self.fetch_description, max_workers=detail_workers, max_jobs=max_details
+            )
+            if fetch_details
+            else None
+        )
+
+    def close(self):
+        if self.details:
+            self.details.close()
+        super().close()
+
+    def keyword_params(self, query: SearchQuery) -> dict:
+        """'q' supports -term exclusions"""
+        text = query.keywords[0]
+        text += "".join(f" -{term}" for term in query.exclude)
+        return {"q": text}
+
+    def date_params(self, posted_after: Optional[datetime]) -> dict:
+        """Indeed's 'fromage' accepts 1/3/7/14 days; sort by date for early stop"""
+        if not posted_after:
+            return {}
+        days = self.days_since(posted_after)
+        for fromage in (1, 3, 7, 14):
+            if days <= fromage:
+                return {"fromage": fromage, "sort": "date"}
+        return {"sort": "date"}
+
+    def detail_url(self, job: dict) -> Optional[str]:
+        """Canonical viewjob URL from the card link's job key, if any"""
+        url = job.get("url") or ""
+        job_key = parse_qs(urlsplit(url).query).get("jk")
+        return f"{self.base_url}/viewjob?jk={job_key[0]}" if job_key else None
+
+    def fetch_description(self, url: str) -> str:
+        """Full text of a job detail page ('' if unavailable)"""
+        response = self._get(url, ttl=self.detail_cache_ttl, headers=self.headers)
+        if response.status_code != 200:
+            return ""
+        soup = BeautifulSoup(response.content, "html.parser")
+        body = soup.find(id="jobDescriptionText")
+        return body.get_text(" ", strip=True) if body else ""
+
+    def enrich(self, jobs: List[dict]):
+        """Start background downloads of the full descriptions"""
+        if not self.details:
+            return
+        for job in jobs:
+            url = self.detail_url(job)
+            if url and isinstance(job, Job):
+                self.details.attach(job, url)
+
+    def fetch_page(
         self,
-        keywords: str,
+        keywords: Union[str, SearchQuery],
         location: str,
-        num_pages: int = 3,
+        page: int,
         posted_after: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        span: int = 1,
     ) -> List[dict]:
         """
-        Scrape Indeed jobs.
+        Scrape one Indeed results page.
 
         Returns list of dicts:
         [{title, company, location, description, url, source, posted_at, posted_at_raw}, ...]
         """
         jobs: List[dict] = []
 
-        for page in range(num_pages):
-            start = page * 10  # Indeed pagination uses 'start' parameter
+        start = (page - 1) * 10  # Indeed pagination uses 'start' parameter
 
-            search_url = (
-                f"{self.base_url}/jobs?"
-                f"q={keywords.replace(' ', '+')}&"
-                f"l={location.replace(' ', '+')}&"
-                f"start={start}"
-            )
+        params = {
+            **self.keyword_params(SearchQuery.of(keywords)),
+            "l": location,
+            "start": start,
+            **self.date_params(posted_after),
+        }
+        search_url = f"{self.base_url}/jobs?{urlencode(params)}"
 
-            try:
-                print(f"  📡 Fetching Indeed page {page + 1}...")
-                response = requests.get(
-                    search_url, headers=self.headers, timeout=10
-                )
+        response = self._get(search_url, headers=self.headers)
+
+        if response.status_code != 200:
+            print(f"  ⚠️  Indeed returned status {response.status_code}")
+            return jobs
 
-                if response.status_code != 200:
-                    print(f"  ⚠️  Indeed returned status {response.status_code}")
-                    continue
+        self.archive_page(response, keywords, location, page)
+        return self.parse_page(response.content, page)
 
-                soup = BeautifulSoup(response.content, "html.parser")
+    def parse_page(self, content: bytes, page: int) -> List[dict]:
+        jobs: List[dict] = []
 
-                # Find all job cards (Indeed's HTML structure)
-                job_cards = soup.find_all("div", class_="job_seen_beacon")
+        # Field dicts per job card (see html_parsing.py for the selectors)
+        cards = self.parser.parse(content)
 
-                if not job_cards:
-                    # Try alternative class names (Indeed changes them frequently)
-                    job_cards = soup.find_all("td", class_="resultContent")
+        print(f"  ✅ Found {len(cards)} job cards on page {page}")
 
-                print(
-                    f"  ✅ Found {len(job_cards)} job cards on page {page + 1}"
+        for card in cards:
+            try:
+                href = card["href"]
+                raw_date = card["date"] or ""
+                jobs.append(
+                    Job(
+                        title=card["title"] or "N/A",
+                        company=card["company"] or "N/A",
+                        location=card["location"] or "N/A",
+                        description=card["description"] or "",
+                        url=f"{self.base_url}{href}" if href else "N/A",
+                        source="Indeed",
+                        posted_at=parse_any_posted_date(raw_date),
+                        posted_at_raw=raw_date,
+                    )
                 )
 
-                for card in job_cards:
-                    try:
-                        # Title
-                        title_elem = card.find("h2", class_="jobTitle")
-                        if not title_elem:
-                            title_elem = card.find("a", class_="jcs-JobTitle")
-                        title = (
-                            title_elem.get_text(strip=True)
-                            if title_elem
-                            else "N/A"
-                        )
-
-                        # Company
-                        company_elem = card.find(
-                            "span", {"data-testid": "company-name"}
-                        )
-                        if not company_elem:
-                            company_elem = card.find(
-                                "span", class_="companyName"
-                            )
-                        company = (
-                            company_elem.get_text(strip=True)
-                            if company_elem
-                            else "N/A"
-                        )
-
-                        # Location
-                        loc_elem = card.find(
-                            "div", {"data-testid": "text-location"}
-                        )
-                        if not loc_elem:
-                            loc_elem = card.find(
-                                "div", class_="companyLocation"
-                            )
-                        job_location = (
-                            loc_elem.get_text(strip=True)
-                            if loc_elem
-                            else "N/A"
-                        )
-
-                        # Job link
-                        link_elem = title_elem.find("a") if title_elem else None
-                        job_url = (
-                            f"{self.base_url}{link_elem['href']}"
-                            if link_elem and "href" in link_elem.attrs
-                            else "N/A"
-                        )
-
-                        # Description snippet
-                        desc_elem = card.find("div", class_="job-snippet")
-                        if not desc_elem:
-                            desc_elem = card.find(
-                                "div", {"class": "jobCardShelfContainer"}
-                            )
-                        description = (
-                            desc_elem.get_text(strip=True)
-                            if desc_elem
-                            else ""
-                        )
-
-                        # Posted date text – Indeed often puts it in a 'date' or 'date' span
-                        date_elem = card.find("span", class_="date")
-                        if not date_elem:
-                            date_elem = card.find(
-                                "span", {"data-testid": "myJobsStateDate"}
-                            )
-                        raw_date = (
-                            date_elem.get_text(strip=True)
-                            if date_elem
-                            else ""
-                        )
-                        posted_at = parse_any_posted_date(raw_date)
-
-                        jobs.append(
-                            {
-                                "title": title,
-                                "company": company,
-                                "location": job_location,
-                                "description": description,
-                                "url": job_url,
-                                "source": "Indeed",
-                                "posted_at": posted_at,
-                                "posted_at_raw": raw_date,
-                            }
-                        )
-
-                    except Exception as e:
-                        print(f"  ⚠️  Error parsing job card: {e}")
-                        continue
-
-                self.delay()  # Polite delay between pages
-
             except Exception as e:
-                print(f"  ❌ Error fetching Indeed page {page + 1}: {e}")
+                print(f"  ⚠️  Error parsing job card: {e}")
                 continue
 
-        # Apply shared date filter
-        jobs = filter_by_date(jobs, posted_after)
         return jobs
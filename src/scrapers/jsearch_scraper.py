@@ -1,90 +1,133 @@
-import requests
+import json
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 
-from src.scrapers.base_scraper import BaseScraper
+from src.core.job import Job
+from src.scrapers.base_scraper import BaseScraper, PageRequest
+from src.scrapers.query_planner import SearchQuery
+from src.scrapers.registry import register_scraper
 from src.utils.date_parsing import parse_any_posted_date
-from src.utils.job_filters import filter_by_date
 
 
+@register_scraper("jsearch", label="JSearch", auth=("rapidapi_key",))
 class JSearchScraper(BaseScraper):
     """
     JSearch API via RapidAPI - FREE tier: 1000 calls/month
     Get key: https://rapidapi.com/letscrape-6bRBa3QguO5/api/jsearch
     """
 
-    def __init__(self, rapidapi_key: str):
-        super().__init__()
+    name = "JSearch"
+    requests_per_second = 1.0
+    burst = 2
+    cache_ttl = 6 * 3600  # quota is scarce, keep pages longer
+    monthly_quota = 1000
+    max_in_flight = 2
+    # Each backup request would spend scarce quota
+    hedge_requests = False
+    # 10 results per page; num_pages=2..10 returns up to 100 results in one
+    # call, billed as 2 calls
+    page_size = 10
+    max_pages_per_call = 10
+    exact_page_size = True
+    # Google-for-Jobs style query text accepts OR and -term
+    max_keywords_per_query = 5
+
+    def __init__(self, rapidapi_key: str, **session_options):
+        super().__init__(**session_options)
         self.rapidapi_key = rapidapi_key
-
-    def search_jobs(
+        self.base_url = "https://jsearch.p.rapidapi.com/search"
+
+    @property
+    def quota_key(self) -> Optional[str]:
+        return self.rapidapi_key
+
+    def is_configured(self) -> bool:
+        return bool(self.rapidapi_key)
+
+    def date_params(self, posted_after: Optional[datetime]) -> dict:
+        """JSearch buckets: today / 3days / week / month"""
+        if not posted_after:
+            return {}
+        days = self.days_since(posted_after)
+        for limit, bucket in ((1, "today"), (3, "3days"), (7, "week"), (31, "month")):
+            if days <= limit:
+                return {"date_posted": bucket}
+        return {}
+
+    def keyword_params(self, query: SearchQuery) -> dict:
+        """'"Data Engineer" OR "Cloud Engineer" -clearance'"""
+        if query.merged:
+            text = " OR ".join(f'"{kw}"' for kw in query.keywords)
+        else:
+            text = query.keywords[0]
+        text += "".join(f" -{term}" for term in query.exclude)
+        return {"query": text}
+
+    def request_cost(self, request: PageRequest) -> int:
+        return 1 if request.span == 1 else 2
+
+    def fetch_page(
         self,
-        keywords: str,
+        keywords: Union[str, SearchQuery],
         location: str,
-        num_pages: int = 3,
-        posted_after: Optional[datetime] = None,  # NEW
+        page: int,
+        posted_after: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        span: int = 1,
     ) -> List[dict]:
         """
-        Search jobs using JSearch API, optionally filtering by posted_after.
+        Fetch ``span`` consecutive pages of JSearch results in one call.
         """
         jobs: List[dict] = []
 
-        if not self.rapidapi_key:
-            print("  ⚠️  RapidAPI key not provided for JSearch")
-            return jobs
-
-        url = "https://jsearch.p.rapidapi.com/search"
         headers = {
             "X-RapidAPI-Key": self.rapidapi_key,
             "X-RapidAPI-Host": "jsearch.p.rapidapi.com",
         }
+        keyword_text = self.keyword_params(SearchQuery.of(keywords))["query"]
+        querystring = {
+            "query": f"{keyword_text} in {location}",
+            "page": str(page),
+            "num_pages": str(span),
+            **self.date_params(posted_after),
+        }
 
-        for page in range(1, num_pages + 1):
-            try:
-                print(f"  📡 Fetching JSearch page {page}...")
+        response = self._get(
+            self.base_url,
+            cost=self.request_cost(PageRequest(page, self.page_size, span)),
+            headers=headers,
+            params=querystring,
+        )
 
-                querystring = {
-                    "query": f"{keywords} in {location}",
-                    "page": str(page),
-                    "num_pages": "1",
-                }
+        if response.status_code != 200:
+            print(f"  ⚠️  JSearch returned status {response.status_code}")
+            print(f"  Response: {response.text[:200]}")
+            return jobs
+
+        self.archive_page(response, keywords, location, page, span=span)
+        return self.parse_page(response.content, page)
 
-                response = requests.get(
-                    url, headers=headers, params=querystring, timeout=10
+    def parse_page(self, content: bytes, page: int) -> List[dict]:
+        jobs: List[dict] = []
+        results = json.loads(content).get("data", [])
+
+        print(f"  ✅ Found {len(results)} jobs on page {page}")
+
+        for job in results:
+            posted_raw = job.get("job_posted_at") or ""
+            posted_at = parse_any_posted_date(posted_raw)
+
+            jobs.append(
+                Job(
+                    title=job.get("job_title", "N/A"),
+                    company=job.get("employer_name", "N/A"),
+                    location=f"{job.get('job_city', 'N/A')}, {job.get('job_state', '')}",
+                    description=job.get("job_description", ""),
+                    url=job.get("job_apply_link", "N/A"),
+                    source="JSearch",
+                    posted_at=posted_at,      # normalized datetime
+                    posted_at_raw=posted_raw, # original string
                 )
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    results = data.get("data", [])
-
-                    print(f"  ✅ Found {len(results)} jobs on page {page}")
-
-                    for job in results:
-                        posted_raw = job.get("job_posted_at") or ""
-                        posted_at = parse_any_posted_date(posted_raw)
-
-                        jobs.append(
-                            {
-                                "title": job.get("job_title", "N/A"),
-                                "company": job.get("employer_name", "N/A"),
-                                "location": f"{job.get('job_city', 'N/A')}, {job.get('job_state', '')}",
-                                "description": job.get("job_description", ""),
-                                "url": job.get("job_apply_link", "N/A"),
-                                "source": "JSearch",
-                                "posted_at": posted_at,      # normalized datetime
-                                "posted_at_raw": posted_raw, # original string
-                            }
-                        )
-                else:
-                    print(f"  ⚠️  JSearch returned status {response.status_code}")
-                    print(f"  Response: {response.text[:200]}")
-
-                self.delay(1, 2)
-
-            except Exception as e:
-                print(f"  ❌ Error fetching JSearch page {page}: {e}")
-                continue
-
-        # Apply shared date filter
-        jobs = filter_by_date(jobs, posted_after)
         return jobs
@@ -1,105 +1,113 @@
-import requests
+import json
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 
+from src.core.job import Job
 from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.query_planner import SearchQuery
+from src.scrapers.registry import register_scraper
 from src.utils.date_parsing import parse_any_posted_date
-from src.utils.job_filters import filter_by_date
 
 
+# Off by default: needs a RapidAPI subscription to the LinkedIn wrapper
+@register_scraper(
+    "linkedin", label="LinkedIn", auth=("linkedin_api_key",), enabled_by_default=False
+)
 class LinkedInScraper(BaseScraper):
     """
     LinkedIn scraper using RapidAPI:
     https://rapidapi.com/fantastic-jobs-fantastic-jobs-default/api/linkedin-job-search-api
     """
 
-    def __init__(self, api_key: Optional[str] = None):
-        super().__init__()
+    name = "LinkedIn"
+    requests_per_second = 0.5
+    burst = 1
+    timeout = 15
+    cache_ttl = 2 * 3600
+
+    def __init__(self, api_key: Optional[str] = None, **session_options):
+        super().__init__(**session_options)
         self.api_key = api_key  # RapidAPI key for LinkedIn Job Search API
+        self.base_url = "https://linkedin-job-search-api.p.rapidapi.com/search"
+
+    @property
+    def quota_key(self) -> Optional[str]:
+        return self.api_key
+
+    def is_configured(self) -> bool:
+        return bool(self.api_key)
 
-    def search_jobs(
+    def keyword_params(self, query: SearchQuery) -> dict:
+        """Plain keywords only (no exclusion syntax documented)"""
+        return {"keywords": query.keywords[0]}
+
+    def fetch_page(
         self,
-        keywords: str,
+        keywords: Union[str, SearchQuery],
         location: str,
-        num_pages: int = 3,
+        page: int,
         posted_after: Optional[datetime] = None,
+        page_size: Optional[int] = None,
+        span: int = 1,
     ) -> List[dict]:
         """
-        Search LinkedIn jobs via RapidAPI.
-
-        Returns list of dicts:
-        [{title, company, location, description, url, source, posted_at, posted_at_raw}, ...]
+        Fetch one page of LinkedIn jobs via RapidAPI.
         """
         jobs: List[dict] = []
 
-        if not self.api_key:
-            print("  ⚠️  LinkedIn API key not provided. Skipping LinkedIn scraping.")
-            print("     Get a free key from: https://rapidapi.com/")
-            return jobs
-
-        url = "https://linkedin-job-search-api.p.rapidapi.com/search"
-
         headers = {
             "X-RapidAPI-Key": self.api_key,
             "X-RapidAPI-Host": "linkedin-job-search-api.p.rapidapi.com",
         }
+        querystring = {
+            **self.keyword_params(SearchQuery.of(keywords)),
+            "location": location,
+            "page": str(page),
+        }
+
+        response = self._get(
+            self.base_url, headers=headers, params=querystring
+        )
+
+        if response.status_code != 200:
+            print(f"  ⚠️  LinkedIn API returned status {response.status_code}")
+            return jobs
+
+        self.archive_page(response, keywords, location, page)
+        return self.parse_page(response.content, page)
+
+    def parse_page(self, content: bytes, page: int) -> List[dict]:
+        jobs: List[dict] = []
+        data = json.loads(content)
+
+        jobs_list = data.get("jobs") or data.get("data") or []
+        if not jobs_list:
+            print("  ⚠️  No jobs found in LinkedIn response")
+            return jobs
 
-        for page in range(1, num_pages + 1):
-            querystring = {
-                "keywords": keywords,
-                "location": location,
-                "page": str(page),
-            }
-
-            try:
-                print(f"  📡 Fetching LinkedIn page {page}...")
-                response = requests.get(
-                    url, headers=headers, params=querystring, timeout=15
+        print(f"  ✅ Found {len(jobs_list)} jobs on page {page}")
+
+        for job in jobs_list:
+            # Different LinkedIn wrappers use slightly different keys for date
+            raw_date = (
+                job.get("postedAt")
+                or job.get("listedAt")
+                or job.get("time_ago")
+                or ""
+            )
+            posted_at = parse_any_posted_date(raw_date)
+
+            jobs.append(
+                Job(
+                    title=job.get("title", "N/A"),
+                    company=job.get("company", "N/A"),
+                    location=job.get("location", "N/A"),
+                    description=job.get("description", ""),
+                    url=job.get("url", "N/A"),
+                    source="LinkedIn",
+                    posted_at=posted_at,
+                    posted_at_raw=raw_date,
                 )
+            )
 
-                if response.status_code != 200:
-                    print(
-                        f"  ⚠️  LinkedIn API returned status {response.status_code}"
-                    )
-                    continue
-
-                data = response.json()
-
-                jobs_list = data.get("jobs") or data.get("data") or []
-                if jobs_list:
-                    print(f"  ✅ Found {len(jobs_list)} jobs on page {page}")
-
-                    for job in jobs_list:
-                        # Different LinkedIn wrappers use slightly different keys for date
-                        raw_date = (
-                            job.get("postedAt")
-                            or job.get("listedAt")
-                            or job.get("time_ago")
-                            or ""
-                        )
-                        posted_at = parse_any_posted_date(raw_date)
-
-                        jobs.append(
-                            {
-                                "title": job.get("title", "N/A"),
-                                "company": job.get("company", "N/A"),
-                                "location": job.get("location", "N/A"),
-                                "description": job.get("description", ""),
-                                "url": job.get("url", "N/A"),
-                                "source": "LinkedIn",
-                                "posted_at": posted_at,
-                                "posted_at_raw": raw_date,
-                            }
-                        )
-                else:
-                    print("  ⚠️  No jobs found in LinkedIn response")
-
-                self.delay()
-
-            except Exception as e:
-                print(f"  ❌ Error fetching LinkedIn page {page}: {e}")
-                continue
-
-        # Apply shared date filter
-        jobs = filter_by_date(jobs, posted_after)
         return jobs
@@ -0,0 +1,321 @@
+"""
+Compressed archive of raw scraper responses.
+
+Every results page a scraper downloads (Indeed HTML, API JSON) can be kept
+so parsers can be re-run after a fix - Indeed renames its card classes
+every few weeks - without refetching pages or spending API quota. The same
+pages double as a realistic corpus for parser benchmarks.
+
+Layout under the archive root:
+
+- ``YYYY/MM/DD/<source>.gz``: that day's pages for one source, each page
+  one gzip member appended to the file (a concatenation of gzip members is
+  itself a valid gzip file, so ``zcat`` still works)
+- ``index.sqlite3``: one row per page with (source, query, location, page,
+  fetched_at) and the member's byte offset/length in its day file
+
+Usage:
+    python -m src.scrapers.page_archive stats
+    python -m src.scrapers.page_archive reparse --source Indeed --since 2026-10-01 --out jobs.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from src.scrapers.response_cache import SECRET_PARAMS
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+ARCHIVE_DIR = PROJECT_ROOT / "data" / "raw_pages"
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """Index entry for one archived response."""
+
+    id: int
+    source: str
+    query: str
+    keywords: Tuple[str, ...]
+    exclude: Tuple[str, ...]
+    location: str
+    page: int
+    span: int
+    url: str
+    status: int
+    content_type: str
+    fetched_at: float
+    partition: str
+    offset: int
+    length: int
+
+
+class PageArchive:
+    """Append-only, date-partitioned store of raw pages (thread-safe)."""
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else ARCHIVE_DIR
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.root / "index.sqlite3"), check_same_thread=False
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                id INTEGER PRIMARY KEY,
+                source TEXT,
+                query TEXT,
+                keywords TEXT,
+                exclude TEXT,
+                location TEXT,
+                page INTEGER,
+                span INTEGER,
+                url TEXT,
+                status INTEGER,
+                content_type TEXT,
+                fetched_at REAL,
+                partition TEXT,
+                offset INTEGER,
+                length INTEGER
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pages_lookup "
+            "ON pages (source, query, page, fetched_at)"
+        )
+        self._conn.commit()
+
+    def put(
+        self,
+        source: str,
+        query,
+        location: str,
+        page: int,
+        response: requests.Response,
+        span: int = 1,
+    ):
+        """Archive one response for ``query`` (a SearchQuery)."""
+        fetched_at = time.time()
+        partition = time.strftime("%Y/%m/%d", time.localtime(fetched_at))
+        member = gzip.compress(response.content, compresslevel=6)
+        path = self.root / partition / f"{source.lower()}.gz"
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab") as f:
+                offset = f.tell()
+                f.write(member)
+            self._conn.execute(
+                "INSERT INTO pages (source, query, keywords, exclude, location, page, "
+                "span, url, status, content_type, fetched_at, partition, offset, length) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    source,
+                    str(query),
+                    json.dumps(list(query.keywords)),
+                    json.dumps(list(query.exclude)),
+                    location,
+                    page,
+                    span,
+                    _strip_secrets(response.url or ""),
+                    response.status_code,
+                    response.headers.get("Content-Type", ""),
+                    fetched_at,
+                    partition,
+                    offset,
+                    len(member),
+                ),
+            )
+            self._conn.commit()
+
+    def find(
+        self,
+        source: Optional[str] = None,
+        query: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[ArchivedPage]:
+        """Index entries matching the filters, oldest first."""
+        clauses, args = [], []
+        if source:
+            clauses.append("source = ?")
+            args.append(source)
+        if query:
+            clauses.append("query = ?")
+            args.append(query)
+        if since:
+            clauses.append("fetched_at >= ?")
+            args.append(since.timestamp())
+        if until:
+            clauses.append("fetched_at < ?")
+            args.append(until.timestamp())
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, source, query, keywords, exclude, location, page, span, "
+                "url, status, content_type, fetched_at, partition, offset, length "
+                f"FROM pages {where} ORDER BY fetched_at, id",
+                args,
+            ).fetchall()
+        return [
+            ArchivedPage(
+                *row[:3],
+                tuple(json.loads(row[3])),
+                tuple(json.loads(row[4])),
+                *row[5:],
+            )
+            for row in rows
+        ]
+
+    def read(self, entry: ArchivedPage) -> bytes:
+        """Raw body of an archived page."""
+        path = self.root / entry.partition / f"{entry.source.lower()}.gz"
+        with open(path, "rb") as f:
+            f.seek(entry.offset)
+            return gzip.decompress(f.read(entry.length))
+
+    def iter_pages(self, **filters) -> Iterator[Tuple[ArchivedPage, bytes]]:
+        """(entry, body) for every page matching ``find(**filters)``."""
+        for entry in self.find(**filters):
+            yield entry, self.read(entry)
+
+    def prune(self, keep_days: int):
+        """Drop day partitions (and their index rows) older than keep_days."""
+        cutoff = (datetime.now() - timedelta(days=keep_days)).strftime("%Y/%m/%d")
+        with self._lock:
+            partitions = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT DISTINCT partition FROM pages WHERE partition < ?",
+                    (cutoff,),
+                )
+            ]
+            for partition in partitions:
+                shutil.rmtree(self.root / partition, ignore_errors=True)
+                self._conn.execute("DELETE FROM pages WHERE partition = ?", (partition,))
+            self._conn.commit()
+
+    def stats(self) -> List[tuple]:
+        """(source, day, pages, compressed bytes) per partition."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT source, partition, COUNT(*), SUM(length) FROM pages "
+                "GROUP BY source, partition ORDER BY partition, source"
+            ).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _strip_secrets(url: str) -> str:
+    """URL without credential query params (Adzuna puts its key there)."""
+    parts = urlsplit(url)
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query) if k.lower() not in SECRET_PARAMS
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+# -------------------------------------------------------------------
+# Re-parsing
+# -------------------------------------------------------------------
+def reparse(archive: PageArchive, scrapers: dict, **filters) -> List[dict]:
+    """
+    Rebuild jobs from archived pages with the current parsers.
+
+    ``scrapers`` maps source name → scraper instance (only its parse_page()
+    is used). Jobs are tagged with their originating keywords as in a live
+    scrape.
+    """
+    from src.scrapers.query_planner import SearchQuery
+
+    jobs: List[dict] = []
+    for entry, body in archive.iter_pages(**filters):
+        scraper = scrapers.get(entry.source)
+        if scraper is None or entry.status != 200:
+            continue
+        try:
+            page_jobs = scraper.parse_page(body, entry.page)
+        except Exception as e:
+            print(f"  ⚠️  Could not parse archived {entry.source} page {entry.id}: {e}")
+            continue
+        search = SearchQuery(entry.keywords, entry.exclude)
+        jobs.extend(search.assign_keywords(page_jobs))
+    return jobs
+
+
+def _parsers() -> dict:
+    """Scraper instances used only for parsing (no credentials needed)."""
+    from src.scrapers.registry import load_scrapers
+
+    scrapers = [
+        spec.scraper_cls(*["" for _ in spec.auth]) for spec in load_scrapers()
+    ]
+    return {scraper.name: scraper for scraper in scrapers}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Raw scraper page archive")
+    parser.add_argument("--root", type=Path, default=ARCHIVE_DIR)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="Pages and size per source and day")
+
+    rp = sub.add_parser("reparse", help="Regenerate jobs from archived pages")
+    rp.add_argument("--source")
+    rp.add_argument("--query", help="Exact query text, e.g. 'Data Engineer'")
+    rp.add_argument("--since", type=datetime.fromisoformat)
+    rp.add_argument("--until", type=datetime.fromisoformat)
+    rp.add_argument("--out", type=Path, help="CSV output (default: summary only)")
+
+    pr = sub.add_parser("prune", help="Delete partitions older than N days")
+    pr.add_argument("--keep-days", type=int, required=True)
+    args = parser.parse_args()
+
+    archive = PageArchive(args.root)
+    if args.command == "stats":
+        for source, partition, pages, size in archive.stats():
+            print(f"{partition}  {source:<10} {pages:>5} pages  {size / 1024:8.1f} KB")
+    elif args.command == "reparse":
+        scrapers = _parsers()
+        jobs = reparse(
+            archive,
+            scrapers,
+            source=args.source,
+            query=args.query,
+            since=args.since,
+            until=args.until,
+        )
+        for scraper in scrapers.values():
+            scraper.close()
+        print(f"✅ Re-parsed {len(jobs)} jobs")
+        if args.out:
+            import pandas as pd
+
+            from src.core.job import jobs_to_columns
+
+            pd.DataFrame(jobs_to_columns(jobs)).to_csv(args.out, index=False)
+            print(f"💾 Saved to {args.out}")
+    elif args.command == "prune":
+        archive.prune(args.keep_days)
+        print(f"🧹 Kept the last {args.keep_days} days")
+    archive.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Keyword query planning.
+
+A multi-role search ("Data Engineer, Cloud Engineer, Data Architect") used to
+run one full scrape per phrase and source. Sources with boolean queries can
+cover several phrases in one query instead, and with the page planner
+(plan_requests) one merged query is fetched in far fewer calls than the
+per-phrase queries it replaces:
+
+- JSearch: ``"Data Engineer" OR "Cloud Engineer" -clearance``
+- Adzuna: phrases sharing a head noun become ``what=engineer`` +
+  ``what_or="data cloud"`` (what_or matches any single word), plus
+  ``what_exclude``
+- Indeed / LinkedIn keep one query per phrase (fixed page sizes mean
+  merging would save no calls); Indeed still gets ``-term`` exclusions
+
+Results of a merged query are mapped back to the phrases they match; jobs
+matching none of them (the looser OR query's false positives) are dropped.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple, Union
+
+from src.filters.job_dedup import normalize_text
+
+# Terms excluded from every query: security-clearance roles require US
+# citizenship, so they are never H1B candidates
+DEFAULT_EXCLUDE_TERMS = ("clearance",)
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """One source query covering one or more keyword phrases."""
+
+    keywords: Tuple[str, ...]
+    exclude: Tuple[str, ...] = ()
+
+    @classmethod
+    def of(cls, keywords: Union[str, Sequence[str], "SearchQuery"]) -> "SearchQuery":
+        """A query for one phrase, a list/tuple of phrases, or as-is."""
+        if isinstance(keywords, SearchQuery):
+            return keywords
+        if isinstance(keywords, str):
+            return cls((keywords,))
+        return cls(tuple(keywords))
+
+    @property
+    def merged(self) -> bool:
+        return len(self.keywords) > 1
+
+    def __str__(self) -> str:
+        return ", ".join(self.keywords)
+
+    def matching_keywords(self, job: dict) -> List[str]:
+        """Phrases whose words all appear in the job title (else title + description)."""
+        if not self.merged:
+            return list(self.keywords)
+        title = set(normalize_text(job.get("title")).split())
+        phrases = [(kw, set(normalize_text(kw).split())) for kw in self.keywords]
+        matches = [kw for kw, words in phrases if words <= title]
+        if not matches:
+            text = title | set(normalize_text(job.get("description")).split())
+            matches = [kw for kw, words in phrases if words <= text]
+        return matches
+
+    def assign_keywords(self, jobs: List[dict]) -> List[dict]:
+        """
+        Tag jobs with ``search_keyword`` (first matching phrase) and
+        ``matched_keywords``; drop jobs matching no phrase.
+        """
+        kept = []
+        for job in jobs:
+            matches = self.matching_keywords(job)
+            if not matches:
+                continue
+            job["search_keyword"] = matches[0]
+            job["matched_keywords"] = matches
+            kept.append(job)
+        return kept
+
+
+def _head_word(keyword: str) -> str:
+    words = normalize_text(keyword).split()
+    return words[-1] if words else ""
+
+
+def plan_queries(
+    keyword_list: Union[str, Sequence[str]],
+    scraper,
+    exclude: Sequence[str] = DEFAULT_EXCLUDE_TERMS,
+) -> List[SearchQuery]:
+    """
+    Rewrite a keyword list into the fewest queries ``scraper`` supports,
+    in first-keyword order. Duplicate phrases are collapsed; a single
+    phrase may be passed as a plain string.
+    """
+    if isinstance(keyword_list, str):
+        keyword_list = [keyword_list]
+    keywords: List[str] = []
+    seen = set()
+    for kw in keyword_list:
+        key = normalize_text(kw)
+        if key not in seen:
+            seen.add(key)
+            keywords.append(kw)
+
+    exclude = tuple(exclude)
+    size = max(1, scraper.max_keywords_per_query)
+    if size == 1:
+        return [SearchQuery((kw,), exclude) for kw in keywords]
+
+    groups: Dict[str, List[str]] = {}
+    for kw in keywords:
+        key = _head_word(kw) if scraper.merge_by_head_word else ""
+        groups.setdefault(key, []).append(kw)
+
+    queries = []
+    for group in groups.values():
+        for i in range(0, len(group), size):
+            queries.append(SearchQuery(tuple(group[i : i + size]), exclude))
+    order = {kw: i for i, kw in enumerate(keywords)}
+    queries.sort(key=lambda q: order[q.keywords[0]])
+    return queries
@@ -0,0 +1,251 @@
+"""
+API quota accounting for metered job sources.
+
+JSearch's free tier is 1000 calls/month; nothing used to track that, so a
+single Streamlit click with many keywords and pages could burn a large slice
+of the month. The ledger records every real network call per (source, API
+key, calendar month and day) in a small SQLite file shared by every process,
+and the planner turns the remaining budget into a per-keyword page cap for
+today. When a metered source's budget for the day is spent it is capped or
+skipped, and the pages it gave up go to the unmetered boards (Adzuna,
+Indeed) instead of the run failing with a 429 half-way through the pipeline.
+"""
+
+from __future__ import annotations
+
+import calendar
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.scrapers.response_cache import CACHE_DIR
+
+
+class QuotaExceeded(Exception):
+    """Raised before a call that would exceed a source's monthly quota."""
+
+
+def _key_id(api_key: Optional[str]) -> str:
+    # Never persist the key itself
+    if not api_key:
+        return "anonymous"
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+class QuotaLedger:
+    """
+    Persistent per-key, per-month call counter in SQLite.
+
+    Debits are checked and recorded in one write transaction, so threads and
+    separate processes (CLI and Streamlit sharing CACHE_DIR) never overwrite
+    each other's counts.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else CACHE_DIR / "quota_ledger.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS quota_calls (
+                account TEXT,
+                month TEXT,
+                day TEXT,
+                calls INTEGER,
+                PRIMARY KEY (account, day)
+            )
+            """
+        )
+        self._import_json(self.path.with_suffix(".json"))
+
+    def _import_json(self, legacy: Path):
+        """One-off import of the counts kept by the older JSON ledger."""
+        if legacy == self.path or not legacy.exists():
+            return
+        try:
+            data = json.loads(legacy.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            print(f"⚠️ Could not read quota ledger {legacy}, not importing it")
+            return
+        rows = [
+            (account, month, day, calls)
+            for account, months in data.items()
+            for month, entry in months.items()
+            for day, calls in entry.get("days", {}).items()
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO quota_calls VALUES (?, ?, ?, ?)", rows
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        legacy.replace(legacy.with_suffix(".json.imported"))
+
+    def _month_total(self, account: str, month: str) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(calls), 0) FROM quota_calls "
+            "WHERE account = ? AND month = ?",
+            (account, month),
+        ).fetchone()
+        return row[0]
+
+    def try_debit(
+        self,
+        source: str,
+        api_key: Optional[str],
+        cost: int = 1,
+        monthly_limit: Optional[int] = None,
+        today: Optional[date] = None,
+    ) -> bool:
+        """
+        Atomically record ``cost`` calls. Returns False (and records nothing)
+        if that would take the month past ``monthly_limit``.
+        """
+        today = today or date.today()
+        account = f"{source}:{_key_id(api_key)}"
+        month = today.strftime("%Y-%m")
+        with self._lock:
+            # IMMEDIATE takes the write lock before reading the total, so no
+            # other process can debit between the check and the insert
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if (
+                    monthly_limit is not None
+                    and self._month_total(account, month) + cost > monthly_limit
+                ):
+                    self._conn.execute("ROLLBACK")
+                    return False
+                self._conn.execute(
+                    """
+                    INSERT INTO quota_calls VALUES (?, ?, ?, ?)
+                    ON CONFLICT (account, day) DO UPDATE SET calls = calls + excluded.calls
+                    """,
+                    (account, month, today.isoformat(), cost),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return True
+
+    def used(
+        self, source: str, api_key: Optional[str], today: Optional[date] = None
+    ) -> tuple:
+        """Return (calls this month, calls today)."""
+        today = today or date.today()
+        account = f"{source}:{_key_id(api_key)}"
+        with self._lock:
+            month_total = self._month_total(account, today.strftime("%Y-%m"))
+            row = self._conn.execute(
+                "SELECT calls FROM quota_calls WHERE account = ? AND day = ?",
+                (account, today.isoformat()),
+            ).fetchone()
+        return month_total, row[0] if row else 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class QuotaPlanner:
+    """
+    Spread each metered source's remaining monthly quota evenly over the
+    days left in the month and cap pages per keyword accordingly.
+
+    Pages a metered source gives up are handed to the unmetered sources
+    (up to ``max_pages`` per keyword each, default twice the requested
+    depth), so a spent quota costs coverage rather than results.
+    """
+
+    def __init__(self, ledger: QuotaLedger, max_pages: Optional[int] = None):
+        self.ledger = ledger
+        self.max_pages = max_pages
+
+    def daily_allowance(self, scraper, today: Optional[date] = None) -> Optional[int]:
+        """Calls the scraper may still make today, or None if unmetered."""
+        if not scraper.monthly_quota:
+            return None
+        today = today or date.today()
+        month_used, today_used = self.ledger.used(
+            scraper.name, scraper.quota_key, today
+        )
+        days_in_month = calendar.monthrange(today.year, today.month)[1]
+        days_left = days_in_month - today.day + 1
+        remaining_at_day_start = scraper.monthly_quota - (month_used - today_used)
+        budget_today = math.floor(max(0, remaining_at_day_start) / days_left)
+        return max(0, budget_today - today_used)
+
+    def plan_pages(
+        self,
+        scrapers: List,
+        num_keywords: int,
+        num_pages: int,
+        today: Optional[date] = None,
+        query_sizes: Optional[Dict[str, List[int]]] = None,
+    ) -> Dict[str, int]:
+        """
+        Pages per keyword for each scraper. Metered sources get what
+        today's allowance covers, and drop to 0 (skipped) when it is spent;
+        unmetered ones get ``num_pages`` plus, round-robin, the pages the
+        metered ones gave up.
+
+        ``query_sizes`` gives, per source, the number of keywords each of
+        its (merged) queries covers; by default every keyword is a query.
+        """
+        plan: Dict[str, int] = {}
+        num_keywords = max(1, num_keywords)
+        shortfall = 0
+        for scraper in scrapers:
+            sizes = (query_sizes or {}).get(scraper.name) or [1] * num_keywords
+            allowance = self.daily_allowance(scraper, today)
+            if allowance is None:
+                plan[scraper.name] = num_pages
+                continue
+            # Multi-page calls make cost non-linear in pages; take the
+            # deepest plan whose calls fit today's allowance
+            pages = num_pages
+            while pages > 0 and sum(
+                scraper.plan_cost(size * pages * scraper.page_size) for size in sizes
+            ) > allowance:
+                pages -= 1
+            plan[scraper.name] = pages
+            if pages < num_pages:
+                shortfall += num_pages - pages
+                print(
+                    f"⚠️ {scraper.name} quota: {allowance} call(s) left today, "
+                    f"capping at {pages} page(s) per keyword"
+                )
+
+        self._reallocate(plan, scrapers, shortfall, num_pages)
+        return plan
+
+    def _reallocate(
+        self, plan: Dict[str, int], scrapers: List, shortfall: int, num_pages: int
+    ):
+        """Give ``shortfall`` pages per keyword to the unmetered sources."""
+        free = [s.name for s in scrapers if not s.monthly_quota and plan[s.name] > 0]
+        cap = self.max_pages if self.max_pages is not None else 2 * num_pages
+        moved: Dict[str, int] = {}
+        while shortfall > 0:
+            open_sources = [name for name in free if plan[name] < cap]
+            if not open_sources:
+                break
+            for name in open_sources[:shortfall]:
+                plan[name] += 1
+                moved[name] = moved.get(name, 0) + 1
+                shortfall -= 1
+        if moved:
+            extra = ", ".join(f"{name} +{pages}" for name, pages in moved.items())
+            print(f"↪️  Moving capped pages to unmetered sources: {extra} per keyword")
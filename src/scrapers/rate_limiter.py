@@ -0,0 +1,126 @@
+"""
+Shared per-host rate limiting for the scrapers.
+
+Every scraper acquires a token from its host's bucket before each HTTP call,
+so we run at exactly the allowed rate instead of sleeping a fixed worst-case
+pause after every page. Buckets are process-wide: two scrapers (or two
+threads) talking to the same host share one budget.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    ``rate`` tokens are added per second up to ``burst``. Implemented as a
+    GCRA (virtual scheduling) so waiters are served in arrival order
+    without a background refill thread.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, int(burst))
+        self._interval = 1.0 / rate
+        self._tolerance = (self.burst - 1) * self._interval
+        self._tat = 0.0  # theoretical arrival time of the next token
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, cost: float = 1) -> float:
+        """
+        Reserve ``cost`` tokens (e.g. the LLM tokens a request will use) and
+        return how long the caller must wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            allowed_at = max(tat - self._tolerance, self._blocked_until, now)
+            self._tat = max(tat, allowed_at) + cost * self._interval
+        return allowed_at - now
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now."""
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            if max(tat - self._tolerance, self._blocked_until) > now:
+                return False
+            self._tat = tat + self._interval
+        return True
+
+    def acquire(self, cost: float = 1) -> float:
+        """Block until ``cost`` tokens are available. Returns seconds waited."""
+        wait = self.reserve(cost)
+        if wait > 0:
+            time.sleep(wait)
+        return max(0.0, wait)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for ``seconds`` (e.g. after a 429)."""
+        with self._lock:
+            until = time.monotonic() + max(0.0, seconds)
+            self._blocked_until = max(self._blocked_until, until)
+            self._tat = max(self._tat, self._blocked_until)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP-date) into seconds.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# -------------------------------------------------------------------
+# Process-wide registry of buckets, one per host
+# -------------------------------------------------------------------
+_buckets: Dict[str, TokenBucket] = {}
+_overrides: Dict[str, tuple] = {}
+_registry_lock = threading.Lock()
+
+
+def configure_rate_limit(host: str, rate: float, burst: int = 1):
+    """
+    Override the requests/second and burst for a host.
+
+    Takes precedence over the defaults a scraper declares, and replaces any
+    bucket already created for that host.
+    """
+    with _registry_lock:
+        _overrides[host] = (rate, burst)
+        _buckets[host] = TokenBucket(rate, burst)
+
+
+def get_rate_limiter(host: str, rate: float = 1.0, burst: int = 1) -> TokenBucket:
+    """
+    Return the shared bucket for ``host``, creating it on first use.
+
+    ``rate``/``burst`` are only used when the bucket does not exist yet and
+    no override was configured for the host.
+    """
+    with _registry_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate, burst = _overrides.get(host, (rate, burst))
+            bucket = _buckets[host] = TokenBucket(rate, burst)
+        return bucket
@@ -0,0 +1,138 @@
+"""
+Registry of job-board scrapers.
+
+Each scraper class registers itself with @register_scraper, declaring a
+short key ("jsearch"), a display label and the credentials its constructor
+takes. ScraperManager, the pipeline and the Streamlit source checkboxes all
+work from the registry, so adding a board is one new module:
+
+    @register_scraper("remoteok", label="RemoteOK")
+    class RemoteOKScraper(BaseScraper):
+        ...
+
+Built-in scrapers are imported by load_scrapers(); extra modules (e.g. the
+SCRAPER_PLUGINS setting) are imported the same way and register on import.
+Capabilities (date pushdown, page sizes, rate limits, quota, auth) are read
+from the class attributes BaseScraper already defines.
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.scrapers.base_scraper import BaseScraper
+
+BUILTIN_MODULES = (
+    "src.scrapers.jsearch_scraper",
+    "src.scrapers.indeed_scraper",
+    "src.scrapers.adzuna_scraper",
+    "src.scrapers.linkedin_scraper",
+)
+
+
+@dataclass(frozen=True)
+class ScraperCapabilities:
+    """What the scheduler and planners may assume about a source."""
+
+    date_pushdown: bool
+    sorts_by_date: bool
+    page_size: int
+    max_page_size: Optional[int]
+    max_pages_per_call: int
+    max_keywords_per_query: int
+    requests_per_second: float
+    burst: int
+    max_in_flight: int
+    monthly_quota: Optional[int]
+    auth: Tuple[str, ...]
+
+    @classmethod
+    def of(cls, scraper_cls: type, auth: Tuple[str, ...] = ()) -> "ScraperCapabilities":
+        return cls(
+            date_pushdown=scraper_cls.date_params is not BaseScraper.date_params,
+            sorts_by_date=scraper_cls.sorts_by_date,
+            page_size=scraper_cls.page_size,
+            max_page_size=scraper_cls.max_page_size,
+            max_pages_per_call=scraper_cls.max_pages_per_call,
+            max_keywords_per_query=scraper_cls.max_keywords_per_query,
+            requests_per_second=scraper_cls.requests_per_second,
+            burst=scraper_cls.burst,
+            max_in_flight=scraper_cls.max_in_flight,
+            monthly_quota=scraper_cls.monthly_quota,
+            auth=auth,
+        )
+
+
+@dataclass(frozen=True)
+class ScraperSpec:
+    """
+    A registered source.
+
+    Args:
+        key: Short id used in settings and ``sources`` selections.
+        scraper_cls: BaseScraper subclass.
+        label: Name shown in the UI.
+        auth: Credential names, passed positionally to the constructor.
+        enabled_by_default: Whether a run uses it unless deselected.
+    """
+
+    key: str
+    scraper_cls: type
+    label: str
+    auth: Tuple[str, ...] = ()
+    enabled_by_default: bool = True
+
+    @property
+    def capabilities(self) -> ScraperCapabilities:
+        return ScraperCapabilities.of(self.scraper_cls, self.auth)
+
+    def build(
+        self, credentials: Mapping[str, Optional[str]], **options
+    ) -> Optional[BaseScraper]:
+        """Instantiate the scraper, or None when a credential is missing."""
+        args = [credentials.get(name) for name in self.auth]
+        if not all(args):
+            return None
+        return self.scraper_cls(*args, **options)
+
+
+_registry: Dict[str, ScraperSpec] = {}
+
+
+def register_scraper(
+    key: str,
+    label: Optional[str] = None,
+    auth: Iterable[str] = (),
+    enabled_by_default: bool = True,
+):
+    """Class decorator adding a BaseScraper subclass to the registry."""
+
+    def decorator(cls):
+        if not issubclass(cls, BaseScraper):
+            raise TypeError(f"{cls.__name__} is not a BaseScraper")
+        _registry[key] = ScraperSpec(
+            key, cls, label or cls.name, tuple(auth), enabled_by_default
+        )
+        return cls
+
+    return decorator
+
+
+def load_scrapers(plugins: Iterable[str] = ()) -> List[ScraperSpec]:
+    """
+    Import the built-in scrapers plus ``plugins`` (module paths) and return
+    every registered source, in registration order.
+    """
+    for module in (*BUILTIN_MODULES, *plugins):
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            print(f"⚠️ Could not load scraper module {module}: {e}")
+    return list(_registry.values())
+
+
+def get_scraper_spec(key: str) -> ScraperSpec:
+    load_scrapers()
+    return _registry[key]
@@ -0,0 +1,373 @@
+"""
+Offline record/replay harness for the scrapers.
+
+- CassetteRecorder captures the real responses a scraper receives (with
+  credentials stripped) into one JSON "cassette" per source.
+- StandInServer is a local HTTP server that replays one cassette, with
+  configurable latency, injected errors and a rate limit that answers 429.
+- ReplayHarness starts one stand-in per cassette (one port per source, so
+  per-host rate limiters and circuit breakers behave as they do live) and
+  points scrapers at them.
+
+This gives a reproducible way to exercise ScraperManager and benchmark
+throughput/concurrency changes with no network access.
+
+Usage:
+    python -m src.scrapers.replay record --keywords "Data Engineer" --pages 2
+    python -m src.scrapers.replay serve --latency 0.3 --error-rate 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+from src.scrapers.response_cache import SECRET_PARAMS
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CASSETTE_DIR = PROJECT_ROOT / "tests" / "cassettes"
+
+# Query params that select the page; they must match for a replay hit.
+# (Request headers, which carry the RapidAPI key, are never recorded.)
+_PAGE_PARAMS = {"page", "start"}
+
+
+def _split_query(url: str, params: Optional[dict] = None) -> tuple:
+    """Return (path, {param: value}) without credentials."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.update({k: str(v) for k, v in (params or {}).items() if v is not None})
+    query = {k: v for k, v in query.items() if k.lower() not in SECRET_PARAMS}
+    return parts.path or "/", query
+
+
+def load_cassette(path: Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+# -------------------------------------------------------------------
+# Recording
+# -------------------------------------------------------------------
+class CassetteRecorder:
+    """
+    Collects responses per source. Attach with ``scraper.recorder = rec``;
+    BaseScraper._send reports every final network response to it.
+    """
+
+    def __init__(self):
+        self._cassettes: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        source: str,
+        url: str,
+        params: Optional[dict],
+        response: requests.Response,
+    ):
+        path, query = _split_query(url, params)
+        interaction = {
+            "request": {"path": path, "query": query},
+            "response": {
+                "status": response.status_code,
+                "headers": {
+                    "Content-Type": response.headers.get(
+                        "Content-Type", "application/octet-stream"
+                    )
+                },
+                "body": response.text,
+            },
+        }
+        with self._lock:
+            cassette = self._cassettes.setdefault(
+                source,
+                {"source": source, "host": urlsplit(url).netloc, "interactions": []},
+            )
+            cassette["interactions"].append(interaction)
+
+    def save(self, out_dir: Path = CASSETTE_DIR) -> List[Path]:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        with self._lock:
+            for source, cassette in self._cassettes.items():
+                path = out_dir / f"{source.lower()}.json"
+                path.write_text(
+                    json.dumps(cassette, indent=2, ensure_ascii=False),
+                    encoding="utf-8",
+                )
+                paths.append(path)
+        return paths
+
+
+# -------------------------------------------------------------------
+# Replay
+# -------------------------------------------------------------------
+class StandInServer:
+    """
+    Local HTTP server replaying one cassette.
+
+    Args:
+        cassette: Loaded cassette dict.
+        latency: Seconds added to every response.
+        latency_jitter: Extra uniform random latency (0..jitter seconds).
+        error_rate: Probability of answering 500 instead of the recording.
+        rate_limit: Requests/second allowed before answering 429
+            (with Retry-After). None disables it.
+        seed: Seed for the error/latency randomness.
+    """
+
+    def __init__(
+        self,
+        cassette: dict,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        seed: Optional[int] = None,
+    ):
+        self.cassette = cassette
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.stats = {"served": 0, "errors": 0, "throttled": 0, "misses": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = rate_limit or 0.0
+        self._last_refill = time.monotonic()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def source(self) -> str:
+        return self.cassette.get("source", "")
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self._httpd.server_address[1]}"
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}"
+
+    def start(self) -> "StandInServer":
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _allow(self) -> bool:
+        if not self.rate_limit:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.rate_limit,
+                self._tokens + (now - self._last_refill) * self.rate_limit,
+            )
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def _find(self, path: str, query: dict) -> Optional[dict]:
+        """Exact match first, else same path + page with the most params in common."""
+        best, best_score = None, -1
+        for interaction in self.cassette.get("interactions", []):
+            request = interaction["request"]
+            if request["path"] != path:
+                continue
+            recorded = request["query"]
+            if recorded == query:
+                return interaction
+            if any(recorded.get(k) != query.get(k) for k in _PAGE_PARAMS):
+                continue
+            score = sum(1 for k, v in recorded.items() if query.get(k) == v)
+            if score > best_score:
+                best, best_score = interaction, score
+        return best
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        delay = self.latency + self._random.uniform(0, self.latency_jitter)
+        if delay:
+            time.sleep(delay)
+
+        if not self._allow():
+            with self._lock:
+                self.stats["throttled"] += 1
+            self._send(handler, 429, {"Retry-After": "1"}, b'{"message": "Too many requests"}')
+            return
+
+        with self._lock:
+            inject_error = self._random.random() < self.error_rate
+        if inject_error:
+            with self._lock:
+                self.stats["errors"] += 1
+            self._send(handler, 500, {}, b'{"message": "Injected error"}')
+            return
+
+        path, query = _split_query(handler.path)
+        interaction = self._find(path, query)
+        if interaction is None:
+            with self._lock:
+                self.stats["misses"] += 1
+            self._send(handler, 404, {}, b'{"message": "No recording"}')
+            return
+
+        response = interaction["response"]
+        with self._lock:
+            self.stats["served"] += 1
+        self._send(
+            handler,
+            response["status"],
+            response.get("headers", {}),
+            response["body"].encode("utf-8"),
+        )
+
+    @staticmethod
+    def _send(handler, status: int, headers: dict, body: bytes):
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+
+class ReplayHarness:
+    """
+    One StandInServer per cassette in ``cassette_dir``; server options
+    (latency, error_rate, rate_limit, ...) apply to all of them.
+    """
+
+    def __init__(self, cassette_dir: Path = CASSETTE_DIR, **server_options):
+        self.cassette_dir = Path(cassette_dir)
+        self.server_options = server_options
+        self.servers: Dict[str, StandInServer] = {}
+
+    def start(self) -> "ReplayHarness":
+        for path in sorted(self.cassette_dir.glob("*.json")):
+            server = StandInServer(load_cassette(path), **self.server_options).start()
+            self.servers[server.source] = server
+        return self
+
+    def stop(self):
+        for server in self.servers.values():
+            server.stop()
+        self.servers.clear()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def attach(self, scraper) -> bool:
+        """Point a scraper at its stand-in. Returns False if no cassette."""
+        server = self.servers.get(scraper.name)
+        if server is None:
+            return False
+        scraper.base_url = server.base_url + urlsplit(scraper.base_url).path
+        return True
+
+    def attach_manager(self, manager):
+        for scraper in manager.scrapers.values():
+            self.attach(scraper)
+
+
+# -------------------------------------------------------------------
+# CLI
+# -------------------------------------------------------------------
+def _record(args):
+    from config.settings import SCRAPER_CREDENTIALS
+    from src.scrapers.registry import load_scrapers
+
+    recorder = CassetteRecorder()
+    scrapers = [
+        scraper
+        for spec in load_scrapers()
+        if (scraper := spec.build(SCRAPER_CREDENTIALS)) is not None
+    ]
+    for scraper in scrapers:
+        scraper.recorder = recorder
+        print(f"\n🎙️  Recording {scraper.name}...")
+        scraper.search_jobs(args.keywords, args.location, args.pages)
+    for path in recorder.save(args.out):
+        print(f"✅ Saved {path}")
+
+
+def _serve(args):
+    harness = ReplayHarness(
+        args.cassettes,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+    ).start()
+    for source, server in harness.servers.items():
+        print(f"🟢 {source:<10} {server.base_url}")
+    print("Press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        harness.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper record/replay harness")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Record live responses into cassettes")
+    rec.add_argument("--keywords", default="Data Engineer")
+    rec.add_argument("--location", default="United States")
+    rec.add_argument("--pages", type=int, default=2)
+    rec.add_argument("--out", type=Path, default=CASSETTE_DIR)
+    rec.set_defaults(func=_record)
+
+    srv = sub.add_parser("serve", help="Serve cassettes from local stand-ins")
+    srv.add_argument("--cassettes", type=Path, default=CASSETTE_DIR)
+    srv.add_argument("--latency", type=float, default=0.0)
+    srv.add_argument("--error-rate", type=float, default=0.0)
+    srv.add_argument("--rate-limit", type=float, default=None)
+    srv.set_defaults(func=_serve)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Retries and circuit breaking for scraper HTTP calls.
+
+Transient failures (timeouts, connection resets, 5xx, 429) are retried a
+bounded number of times with jittered exponential backoff, so a slow board
+keeps its recall. Repeated failures against one host open that host's
+circuit breaker: further calls fail fast for a cool-down period instead of
+each waiting out a full timeout, then a single trial call decides whether
+the host is back.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict
+
+# HTTP statuses worth retrying
+TRANSIENT_STATUSES = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+
+class ScrapeStopped(Exception):
+    """Raised instead of sending a request for a scrape that was stopped."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 20.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given 0-based attempt."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Classic closed / open / half-open breaker (thread-safe).
+
+    Opens after ``failure_threshold`` consecutive failures, rejects calls for
+    ``cooldown`` seconds, then lets one trial call through: success closes
+    it, failure re-opens it for another cool-down.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 120.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.cooldown:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half-open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release(self):
+        """End a half-open trial that produced no verdict (breaker stays half-open)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+# -------------------------------------------------------------------
+# Process-wide registry of breakers, one per host
+# -------------------------------------------------------------------
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(
+    host: str, failure_threshold: int = 5, cooldown: float = 120.0
+) -> CircuitBreaker:
+    """Return the shared breaker for ``host``, creating it on first use."""
+    with _registry_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(failure_threshold, cooldown)
+        return breaker
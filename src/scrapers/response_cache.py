@@ -0,0 +1,202 @@
+"""
+Persistent on-disk cache for scraper HTTP responses.
+
+Pages are keyed by (source, URL, normalized query params) - the page number
+is part of either the URL or the params - and stored in a small SQLite file.
+Fresh entries (younger than the scraper's ``cache_ttl``) are served without
+touching the network; stale entries that carried an ETag or Last-Modified
+header are revalidated with a conditional request. The file is kept under a
+byte budget by evicting least-recently-used entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = PROJECT_ROOT / ".scraper_cache"
+
+# Query params that carry credentials; never part of the cache key
+SECRET_PARAMS = {"app_id", "app_key", "api_key", "apikey", "key", "token"}
+
+# Response headers worth keeping with the (already decoded) body
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for revalidating this entry (If-None-Match / If-Modified-Since)."""
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def to_response(self, url: str) -> requests.Response:
+        """Rebuild a requests.Response so scrapers can't tell it was cached."""
+        response = requests.Response()
+        response.status_code = self.status
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(
+            response.headers
+        )
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """SQLite-backed, size-bounded HTTP response cache (thread-safe)."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_bytes: int = 200 * 1024 * 1024,
+    ):
+        self.path = Path(path) if path else CACHE_DIR / "responses.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                source TEXT,
+                url TEXT,
+                status INTEGER,
+                headers TEXT,
+                body BLOB,
+                fetched_at REAL,
+                last_access REAL,
+                size INTEGER
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_access "
+            "ON responses (last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(source: str, url: str, params: Optional[dict] = None) -> str:
+        """
+        Stable key for (source, url, normalized params).
+
+        Param names are lower-cased, values stripped, credentials dropped and
+        the result sorted, so equivalent queries share one entry.
+        """
+        normalized = sorted(
+            (str(k).lower(), str(v).strip())
+            for k, v in (params or {}).items()
+            if v is not None and str(k).lower() not in SECRET_PARAMS
+        )
+        raw = json.dumps([source, url, normalized], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+        status, headers, body, fetched_at = row
+        return CachedResponse(status, json.loads(headers), body, fetched_at)
+
+    def put(self, key: str, source: str, url: str, response: requests.Response):
+        """Store a 200 response body with its validators."""
+        body = response.content
+        headers = {
+            name: response.headers[name]
+            for name in _KEPT_HEADERS
+            if name in response.headers
+        }
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, source, url, status, headers, body, fetched_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    source,
+                    url,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, key: str):
+        """Mark an entry fresh again (after a 304 Not Modified)."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, last_access = ? WHERE key = ?",
+                (now, now, key),
+            )
+            self._conn.commit()
+
+    def clear(self, source: Optional[str] = None):
+        with self._lock:
+            if source:
+                self._conn.execute("DELETE FROM responses WHERE source = ?", (source,))
+            else:
+                self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least-recently-used entries until under max_bytes (lock held)."""
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -1,13 +1,30 @@
 """
 Orchestrates all job scrapers
+
+Sources come from the scraper registry (see registry.py): every registered
+scraper whose credentials are available is built once per manager, and runs
+pick a subset of them by key.
 """
 
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Iterable, Iterator, Mapping, Optional, List, Sequence, Tuple, Union
 
-from src.scrapers.jsearch_scraper import JSearchScraper
-from src.scrapers.indeed_scraper import IndeedScraper
-from src.scrapers.adzuna_scraper import AdzunaScraper
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.query_planner import (
+    DEFAULT_EXCLUDE_TERMS,
+    SearchQuery,
+    plan_queries,
+)
+from src.scrapers.page_archive import PageArchive
+from src.scrapers.quota import QuotaLedger, QuotaPlanner
+from src.scrapers.registry import ScraperSpec, load_scrapers
+from src.scrapers.response_cache import ResponseCache
+from src.scrapers.seen_store import SeenJobsStore
+from src.scrapers.yield_controller import YieldController
 
 
 class ScraperManager:
@@ -16,61 +33,421 @@ class ScraperManager:
         rapidapi_key: Optional[str] = None,
         adzuna_app_id: Optional[str] = None,
         adzuna_app_key: Optional[str] = None,
+        max_workers: int = 8,
+        session_options: Optional[dict] = None,
+        cache: Optional[ResponseCache] = None,
+        quota_ledger: Optional[QuotaLedger] = None,
+        exclude_terms: Optional[List[str]] = None,
+        source_options: Optional[Mapping[str, dict]] = None,
+        archive: Optional[PageArchive] = None,
+        yield_controller: Optional[YieldController] = None,
+        credentials: Optional[Mapping[str, Optional[str]]] = None,
+        plugins: Iterable[str] = (),
     ):
-        # JSearch via RapidAPI
-        self.jsearch = JSearchScraper(rapidapi_key) if rapidapi_key else None
-        # Indeed HTML scraper (no key needed)
-        self.indeed = IndeedScraper()
-        # Adzuna API
-        self.adzuna = (
-            AdzunaScraper(adzuna_app_id, adzuna_app_key)
-            if adzuna_app_id and adzuna_app_key
-            else None
+        # Pool size / timeouts for each scraper's keep-alive HTTP session,
+        # plus the (optional) shared response cache, quota ledger and raw
+        # page archive
+        scraper_options = {
+            **(session_options or {}),
+            "cache": cache,
+            "quota_ledger": quota_ledger,
+            "archive": archive,
+        }
+        # Credentials by the names scrapers declare in register_scraper
+        credentials = {
+            "rapidapi_key": rapidapi_key,
+            "adzuna_app_id": adzuna_app_id,
+            "adzuna_app_key": adzuna_app_key,
+            **(credentials or {}),
+        }
+
+        # Every registered source, and an instance of each one whose
+        # credentials are present; source_options holds per-source
+        # constructor options keyed by source key (e.g. Indeed's
+        # fetch_details / parser_backend)
+        self.specs: Dict[str, ScraperSpec] = {
+            spec.key: spec for spec in load_scrapers(plugins)
+        }
+        self.scrapers: Dict[str, BaseScraper] = {}
+        for key, spec in self.specs.items():
+            options = {**(source_options or {}).get(key, {}), **scraper_options}
+            scraper = spec.build(credentials, **options)
+            if scraper is not None:
+                self.scrapers[key] = scraper
+
+        # Upper bound on threads used by concurrent scrapes
+        self.max_workers = max_workers
+        # Caps pages of metered sources (JSearch) to the remaining quota
+        self.planner = QuotaPlanner(quota_ledger) if quota_ledger else None
+        # Terms every source query excludes where the source supports it
+        self.exclude_terms = (
+            list(DEFAULT_EXCLUDE_TERMS) if exclude_terms is None else exclude_terms
         )
+        # Optional marginal-yield page depth control (see yield_controller.py)
+        self.yield_controller = yield_controller
+        # Per-source completeness of the last concurrent scrape (_run_tasks)
+        self.last_report: Dict[str, dict] = {}
+
+    def get(self, key: str) -> Optional[BaseScraper]:
+        """The configured scraper for a source key, if any"""
+        return self.scrapers.get(key)
+
+    def close(self):
+        """Close the pooled HTTP sessions of all scrapers"""
+        for scraper in self.scrapers.values():
+            scraper.close()
+
+    def _active_scrapers(self, sources: Optional[Iterable[str]] = None) -> list:
+        """
+        Return the scrapers selected for this run, in registry order.
+        ``sources`` lists source keys; by default every configured source
+        that is enabled by default.
+        """
+        if sources is None:
+            selected = {k for k, spec in self.specs.items() if spec.enabled_by_default}
+        else:
+            selected = set(sources)
+
+        scrapers = []
+        for key, spec in self.specs.items():
+            if key not in selected:
+                continue
+            if key in self.scrapers:
+                scrapers.append(self.scrapers[key])
+            else:
+                print(
+                    f"⚠️ No credentials for {spec.label} "
+                    f"({', '.join(spec.auth)}), skipping"
+                )
+        unknown = selected - set(self.specs)
+        if unknown:
+            print(f"⚠️ Unknown source(s): {', '.join(sorted(unknown))}")
+        return scrapers
+
+    def plan_tasks(
+        self,
+        keyword_list: List[str],
+        num_pages: int = 3,
+        sources: Optional[Iterable[str]] = None,
+    ) -> List[tuple]:
+        """
+        (query, scraper, max_results) tasks a scrape of ``keyword_list``
+        would run, in the order the serial scrape runs them.
+        """
+        return self._plan_tasks(self._active_scrapers(sources), keyword_list, num_pages)
+
+    def _plan_tasks(
+        self, scrapers: list, keyword_list: List[str], num_pages: int
+    ) -> List[tuple]:
+        """
+        (query, scraper, max_results) tasks for this run.
+
+        Each source's keyword list is rewritten into the fewest queries it
+        supports (see query_planner); a query covering k phrases fetches k
+        phrases' worth of results. Without a quota ledger every source gets
+        num_pages per phrase; otherwise metered sources are capped to
+        today's allowance and dropped when it is spent. Tasks are ordered by
+        first keyword, then source.
+        """
+        queries = {
+            scraper.name: plan_queries(keyword_list, scraper, self.exclude_terms)
+            for scraper in scrapers
+        }
+        if self.planner:
+            pages = self.planner.plan_pages(
+                scrapers,
+                len(keyword_list),
+                num_pages,
+                query_sizes={
+                    name: [len(q.keywords) for q in source_queries]
+                    for name, source_queries in queries.items()
+                },
+            )
+        else:
+            pages = {scraper.name: num_pages for scraper in scrapers}
+
+        tasks = [
+            (
+                query,
+                scraper,
+                len(query.keywords) * pages[scraper.name] * scraper.page_size,
+            )
+            for scraper in scrapers
+            if pages[scraper.name] > 0
+            for query in queries[scraper.name]
+        ]
+        order = {kw: i for i, kw in enumerate(keyword_list)}
+        tasks.sort(key=lambda task: order[task[0].keywords[0]])
+        return tasks
 
     def scrape_all(
         self,
-        keywords: str,
+        keywords: Union[str, Sequence[str]],
         location: str,
         num_pages: int = 3,
         posted_after: Optional[datetime] = None,
-        use_jsearch: bool = True,
-        use_indeed: bool = True,
-        use_adzuna: bool = True,
+        sources: Optional[Iterable[str]] = None,
+        concurrent: bool = False,
+        seen_store: Optional[SeenJobsStore] = None,
+        deadline: Optional[float] = None,
     ) -> List[dict]:
         """
-        Scrape from all available sources.
+        Scrape from all available sources (or the ``sources`` keys given).
+
+        ``keywords`` is one phrase or a list/tuple of phrases (e.g. the
+        JOB_KEYWORDS setting). With concurrent=True (implied by a ``deadline``) the sources are
+        scraped in parallel (see scrape_keywords). Passing a seen_store makes
+        the scrape incremental (only postings not seen in earlier runs are
+        returned); call ``seen_store.commit(jobs)`` once they are processed.
         """
+        keyword_list = [keywords] if isinstance(keywords, str) else list(keywords)
+        if concurrent or deadline is not None:
+            return self.scrape_keywords(
+                keyword_list,
+                location,
+                num_pages,
+                posted_after=posted_after,
+                sources=sources,
+                seen_store=seen_store,
+                deadline=deadline,
+            )
+
         all_jobs: List[dict] = []
 
-        # JSearch
-        if self.jsearch and use_jsearch:
-            print(f"\n🔍 Scraping JSearch for: '{keywords}' in '{location}'")
-            jsearch_jobs = self.jsearch.search_jobs(
-                keywords, location, num_pages, posted_after=posted_after
-            )
-            all_jobs.extend(jsearch_jobs)
-            print(f"✅ Total from JSearch: {len(jsearch_jobs)} jobs\n")
-        elif not self.jsearch:
-            print("⚠️ No RapidAPI key provided, skipping JSearch")
-
-        # Indeed
-        if self.indeed and use_indeed:
-            print(f"\n🔍 Scraping Indeed for: '{keywords}' in '{location}'")
-            indeed_jobs = self.indeed.search_jobs(
-                keywords, location, num_pages, posted_after=posted_after
-            )
-            all_jobs.extend(indeed_jobs)
-            print(f"✅ Total from Indeed: {len(indeed_jobs)} jobs\n")
-
-        # Adzuna
-        if self.adzuna and use_adzuna:
-            print(f"\n🔍 Scraping Adzuna for: '{keywords}' in '{location}'")
-            adzuna_jobs = self.adzuna.search_jobs(
-                keywords, location, num_pages, posted_after=posted_after
+        tasks = self.plan_tasks(keyword_list, num_pages, sources)
+        if self.yield_controller:
+            self.yield_controller.reset_run()
+        for query, scraper, max_results in tasks:
+            print(f"\n🔍 Scraping {scraper.name} for: '{query}' in '{location}'")
+            source_jobs = scraper.search_jobs(
+                query,
+                location,
+                posted_after=posted_after,
+                seen_store=seen_store,
+                max_results=max_results,
+                yield_controller=self.yield_controller,
             )
-            all_jobs.extend(adzuna_jobs)
-            print(f"✅ Total from Adzuna: {len(adzuna_jobs)} jobs\n")
+            all_jobs.extend(source_jobs)
+            print(f"✅ Total from {scraper.name}: {len(source_jobs)} jobs\n")
 
         print(f"📊 Combined total: {len(all_jobs)} jobs")
         return all_jobs
+
+    def scrape_keywords(
+        self,
+        keyword_list: List[str],
+        location: str,
+        num_pages: int = 3,
+        posted_after: Optional[datetime] = None,
+        sources: Optional[Iterable[str]] = None,
+        seen_store: Optional[SeenJobsStore] = None,
+        deadline: Optional[float] = None,
+    ) -> List[dict]:
+        """
+        Concurrently scrape every (query, source) pair.
+
+        Keywords are first merged into per-source queries where the source
+        supports it (see plan_tasks). Each pair paginates on its own
+        worker thread. Politeness is still
+        enforced per source: a scraper never has more than its
+        ``max_in_flight`` pages outstanding and every request still goes
+        through the host's rate limiter, so only pages of *different* sources
+        (or different keywords of a source that allows it) overlap.
+
+        Results are merged in keyword-by-keyword, source-by-source order,
+        and each job is tagged with the ``search_keyword`` (and all
+        ``matched_keywords``) it was found for.
+
+        With a ``deadline`` (seconds) whatever arrived in time is returned;
+        ``last_report`` says how complete each source was.
+        """
+        tasks = self.plan_tasks(keyword_list, num_pages, sources)
+
+        per_task: List[List[dict]] = [[] for _ in tasks]
+        for idx, page_jobs in self._run_tasks(
+            tasks, location, posted_after, seen_store, deadline
+        ):
+            per_task[idx].extend(page_jobs)
+
+        all_jobs = [job for task_jobs in per_task for job in task_jobs]
+        print(f"📊 Combined total: {len(all_jobs)} jobs")
+        return all_jobs
+
+    def iter_scrape(
+        self,
+        keyword_list: List[str],
+        location: str,
+        num_pages: int = 3,
+        posted_after: Optional[datetime] = None,
+        sources: Optional[Iterable[str]] = None,
+        seen_store: Optional[SeenJobsStore] = None,
+        deadline: Optional[float] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Streaming variant of scrape_keywords.
+
+        Yields each page's jobs the moment any source finishes parsing it
+        (in arrival order, not serial order), so callers can filter and score
+        page 1 while later pages are still downloading. Closing the generator
+        early stops the workers before their next request, as does reaching
+        the ``deadline`` (seconds).
+        """
+        tasks = self.plan_tasks(keyword_list, num_pages, sources)
+
+        total = 0
+        for _, page_jobs in self._run_tasks(
+            tasks, location, posted_after, seen_store, deadline
+        ):
+            total += len(page_jobs)
+            yield page_jobs
+        print(f"📊 Combined total: {total} jobs")
+
+    def _run_tasks(
+        self,
+        tasks: List[tuple],
+        location: str,
+        posted_after: Optional[datetime],
+        seen_store: Optional[SeenJobsStore],
+        deadline: Optional[float] = None,
+    ) -> Iterator[Tuple[int, List[dict]]]:
+        """
+        Run (query, scraper, max_results) tasks on a bounded thread pool
+        and yield (task index, page jobs) as pages complete.
+
+        After ``deadline`` seconds the remaining pages are abandoned: workers
+        send no further request (not even a retry) and queued tasks never
+        start. The
+        per-source completeness of the run is kept in ``last_report``.
+        """
+        self.last_report = {}
+        if not tasks:
+            return
+
+        keywords = {kw for query, _, _ in tasks for kw in query.keywords}
+        sources = {scraper.name for _, scraper, _ in tasks}
+        print(
+            f"\n🔍 Scraping {len(sources)} source(s) x {len(keywords)} "
+            f"keyword(s) in {len(tasks)} queries concurrently"
+        )
+
+        report = self.last_report
+        hedged_before = {}
+        for _, scraper, _ in tasks:
+            entry = report.setdefault(
+                scraper.name,
+                {
+                    "queries": 0,
+                    "completed": 0,
+                    "failed": 0,
+                    "unfinished": 0,
+                    "pages": 0,
+                    "jobs": 0,
+                    "hedged": 0,
+                    "stopped_early": 0,
+                    "skipped_calls": 0,
+                },
+            )
+            entry["queries"] += 1
+            hedged_before[scraper.name] = scraper.hedged
+
+        # Reserve every query's planned calls before any worker starts, so
+        # only calls left unused by finished queries are handed out again
+        controller = self.yield_controller
+        if controller:
+            controller.reset_run()
+            for query, scraper, max_results in tasks:
+                controller.register(scraper.name, query, scraper.plan_cost(max_results))
+
+        results: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        # Set by each worker just before it reports completion
+        outcome: List[Optional[str]] = [None] * len(tasks)
+
+        def worker(idx: int, query: SearchQuery, scraper, max_results: int):
+            count = 0
+            try:
+                for page_jobs in scraper.iter_search(
+                    query,
+                    location,
+                    posted_after=posted_after,
+                    seen_store=seen_store,
+                    max_results=max_results,
+                    yield_controller=controller,
+                    stop=stop,
+                ):
+                    count += len(page_jobs)
+                    results.put((idx, page_jobs))
+                outcome[idx] = "completed"
+                print(f"✅ {scraper.name} '{query}': {count} jobs")
+            except Exception as e:
+                outcome[idx] = "failed"
+                print(f"❌ {scraper.name} failed for '{query}': {e}")
+            finally:
+                results.put((idx, None))
+
+        end = time.monotonic() + deadline if deadline is not None else None
+        finished = [False] * len(tasks)
+        workers = max(1, min(self.max_workers, len(tasks)))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for idx, (query, scraper, max_results) in enumerate(tasks):
+                pool.submit(worker, idx, query, scraper, max_results)
+
+            pending = len(tasks)
+            while pending:
+                timeout = None if end is None else max(0.0, end - time.monotonic())
+                try:
+                    idx, page_jobs = results.get(timeout=timeout)
+                except queue.Empty:
+                    print(
+                        f"⏰ Scrape deadline of {deadline:.0f}s reached, "
+                        "returning partial results"
+                    )
+                    break
+                entry = report[tasks[idx][1].name]
+                if page_jobs is None:
+                    pending -= 1
+                    finished[idx] = True
+                    entry[outcome[idx] or "failed"] += 1
+                    continue
+                entry["pages"] += 1
+                entry["jobs"] += len(page_jobs)
+                yield idx, page_jobs
+        finally:
+            stop.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            for idx, (_, scraper, _) in enumerate(tasks):
+                if not finished[idx]:
+                    report[scraper.name]["unfinished"] += 1
+                report[scraper.name]["hedged"] = (
+                    scraper.hedged - hedged_before[scraper.name]
+                )
+            if controller:
+                for name, (queries, units) in controller.stopped_early().items():
+                    if name in report:
+                        report[name]["stopped_early"] = queries
+                        report[name]["skipped_calls"] = units
+            self._print_report()
+
+    def _print_report(self):
+        """One line per source: queries finished, pages and jobs received."""
+        print("📋 Source completeness:")
+        for name, entry in self.last_report.items():
+            complete = entry["completed"] == entry["queries"]
+            line = (
+                f"  {'✅' if complete else '⚠️ '} {name}: {entry['completed']}/"
+                f"{entry['queries']} queries, {entry['pages']} pages, "
+                f"{entry['jobs']} jobs"
+            )
+            if entry["failed"]:
+                line += f", {entry['failed']} failed"
+            if entry["unfinished"]:
+                line += f", {entry['unfinished']} cut off"
+            if entry["hedged"]:
+                line += f", {entry['hedged']} hedged requests"
+            if entry["stopped_early"]:
+                line += (
+                    f", {entry['stopped_early']} stopped early by adaptive paging "
+                    f"({entry['skipped_calls']} planned calls skipped)"
+                )
+            print(line)
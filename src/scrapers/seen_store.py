@@ -0,0 +1,151 @@
+"""
+Persisted memory of jobs we have already scraped.
+
+Used for incremental runs: scrapers skip postings whose key (fingerprint
+plus source job id or canonical URL, so a new requisition with the same
+title, company and location still counts as new) is already known and stop paginating once a page brings nothing new, so a daily
+run only pays API and LLM calls for the daily delta. A per-(source, query)
+watermark remembers the newest ``posted_at`` seen, which lets a page made
+only of older postings end pagination too.
+
+Scraping only reads the store: seen fingerprints and watermark advances are
+committed by the caller (``commit``) once the run has processed and saved
+its jobs, so a run that dies midway scrapes the same postings again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from src.filters.job_dedup import canonicalize_url, job_fingerprint
+from src.scrapers.response_cache import CACHE_DIR
+
+
+def seen_key(job: dict) -> str:
+    """Fingerprint of a posting plus its source job id (or canonical URL)."""
+    job_id = str(job.get("id") or "").strip()
+    if job_id:
+        identity = f"{job.get('source')}:{job_id}"
+    else:
+        identity = canonicalize_url(job.get("url"))
+    raw = f"{job_fingerprint(job)}|{identity}"
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class SeenJobsStore:
+    """SQLite store of job fingerprints and per-query watermarks (thread-safe)."""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else CACHE_DIR / "seen_jobs.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending_watermarks: Dict[Tuple[str, str], datetime] = {}
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                fingerprint TEXT PRIMARY KEY,
+                source TEXT,
+                first_seen TEXT,
+                last_seen TEXT
+            );
+            CREATE TABLE IF NOT EXISTS watermarks (
+                source TEXT,
+                query TEXT,
+                last_posted_at TEXT,
+                updated_at TEXT,
+                PRIMARY KEY (source, query)
+            );
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def query_key(keywords: Union[str, Sequence[str]], location: str) -> str:
+        """Watermark key; a keyword list counts as its comma-joined phrases."""
+        if not isinstance(keywords, str):
+            keywords = ", ".join(str(k).strip() for k in keywords)
+        return f"{keywords.strip().lower()}|{(location or '').strip().lower()}"
+
+    def filter_new(self, jobs: List[dict]) -> List[dict]:
+        """Return the jobs whose fingerprint has never been recorded."""
+        if not jobs:
+            return []
+        fingerprints = [seen_key(job) for job in jobs]
+        with self._lock:
+            known = set()
+            unique = list(set(fingerprints))
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(unique), 500):
+                chunk = unique[i : i + 500]
+                rows = self._conn.execute(
+                    "SELECT fingerprint FROM seen_jobs WHERE fingerprint IN "
+                    f"({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                known.update(row[0] for row in rows)
+        return [job for job, fp in zip(jobs, fingerprints) if fp not in known]
+
+    def mark_seen(self, jobs: Iterable[dict]):
+        now = datetime.utcnow().isoformat(timespec="seconds")
+        rows = [(seen_key(job), job.get("source"), now, now) for job in jobs]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO seen_jobs (fingerprint, source, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(fingerprint) DO UPDATE SET last_seen = excluded.last_seen",
+                rows,
+            )
+            self._conn.commit()
+
+    def get_watermark(self, source: str, query: str) -> Optional[datetime]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_posted_at FROM watermarks WHERE source = ? AND query = ?",
+                (source, query),
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def update_watermark(self, source: str, query: str, posted_at: datetime):
+        """Advance the watermark (never moves it backwards)."""
+        current = self.get_watermark(source, query)
+        if current and current >= posted_at:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks "
+                "(source, query, last_posted_at, updated_at) VALUES (?, ?, ?, ?)",
+                (
+                    source,
+                    query,
+                    posted_at.isoformat(),
+                    datetime.utcnow().isoformat(timespec="seconds"),
+                ),
+            )
+            self._conn.commit()
+
+    def stage_watermark(self, source: str, query: str, posted_at: datetime):
+        """Hold a watermark advance until the next commit()."""
+        with self._lock:
+            current = self._pending_watermarks.get((source, query))
+            if current is None or posted_at > current:
+                self._pending_watermarks[(source, query)] = posted_at
+
+    def commit(self, jobs: Iterable[dict]):
+        """Record ``jobs`` as seen and apply the staged watermarks."""
+        self.mark_seen(jobs)
+        with self._lock:
+            pending, self._pending_watermarks = self._pending_watermarks, {}
+        for (source, query), posted_at in pending.items():
+            self.update_watermark(source, query, posted_at)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
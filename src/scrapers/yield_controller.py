@@ -0,0 +1,228 @@
+"""
+Adaptive page depth driven by marginal yield.
+
+A flat ``num_pages`` spends as many calls on a query whose page 3 is all
+duplicates as on one still turning up fresh, eligible, well-matched jobs.
+YieldController decides page by page instead:
+
+- the value of a page is its expected number of good jobs: new unique
+  postings (not already found this run under another keyword or source)
+  x the query's historical H1B pass rate x its historical match rate
+- a (source, query) stops paginating once that value drops below
+  ``min_yield``
+- the calls a query did not use go back to its source's pool, and queries
+  still above the threshold when their own plan runs out may continue from
+  that pool (up to ``max_extension`` times their plan)
+
+Pass and match rates are learned per (source, keyword) from the pipeline's
+outcomes (record_outcomes) and persisted in SQLite, smoothed towards a
+prior so new keywords start out neutral.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.filters.job_dedup import job_fingerprint
+from src.scrapers.response_cache import CACHE_DIR
+
+# Beta prior (rate, weight in pseudo-jobs) for keywords with little history
+PRIOR_ELIGIBLE = (0.5, 10)
+PRIOR_MATCH = (0.3, 10)
+
+
+class YieldController:
+    """Per-run page budget plus persisted per-(source, keyword) rates."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        min_yield: float = 0.5,
+        max_extension: float = 1.0,
+    ):
+        self.path = Path(path) if path else CACHE_DIR / "yield_stats.sqlite3"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.min_yield = min_yield
+        self.max_extension = max_extension
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS yield_stats (
+                source TEXT,
+                keyword TEXT,
+                scraped INTEGER DEFAULT 0,
+                eligible INTEGER DEFAULT 0,
+                matched INTEGER DEFAULT 0,
+                updated_at TEXT,
+                PRIMARY KEY (source, keyword)
+            )
+            """
+        )
+        self._conn.commit()
+        self._rates = self._load_rates()
+        self.reset_run()
+
+    # --- per-run budget ----------------------------------------------
+    def reset_run(self):
+        """Forget this run's seen jobs and budgets (keeps learned rates)."""
+        with self._lock:
+            self._seen: set = set()
+            self._budgets: Dict[Tuple[str, str], _QueryBudget] = {}
+            # Quota units released by finished queries, per source
+            self._spare: Dict[str, int] = {}
+
+    def register(self, source: str, query, planned: int):
+        """Set the quota units a query's own plan uses (idempotent)."""
+        with self._lock:
+            self._budgets.setdefault((source, str(query)), _QueryBudget(planned))
+
+    def charge(self, source: str, query, cost: int = 1):
+        """Count one call made for ``query``."""
+        with self._lock:
+            budget = self._budgets.setdefault((source, str(query)), _QueryBudget(cost))
+            budget.used += cost
+
+    def observe(self, source: str, query, page_jobs: List[dict]) -> bool:
+        """
+        Score one fetched page of ``query`` (after dedup/date filtering);
+        returns whether the next page is still worth its call.
+        """
+        fingerprints = {job_fingerprint(job) for job in page_jobs}
+        quality = self.quality(source, query.keywords)
+        with self._lock:
+            new = fingerprints - self._seen
+            self._seen.update(new)
+            budget = self._budgets.setdefault((source, str(query)), _QueryBudget(0))
+            value = len(new) * quality
+            budget.productive = value >= self.min_yield
+        if not budget.productive:
+            print(
+                f"  📉 {source} '{query}': {len(new)} new job(s), expected yield "
+                f"{value:.2f} < {self.min_yield}, stopping pagination"
+            )
+        return budget.productive
+
+    def grant(self, source: str, query, cost: int = 1) -> bool:
+        """
+        One more call past the query's own plan, paid from the units other
+        queries of the same source left unused.
+        """
+        with self._lock:
+            budget = self._budgets.get((source, str(query)))
+            if budget is None or not budget.productive:
+                return False
+            if budget.used + cost > budget.planned * (1 + self.max_extension):
+                return False
+            if self._spare.get(source, 0) < cost:
+                return False
+            self._spare[source] -= cost
+            budget.extended += cost
+        print(f"  📈 {source} '{query}' still productive, extending by one page")
+        return True
+
+    def finish(self, source: str, query):
+        """Query done: its unused units become available to the others."""
+        with self._lock:
+            budget = self._budgets.get((source, str(query)))
+            if budget is None or budget.finished:
+                return
+            budget.finished = True
+            unused = budget.planned + budget.extended - budget.used
+            if unused > 0:
+                self._spare[source] = self._spare.get(source, 0) + unused
+
+    def stopped_early(self) -> Dict[str, Tuple[int, int]]:
+        """
+        {source: (queries stopped for low yield, planned quota units they
+        left unused)} for this run.
+        """
+        stopped: Dict[str, Tuple[int, int]] = {}
+        with self._lock:
+            for (source, _), budget in self._budgets.items():
+                unused = budget.planned - budget.used
+                if budget.productive or unused <= 0:
+                    continue
+                queries, units = stopped.get(source, (0, 0))
+                stopped[source] = (queries + 1, units + unused)
+        return stopped
+
+    # --- learned rates -----------------------------------------------
+    def quality(self, source: str, keywords: Iterable[str]) -> float:
+        """Expected share of a query's new jobs that are eligible and matched."""
+        scores = []
+        for keyword in keywords:
+            scraped, eligible, matched = self._rates.get(
+                (source, keyword.strip().lower()), (0, 0, 0)
+            )
+            eligible_rate = _smoothed(eligible, scraped, PRIOR_ELIGIBLE)
+            match_rate = _smoothed(matched, eligible, PRIOR_MATCH)
+            scores.append(eligible_rate * match_rate)
+        return max(scores) if scores else 0.0
+
+    def record_outcomes(
+        self,
+        scraped: Iterable[dict],
+        eligible: Iterable[dict] = (),
+        matched: Iterable[dict] = (),
+    ):
+        """
+        Learn from a run's results: every scraped job, the ones passing the
+        H1B filter and the ones matching the resume (credited to the job's
+        source and search keyword).
+        """
+        counts: Dict[Tuple[str, str], List[int]] = {}
+        for column, jobs in enumerate((scraped, eligible, matched)):
+            for job in jobs:
+                keyword = (job.get("search_keyword") or "").strip().lower()
+                if not keyword or not job.get("source"):
+                    continue
+                key = (job["source"], keyword)
+                counts.setdefault(key, [0, 0, 0])[column] += 1
+        if not counts:
+            return
+        now = datetime.utcnow().isoformat(timespec="seconds")
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO yield_stats "
+                "(source, keyword, scraped, eligible, matched, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(source, keyword) DO UPDATE SET "
+                "scraped = scraped + excluded.scraped, "
+                "eligible = eligible + excluded.eligible, "
+                "matched = matched + excluded.matched, "
+                "updated_at = excluded.updated_at",
+                [(s, k, *c, now) for (s, k), c in counts.items()],
+            )
+            self._conn.commit()
+        self._rates = self._load_rates()
+
+    def _load_rates(self) -> Dict[Tuple[str, str], Tuple[int, int, int]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source, keyword, scraped, eligible, matched FROM yield_stats"
+            ).fetchall()
+        return {(source, keyword): tuple(c) for source, keyword, *c in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class _QueryBudget:
+    planned: int
+    used: int = 0
+    extended: int = 0
+    productive: bool = True
+    finished: bool = False
+
+
+def _smoothed(hits: int, total: int, prior: Tuple[float, int]) -> float:
+    rate, weight = prior
+    return (hits + rate * weight) / (total + weight)
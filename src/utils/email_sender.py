@@ -7,6 +7,8 @@ from email import encoders
 from datetime import datetime
 from pathlib import Path
 
+from src.core.job import jobs_to_columns
+
 
 class EmailReporter:
     def __init__(self, smtp_host, smtp_port, email_user, email_password):
@@ -20,7 +22,7 @@ class EmailReporter:
         if not jobs:
             return "<p>No H1B-friendly jobs found today.</p>"
         
-        df = pd.DataFrame(jobs)
+        df = pd.DataFrame(jobs_to_columns(jobs))
         
         # Select and reorder columns for report
         columns = ['title', 'company', 'location', 'source', 'eligibility_reason', 'url']
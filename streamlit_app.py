@@ -7,6 +7,8 @@ from datetime import datetime
 import pandas as pd
 import streamlit as st
 
+from config.settings import SCRAPER_CREDENTIALS, SCRAPER_PLUGINS
+from src.core.job import jobs_to_columns
 from src.crews.job_match_crew import evaluate_job
 from src.crews.resume_builder_crew import generate_tailored_resume
 from src.crews.gap_analyzer_crew import analyze_gaps_for_learning
@@ -15,6 +17,7 @@ from src.rag.profile_rag import (
     build_or_refresh_profile_index,
     retrieve_relevant_chunks,
 )
+from src.scrapers.registry import load_scrapers
 
 st.set_page_config(
     page_title="H1B Job Search Agent",
@@ -285,15 +288,19 @@ with TAB_H1B:
         help="Filter jobs based on when they were posted",
     )
 
-    # Source filters
+    # Source filters (one checkbox per registered scraper)
     st.markdown("### Sources to use")
-    src_col1, src_col2, src_col3 = st.columns(3)
-    with src_col1:
-        use_jsearch = st.checkbox("JSearch", value=True)
-    with src_col2:
-        use_adzuna = st.checkbox("Adzuna", value=True)
-    with src_col3:
-        use_indeed = st.checkbox("Indeed", value=True)
+    source_specs = load_scrapers(SCRAPER_PLUGINS)
+    selected_sources = {}
+    for col, spec in zip(st.columns(len(source_specs)), source_specs):
+        with col:
+            missing = [name for name in spec.auth if not SCRAPER_CREDENTIALS.get(name)]
+            selected_sources[spec.key] = st.checkbox(
+                spec.label,
+                value=spec.enabled_by_default and not missing,
+                disabled=bool(missing),
+                help=f"Needs {', '.join(missing)}" if missing else None,
+            )
 
     # Email settings
     st.markdown("### 📧 Email Report Settings")
@@ -357,6 +364,16 @@ EMAIL_PASSWORD: {'***' + EMAIL_PASSWORD[-4:] if EMAIL_PASSWORD else 'NOT SET'}
     if run_clicked:
         # Reset cancel flag at start of a new run
         st.session_state.cancel_run = False
+        # Live view of matches while later pages are still being scraped
+        live_matches = st.empty()
+
+        def show_live_matches(matches):
+            live_df = pd.DataFrame(jobs_to_columns(matches))
+            live_matches.dataframe(
+                live_df[["title", "company", "location", "source", "match_score"]],
+                use_container_width=True,
+            )
+
         with st.spinner("Searching job boards + matching your resume..."):
             try:
                 results = run_h1b_job_finder_streamlit(
@@ -366,12 +383,29 @@ EMAIL_PASSWORD: {'***' + EMAIL_PASSWORD[-4:] if EMAIL_PASSWORD else 'NOT SET'}
                     use_ai=use_ai_filter,
                     match_threshold=match_threshold,
                     date_filter=date_filter,
-                    sources={
-                        "jsearch": use_jsearch,
-                        "adzuna": use_adzuna,
-                        "indeed": use_indeed,
-                    },
+                    sources=selected_sources,
+                    on_match=show_live_matches,
                 )
+                live_matches.empty()
+
+                # Sources cut off by the time budget or failing mid-run, and
+                # queries adaptive paging cut short
+                for source, report in (results or {}).get("scrape_report", {}).items():
+                    if report["completed"] < report["queries"]:
+                        st.warning(
+                            f"⚠️ {source} returned partial results "
+                            f"({report['completed']}/{report['queries']} queries "
+                            f"finished, {report['jobs']} jobs)"
+                        )
+                    if report.get("stopped_early"):
+                        st.info(
+                            f"📉 {source}: adaptive paging stopped "
+                            f"{report['stopped_early']} low-yield quer"
+                            f"{'y' if report['stopped_early'] == 1 else 'ies'} early "
+                            f"({report['skipped_calls']} planned page request(s) "
+                            "skipped). Set ADAPTIVE_PAGING=0 to always fetch "
+                            "every page."
+                        )
 
                 if results and results["matched_jobs"]:
                     st.success(
@@ -387,7 +421,7 @@ EMAIL_PASSWORD: {'***' + EMAIL_PASSWORD[-4:] if EMAIL_PASSWORD else 'NOT SET'}
                         f"{results['exclusion_rate']:.1f}%",
                     )
 
-                    df = pd.DataFrame(results["matched_jobs"])
+                    df = pd.DataFrame(jobs_to_columns(results["matched_jobs"]))
 
                     if "posted_at" in df.columns:
                         df["posted_date"] = pd.to_datetime(
@@ -441,7 +475,7 @@ EMAIL_PASSWORD: {'***' + EMAIL_PASSWORD[-4:] if EMAIL_PASSWORD else 'NOT SET'}
                         "💡 Try: lower match threshold, upload different resume, or broader keywords"
                     )
 
-                    df = pd.DataFrame(results["h1b_jobs"])
+                    df = pd.DataFrame(jobs_to_columns(results["h1b_jobs"]))
                     cols = ["title", "company", "location", "source"]
                     if "posted_at" in df.columns:
                         df["posted_date"] = pd.to_datetime(
@@ -538,9 +572,9 @@ EMAIL_PASSWORD: {'***' + EMAIL_PASSWORD[-4:] if EMAIL_PASSWORD else 'NOT SET'}
                             import tempfile
 
                             if results and results.get("matched_jobs"):
-                                df_email = pd.DataFrame(results["matched_jobs"])
+                                df_email = pd.DataFrame(jobs_to_columns(results["matched_jobs"]))
                             elif results and results.get("h1b_jobs"):
-                                df_email = pd.DataFrame(results["h1b_jobs"])
+                                df_email = pd.DataFrame(jobs_to_columns(results["h1b_jobs"]))
                             else:
                                 df_email = pd.DataFrame([])
 
@@ -0,0 +1,80 @@
+"""
+posted_after pushed down to each source's date filter, with early stop for
+newest-first sources (no network needed).
+"""
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlsplit
+
+from src.scrapers.adzuna_scraper import AdzunaScraper
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.indeed_scraper import IndeedScraper
+from src.scrapers.jsearch_scraper import JSearchScraper
+from src.scrapers.linkedin_scraper import LinkedInScraper
+from src.scrapers.replay import ReplayHarness
+
+
+def _days_ago(days):
+    return datetime.now() - timedelta(days=days)
+
+
+def test_native_date_params():
+    two_days = _days_ago(2)
+    assert JSearchScraper("key").date_params(two_days) == {"date_posted": "3days"}
+    assert JSearchScraper("key").date_params(_days_ago(40)) == {}
+    assert AdzunaScraper("id", "key").date_params(two_days) == {
+        "max_days_old": 2,
+        "sort_by": "date",
+    }
+    assert IndeedScraper().date_params(_days_ago(5)) == {"fromage": 7, "sort": "date"}
+    assert IndeedScraper().date_params(_days_ago(30)) == {"sort": "date"}
+    assert LinkedInScraper("key").date_params(two_days) == {}
+    for scraper in (JSearchScraper("key"), AdzunaScraper("id", "key"), IndeedScraper()):
+        assert scraper.date_params(None) == {}
+    # A cutoff taken just now still asks for at least one day
+    assert BaseScraper.days_since(datetime.now()) == 1
+
+
+def test_date_params_reach_the_request():
+    with ReplayHarness() as harness:
+        scraper = IndeedScraper()
+        harness.attach(scraper)
+        sent = []
+        real_get = scraper.session.get
+        scraper.session.get = lambda url, **kw: sent.append(url) or real_get(url, **kw)
+        scraper.search_jobs("Data Engineer", "United States", 1, posted_after=_days_ago(2))
+        scraper.close()
+    params = parse_qs(urlsplit(sent[0]).query)
+    assert params["fromage"] == ["3"] and params["sort"] == ["date"]
+
+
+class _DatedScraper(BaseScraper):
+    """Five pages of newest-first jobs, each page a day older."""
+
+    name = "DateTest"
+    sorts_by_date = True
+
+    def __init__(self):
+        super().__init__()
+        self.pages = []
+
+    def fetch_page(self, keywords, location, page, **kwargs):
+        self.pages.append(page)
+        return [
+            {"title": f"Data Engineer {page}.{n}", "company": "Acme",
+             "posted_at": _days_ago(page - 0.7 + n * 0.4)}
+            for n in range(3)
+        ]
+
+
+def test_pagination_stops_at_first_page_older_than_cutoff():
+    scraper = _DatedScraper()
+    jobs = scraper.search_jobs("Data Engineer", "US", 5, posted_after=_days_ago(2))
+    # Page 3 is entirely older than two days: pages 4 and 5 are never fetched
+    assert scraper.pages == [1, 2, 3]
+    assert all(job["posted_at"] >= _days_ago(2) for job in jobs)
+    assert len(jobs) == 5  # client-side filter trims page 2's older job
+
+    scraper.sorts_by_date = False
+    scraper.pages.clear()
+    scraper.search_jobs("Data Engineer", "US", 5, posted_after=_days_ago(2))
+    assert scraper.pages == [1, 2, 3, 4, 5]
@@ -0,0 +1,82 @@
+"""
+Local eligibility model: trained from cached AI verdicts, decides confident
+cases and escalates the rest to the AI check.
+"""
+import random
+
+from src.filters.eligibility_model import EligibilityModel, train_from_cache
+from src.filters.h1b_filter import PROMPT_VERSION, H1BFilter
+from src.filters.verdict_cache import VerdictCache, verdict_key
+
+FILLER = (
+    "python spark sql airflow aws team build pipelines scalable data "
+    "platform benefits remote hybrid".split()
+)
+EXCLUDED = ["must be a us citizen", "no visa sponsorship", "green card holders only"]
+ELIGIBLE = ["visa sponsorship available", "h1b transfer welcome", ""]
+TITLES = ["Data Engineer", "Software Engineer", "Cloud Architect", "ML Engineer"]
+
+
+def _job(rng, eligible):
+    words = [rng.choice(FILLER) for _ in range(60)]
+    words.insert(rng.randrange(60), rng.choice(ELIGIBLE if eligible else EXCLUDED))
+    return {"title": rng.choice(TITLES), "company": "Acme", "description": " ".join(words)}
+
+
+def _verdicts(count, seed=0):
+    rng = random.Random(seed)
+    labels = [rng.random() < 0.7 for _ in range(count)]
+    return [(_job(rng, label), label) for label in labels]
+
+
+def test_train_from_cached_verdicts(tmp_path):
+    cache = VerdictCache(tmp_path / "verdicts.sqlite3")
+    examples = _verdicts(400)
+    cache.put_many(
+        PROMPT_VERSION,
+        [(verdict_key(job, PROMPT_VERSION), job, label, "AI") for job, label in examples],
+    )
+    model = train_from_cache(cache, PROMPT_VERSION, threshold=0.9)
+    cache.close()
+    assert model.meta["examples"] == 400
+
+    model.save(tmp_path / "model.npz")
+    loaded = EligibilityModel.load(tmp_path / "model.npz")
+    assert loaded.meta["prompt_version"] == PROMPT_VERSION
+
+    jobs, labels = zip(*_verdicts(200, seed=1))
+    result = loaded.evaluate(jobs, labels, threshold=0.9)
+    assert result.coverage > 0.8
+    assert result.accuracy > 0.97
+
+
+def test_too_few_verdicts_trains_nothing(tmp_path):
+    cache = VerdictCache(tmp_path / "verdicts.sqlite3")
+    examples = _verdicts(20)
+    cache.put_many(
+        PROMPT_VERSION,
+        [(verdict_key(job, PROMPT_VERSION), job, label, "AI") for job, label in examples],
+    )
+    assert train_from_cache(cache, PROMPT_VERSION, threshold=0.9) is None
+    cache.close()
+
+
+def test_filter_escalates_only_uncertain_jobs(monkeypatch):
+    model = EligibilityModel().fit(*zip(*_verdicts(400)))
+    h1b = H1BFilter("test-key", max_workers=1, local_model=model, local_threshold=0.9)
+    calls = []
+    monkeypatch.setattr(
+        h1b, "is_h1b_friendly_ai", lambda job: calls.append(job["title"]) or (True, "AI")
+    )
+
+    rng = random.Random(5)
+    easy = [_job(rng, n % 2 == 0) for n in range(6)]
+    unclear = {"title": "Office Manager", "company": "Acme", "description": "Scheduling."}
+    results = h1b.check_jobs_ai(easy + [unclear])
+
+    assert "Office Manager" in calls and len(calls) <= 2
+    assert results[-1] == (True, "AI")
+    for n, (eligible, reason) in enumerate(results[:6]):
+        if reason.startswith("Local model"):
+            assert eligible == (n % 2 == 0)
+    assert results[0][1].startswith("Local model: eligible")
@@ -0,0 +1,213 @@
+"""
+H1BFilter rule stage: one compiled matcher for exclusions and positive
+signals.
+"""
+import re
+
+from src.filters.h1b_filter import H1BFilter
+from src.filters.rule_matcher import RuleMatcher
+
+
+def _filter():
+    return H1BFilter("test-key")
+
+
+def test_compiled_matcher_agrees_with_per_pattern_search():
+    h1b = _filter()
+    texts = [
+        "Senior Data Engineer. Green Card required for this role.",
+        "Must be a US citizen due to federal contract.",
+        "We are unable to provide sponsorship. No sponsorship now or in future.",
+        "Python, Spark, Airflow. Competitive salary and benefits.",
+        "Active TS/SCI clearance. Permanent resident only.",
+        "Security clearance (Secret) required",
+    ]
+    for text in texts:
+        legacy = any(re.search(p, text.lower()) for p in h1b.exclude_patterns)
+        eligible, reason = h1b.is_h1b_friendly_rule_based({"title": "", "description": text})
+        assert eligible is not legacy
+        if not eligible:
+            pattern = re.search(r"Found pattern '(.+)'", reason).group(1)
+            assert pattern in h1b.exclude_patterns
+            assert re.search(pattern, text.lower())
+
+
+def test_gaps_are_bounded_to_a_sentence():
+    matcher = RuleMatcher([r"green card.*required"], max_gap=20)
+    assert matcher.match("green card holders are required") is not None
+    far = "green card " + "x" * 100 + " required"
+    assert matcher.match(far) is None
+
+
+def test_exclusion_wins_over_positive_signal():
+    h1b = _filter()
+    job = {
+        "title": "ML Engineer",
+        "description": "H1B visa sponsorship available for most roles, "
+        "but this position: no sponsorship.",
+    }
+    eligible, reason = h1b.is_h1b_friendly_rule_based(job)
+    assert not eligible
+    assert reason == "Excluded: Found pattern 'no sponsorship'"
+
+    hits = h1b.rule_matcher.match_all("we cannot sponsor visas")
+    assert [hit.kind for hit in hits] == ["exclude"]
+
+
+def test_positive_signal_is_reported_but_ai_still_checks(monkeypatch):
+    h1b = _filter()
+    calls = []
+    monkeypatch.setattr(
+        h1b, "is_h1b_friendly_ai", lambda job: calls.append(job) or (True, "AI")
+    )
+    jobs = [
+        {"title": "Data Engineer", "description": "H-1B transfers are supported."},
+        {"title": "Data Analyst", "description": "SQL and dashboards."},
+    ]
+    assert h1b.is_h1b_friendly_rule_based(jobs[0])[1].startswith("Positive signal")
+    kept = h1b.filter_jobs(jobs, use_ai=True)
+    assert kept == jobs
+    assert calls == jobs
+
+    kept = h1b.filter_jobs([dict(jobs[0])], use_ai=False)
+    assert kept[0]["eligibility_reason"].startswith("Positive signal")
+
+
+def test_negated_positive_phrasings_are_not_signals():
+    h1b = _filter()
+    negated = [
+        "We are not able to sponsor visas for this role.",
+        "Unfortunately we will not be able to sponsor H1B.",
+        "Not happy to sponsor visas",
+        "We can't sponsor work visas at this time.",
+        "The company is unable to sponsor visas; H1B holders may apply elsewhere.",
+    ]
+    for text in negated:
+        hit = h1b.match_rules({"title": "Engineer", "description": text})
+        assert hit is None or hit.kind != "positive", text
+
+    # A negation in an earlier sentence does not cancel a later signal
+    text = "This is not a remote role. We will sponsor H1B visas."
+    assert h1b.match_rules({"title": "", "description": text}).kind == "positive"
+
+
+def test_ai_checks_run_concurrently_in_order(monkeypatch):
+    import threading
+    import time
+
+    h1b = H1BFilter("test-key", max_workers=4)
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def fake_ai(job):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(0.05 if job["n"] % 2 else 0.01)
+        with lock:
+            state["in_flight"] -= 1
+        return job["n"] % 3 != 0, f"reason {job['n']}"
+
+    monkeypatch.setattr(h1b, "is_h1b_friendly_ai", fake_ai)
+    jobs = [{"title": f"Engineer {n}", "description": "", "n": n} for n in range(12)]
+    kept = h1b.filter_jobs(jobs, use_ai=True)
+    # Overlapping checks prove concurrency without timing the run
+    assert 1 < state["peak"] <= 4
+    assert [job["n"] for job in kept] == [n for n in range(12) if n % 3]
+    assert [job["eligibility_reason"] for job in jobs] == [f"reason {n}" for n in range(12)]
+
+
+def test_token_limit_paces_requests():
+    from src.scrapers.rate_limiter import TokenBucket
+
+    bucket = TokenBucket(rate=1000, burst=1000)
+    assert bucket.reserve(1000) == 0
+    assert bucket.reserve(500) < 0.01
+    # 1500 tokens spent: the next request waits until the debt is repaid
+    assert 0.45 < bucket.reserve(1) < 0.51
+
+
+def _reply(content):
+    from types import SimpleNamespace
+
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def test_batched_prompts_fall_back_to_single_calls(monkeypatch):
+    import json
+
+    h1b = H1BFilter("test-key", max_workers=1, batch_size=3)
+    prompts = []
+
+    def fake_completion(prompt, max_tokens):
+        prompts.append(prompt)
+        if "### Job" not in prompt:
+            return _reply("ELIGIBLE: No\nREASON: single check")
+        count = prompt.count("### Job")
+        # The model drops the last job of every batch
+        items = [
+            {"id": i, "eligible": i % 2 == 1, "reason": f"batch {i}"}
+            for i in range(1, count)
+        ]
+        return _reply("```json\n" + json.dumps(items) + "\n```")
+
+    monkeypatch.setattr(h1b, "_create_completion", fake_completion)
+    jobs = [{"title": f"Engineer {n}", "description": "Python"} for n in range(7)]
+    assert h1b._pack_batches(jobs) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    results = h1b.check_jobs_ai(jobs)
+    assert results == [
+        (True, "batch 1"), (False, "batch 2"), (False, "single check"),
+        (True, "batch 1"), (False, "batch 2"), (False, "single check"),
+        (False, "single check"),
+    ]
+    # 3 batches + 3 fallbacks
+    assert len(prompts) == 6
+
+
+def test_batches_respect_token_budget():
+    h1b = H1BFilter("test-key", batch_size=10, batch_token_budget=450)
+    jobs = [{"title": "T", "description": "x" * 2000} for _ in range(5)]
+    # 800 description chars -> ~220 tokens each, two per batch
+    assert h1b._pack_batches(jobs) == [[0, 1], [2, 3], [4]]
+
+
+def test_verdict_cache_skips_repeat_checks(tmp_path, monkeypatch):
+    from src.filters import h1b_filter
+    from src.filters.verdict_cache import VerdictCache, verdict_key
+
+    cache = VerdictCache(tmp_path / "verdicts.sqlite3", ttl_days=30)
+    h1b = H1BFilter("test-key", max_workers=1, verdict_cache=cache)
+    calls = []
+
+    def fake_ai(job):
+        calls.append(job["title"])
+        if job["title"] == "Flaky":
+            return True, h1b_filter.AI_FAILED_REASON
+        return job["title"] != "Analyst", f"checked {job['title']}"
+
+    monkeypatch.setattr(h1b, "is_h1b_friendly_ai", fake_ai)
+    jobs = [
+        {"title": "Engineer", "company": "Acme Inc", "description": "Python"},
+        {"title": "Analyst", "company": "Acme", "description": "SQL"},
+        # Repost of the first job from another board
+        {"title": "ENGINEER", "company": "Acme, Inc.", "description": "Python "},
+        {"title": "Flaky", "company": "Acme", "description": "Go"},
+    ]
+    first = h1b.check_jobs_ai(jobs)
+    assert calls == ["Engineer", "Analyst", "Flaky"]
+    assert first[2] == first[0] == (True, "checked Engineer")
+
+    calls.clear()
+    assert h1b.check_jobs_ai(jobs) == first
+    assert calls == ["Flaky"]  # failures are not cached
+
+    # A new prompt version (or an expired entry) misses
+    assert cache.get_many([verdict_key(jobs[0], "other-prompt")]) == {}
+    cache.ttl = -1
+    assert cache.get_many([verdict_key(jobs[0], h1b_filter.PROMPT_VERSION)]) == {}
+    cache.purge(h1b_filter.PROMPT_VERSION)
+    cache.ttl = 86400
+    assert cache.get_many([verdict_key(jobs[0], h1b_filter.PROMPT_VERSION)]) == {}
+    cache.close()
@@ -0,0 +1,54 @@
+"""
+Hedged requests and deadline-bounded scrapes (no network needed).
+"""
+import threading
+import time
+
+from src.scrapers.hedging import LatencyTracker, hedged_call
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.replay import ReplayHarness
+from src.scrapers.scraper_manager import ScraperManager
+
+
+def test_straggler_is_hedged():
+    tracker = LatencyTracker(min_samples=3)
+    assert tracker.percentile(0.9) is None
+    for seconds in (0.1, 0.2, 0.3, 5.0):
+        tracker.record(seconds)
+    assert tracker.percentile(0.5) == 0.3
+
+    calls = []
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            calls.append(1)
+            first = len(calls) == 1
+        time.sleep(2.0 if first else 0.01)
+        return "slow" if first else "fast"
+
+    start = time.monotonic()
+    assert hedged_call(call, 0.1, lambda: True) == ("fast", True)
+    assert time.monotonic() - start < 1.0
+    assert hedged_call(lambda: "ok", 0.1, lambda: True) == ("ok", False)
+    assert hedged_call(call, None, lambda: True) == ("fast", False)
+
+
+def test_deadline_returns_partial_results_with_report():
+    with ReplayHarness() as harness:
+        configure_rate_limit(harness.servers["Indeed"].host, 20, 5)
+        harness.servers["Indeed"].latency = 3.0
+        manager = ScraperManager("replay-key", "replay-id", "replay-key")
+        harness.attach_manager(manager)
+
+        start = time.monotonic()
+        jobs = manager.scrape_keywords(
+            ["Data Engineer"], "United States", 2, deadline=1.5
+        )
+        assert time.monotonic() - start < 2.5
+        manager.close()
+
+    report = manager.last_report
+    assert {job["source"] for job in jobs} == {"JSearch", "Adzuna"}
+    assert report["JSearch"]["completed"] == report["JSearch"]["queries"] == 1
+    assert report["Indeed"]["unfinished"] == 1 and report["Indeed"]["jobs"] == 0
@@ -0,0 +1,51 @@
+"""
+Indeed result-page parsers: every installed backend extracts the same cards.
+"""
+from src.scrapers.html_parsing import available_backends, get_card_parser
+from src.scrapers.replay import CASSETTE_DIR, load_cassette
+
+ALT_LAYOUT = """<html><body><table><tr><td class="resultContent">
+<a class="jcs-JobTitle css-x" href="/rc/clk?jk=zz"><span>Data</span> <span>Engineer</span></a>
+<span class="companyName"> Foo Inc </span>
+<div class="companyLocation">Remote<span> • </span>US</div>
+<div class="jobCardShelfContainer"><ul><li>Python</li><li>SQL</li></ul></div>
+</td></tr></table><div class="other"><h2 class="jobTitle">not a card</h2></div>
+</body></html>"""
+
+
+def test_backends_agree():
+    pages = [
+        i["response"]["body"].encode("utf-8")
+        for i in load_cassette(CASSETTE_DIR / "indeed.json")["interactions"]
+        if i["request"]["path"].endswith("/jobs")
+    ] + [ALT_LAYOUT.encode("utf-8")]
+
+    parsed = {b: [get_card_parser(b).parse(p) for p in pages] for b in available_backends()}
+    reference = parsed.pop("html.parser")
+    assert sum(len(rows) for rows in reference) > 5
+    assert reference[-1] == [
+        {
+            "title": "DataEngineer",
+            "company": "Foo Inc",
+            "location": "Remote•US",
+            "description": "PythonSQL",
+            "date": None,
+            "href": "/rc/clk?jk=zz",
+        }
+    ]
+    for backend, rows in parsed.items():
+        assert rows == reference, backend
+
+
+def test_page_chrome_and_class_mentions_are_skipped_safely():
+    head = (
+        "<html><head><style>.job_seen_beacon{margin:0}</style>"
+        "<script>var tpl = '<div class=\"job_seen_beacon\">';</script></head><body>"
+        + '<div class="nav"><a href="/x">Link</a></div>' * 50
+    )
+    bare = get_card_parser("html.parser").parse(ALT_LAYOUT.encode("utf-8"))
+    # Only mentions of the first layout's class: the td cards are still found
+    page = ALT_LAYOUT.replace("<html><body>", head)
+    for backend in available_backends():
+        assert get_card_parser(backend).parse(page) == bare, backend
+        assert get_card_parser(backend).parse(page.encode("utf-8")) == bare, backend
@@ -0,0 +1,75 @@
+"""
+Cross-source deduplication (no network needed).
+"""
+from src.filters.job_dedup import (
+    JobDeduplicator,
+    canonicalize_url,
+    dedupe_jobs,
+    normalize_company,
+    normalize_location,
+)
+
+
+def _job(**fields):
+    job = {
+        "title": "Data Engineer",
+        "company": "Acme",
+        "location": "Austin, TX",
+        "description": "",
+        "url": "",
+        "source": "Indeed",
+    }
+    job.update(fields)
+    return job
+
+
+def test_normalization():
+    assert canonicalize_url(
+        "https://www.Indeed.com/viewjob/?jk=42&from=serp&utm_source=x#top"
+    ) == "//indeed.com/viewjob?jk=42"
+    assert normalize_company("Acme, Inc.") == normalize_company("The Acme Corp") == "acme"
+    assert normalize_location("N/A, ") == ""
+
+
+def test_url_and_exact_matches_merge_with_provenance():
+    jobs = [
+        _job(url="https://indeed.com/viewjob?jk=1&from=serp", search_keyword="Data Engineer"),
+        _job(title="Cloud Engineer", url="https://www.indeed.com/viewjob?jk=1",
+             search_keyword="Cloud Engineer"),
+        _job(company="ACME Inc", source="JSearch", description="Full text " * 20),
+    ]
+    kept = dedupe_jobs(jobs)
+    assert len(kept) == 1
+    assert kept[0]["sources"] == ["Indeed", "JSearch"]
+    assert kept[0]["search_keywords"] == ["Data Engineer", "Cloud Engineer"]
+    assert kept[0]["description"].startswith("Full text")
+
+
+def test_locations_compare_whole_words():
+    dedup = JobDeduplicator()
+    assert dedup.add(_job(location="New York, NY"))
+    assert not dedup.add(_job(location="New York, NY, United States"))
+    # "ny" is a substring of "sunnyvale" but not one of its words
+    assert dedup.add(_job(location="Sunnyvale, CA"))
+    assert dedup.add(_job(location="York, PA"))
+    assert len(dedup.jobs) == 3
+
+
+def test_unknown_location_merges_only_on_url_or_id():
+    dedup = JobDeduplicator()
+    assert dedup.add(_job(location="Seattle, WA", id="a1", url="https://a.test/1"))
+    assert dedup.add(_job(location="N/A"))
+    assert dedup.add(_job(location=""))
+    assert not dedup.add(_job(location="N/A", url="https://a.test/1/"))
+    assert not dedup.add(_job(location="", id="a1"))
+    # The same ID from another board is a different posting
+    assert dedup.add(_job(location="", id="a1", source="Adzuna"))
+    assert len(dedup.jobs) == 4 and dedup.duplicates == 2
+
+
+def test_reposted_description_merges():
+    text = "We build streaming data pipelines on Spark and Kafka for retail analytics teams."
+    dedup = JobDeduplicator()
+    assert dedup.add(_job(title="Sr Data Engineer", location="Remote", description=text))
+    assert not dedup.add(_job(title="Senior Data Engineer", location="", description=text))
+    assert dedup.add(_job(title="Senior Data Engineer", company="Other", description=text))
@@ -0,0 +1,42 @@
+"""
+Job record: dict-compatible access, lazy description, columnar conversion.
+"""
+import pickle
+
+from src.core.job import Job, jobs_from_columns, jobs_to_columns
+
+
+def test_job_behaves_like_a_dict():
+    job = Job(title="Data Engineer", company="Acme", source="Adzuna", description="d")
+    job["match_score"] = 0.8
+    job["custom_note"] = "x"
+
+    assert job["title"] == "Data Engineer" and job.title == "Data Engineer"
+    assert job.get("gaps") is None and "gaps" not in job
+    assert dict(job) == {
+        "title": "Data Engineer",
+        "company": "Acme",
+        "description": "d",
+        "source": "Adzuna",
+        "match_score": 0.8,
+        "custom_note": "x",
+    }
+    assert not hasattr(job, "__dict__")
+    assert pickle.loads(pickle.dumps(job)) == job
+
+
+def test_lazy_description_and_columns():
+    calls = []
+    job = Job(title="Cloud Engineer")
+    job.set_description_loader(lambda: calls.append(1) or "full text")
+    assert "description" in job and not job.description_loaded
+    assert job["description"] == "full text" and job.description == "full text"
+    assert calls == [1]
+
+    columns = jobs_to_columns([job, {"title": "Other", "url": "u"}])
+    assert columns == {
+        "title": ["Cloud Engineer", "Other"],
+        "description": ["full text", None],
+        "url": [None, "u"],
+    }
+    assert jobs_from_columns(columns)[1].to_dict() == {"title": "Other", "url": "u"}
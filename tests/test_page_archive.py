@@ -0,0 +1,41 @@
+"""
+Raw page archive: pages scraped once can be re-parsed offline.
+"""
+from src.scrapers.adzuna_scraper import AdzunaScraper
+from src.scrapers.indeed_scraper import IndeedScraper
+from src.scrapers.page_archive import PageArchive, reparse
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.replay import ReplayHarness
+
+
+def test_archived_pages_reparse_to_same_jobs(tmp_path):
+    archive = PageArchive(tmp_path)
+    scrapers = [AdzunaScraper("id", "secret-key", archive=archive), IndeedScraper(archive=archive)]
+    scraped = []
+    with ReplayHarness() as harness:
+        configure_rate_limit(harness.servers["Indeed"].host, 20, 5)
+        for scraper in scrapers:
+            harness.attach(scraper)
+            scraped += scraper.search_jobs("Data Engineer", "United States", num_pages=2)
+
+    entries = archive.find()
+    assert [(e.source, e.page) for e in entries] == [
+        ("Adzuna", 1),
+        ("Indeed", 1),
+        ("Indeed", 2),
+    ]
+    assert entries[0].keywords == ("Data Engineer",)
+    assert "secret-key" not in entries[0].url
+    assert list(tmp_path.glob("*/*/*/indeed.gz"))
+
+    jobs = reparse(archive, {s.name: s for s in scrapers})
+    assert [(j["title"], j["url"], j["search_keyword"]) for j in jobs] == [
+        (j["title"], j["url"], j["search_keyword"]) for j in scraped
+    ]
+    assert len(reparse(archive, {s.name: s for s in scrapers}, source="Indeed")) == 10
+
+    archive.prune(keep_days=-1)
+    assert archive.find() == []
+    for scraper in scrapers:
+        scraper.close()
+    archive.close()
@@ -0,0 +1,63 @@
+"""
+Keyword → per-source query planning (no network needed).
+"""
+from src.scrapers.adzuna_scraper import AdzunaScraper
+from src.scrapers.indeed_scraper import IndeedScraper
+from src.scrapers.jsearch_scraper import JSearchScraper
+from src.scrapers.query_planner import SearchQuery, plan_queries
+
+KEYWORDS = ["Data Engineer", "Cloud Engineer", "Cloud Architect", "data engineer"]
+
+
+def test_plan_queries_per_source():
+    jsearch = plan_queries(KEYWORDS, JSearchScraper("key"))
+    assert [q.keywords for q in jsearch] == [
+        ("Data Engineer", "Cloud Engineer", "Cloud Architect")
+    ]
+    assert JSearchScraper("key").keyword_params(jsearch[0])["query"] == (
+        '"Data Engineer" OR "Cloud Engineer" OR "Cloud Architect" -clearance'
+    )
+
+    adzuna = plan_queries(KEYWORDS, AdzunaScraper("id", "key"))
+    assert [q.keywords for q in adzuna] == [
+        ("Data Engineer", "Cloud Engineer"),
+        ("Cloud Architect",),
+    ]
+    assert AdzunaScraper("id", "key").keyword_params(adzuna[0]) == {
+        "what": "Engineer",
+        "what_or": "Data Cloud",
+        "what_exclude": "clearance",
+    }
+
+    indeed = plan_queries(KEYWORDS, IndeedScraper())
+    assert len(indeed) == 3
+
+
+def test_results_map_back_to_keywords():
+    query = SearchQuery(("Data Engineer", "Cloud Engineer", "Cloud Architect"))
+    jobs = [
+        {"title": "Senior Data Engineer", "description": ""},
+        {"title": "Platform Engineer", "description": "Cloud infrastructure on AWS"},
+        {"title": "Sales Associate", "description": "Retail"},
+    ]
+    kept = query.assign_keywords(jobs)
+    assert [job["search_keyword"] for job in kept] == ["Data Engineer", "Cloud Engineer"]
+    assert kept[0]["matched_keywords"] == ["Data Engineer"]
+
+
+def test_cli_keyword_setting_plans_and_scrapes():
+    """The CLI/scheduled run passes the JOB_KEYWORDS tuple as-is."""
+    from config.settings import JOB_KEYWORDS, JOB_LOCATION
+    from src.scrapers.replay import ReplayHarness
+    from src.scrapers.scraper_manager import ScraperManager
+
+    assert plan_queries("Data Engineer", IndeedScraper())[0].keywords == ("Data Engineer",)
+    with ReplayHarness() as harness:
+        manager = ScraperManager("replay-key", "replay-id", "replay-key")
+        harness.attach_manager(manager)
+        concurrent = manager.scrape_keywords(list(JOB_KEYWORDS), JOB_LOCATION, 1)
+        serial = manager.scrape_all(JOB_KEYWORDS, JOB_LOCATION, 1)
+        manager.close()
+    assert concurrent
+    assert {job["search_keyword"] for job in concurrent} == set(JOB_KEYWORDS)
+    assert len(serial) == len(concurrent)
@@ -0,0 +1,118 @@
+"""
+Monthly API quota ledger and the per-day page planner (no network needed).
+"""
+import json
+import threading
+from datetime import date
+
+import pytest
+
+from src.scrapers.adzuna_scraper import AdzunaScraper
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.indeed_scraper import IndeedScraper
+from src.scrapers.jsearch_scraper import JSearchScraper
+from src.scrapers.quota import QuotaExceeded, QuotaLedger, QuotaPlanner
+
+TODAY = date(2026, 10, 17)  # 15 days left in October, counting today
+
+
+def test_ledger_enforces_and_persists_limit(tmp_path):
+    path = tmp_path / "quota.sqlite3"
+    ledger = QuotaLedger(path)
+    assert ledger.try_debit("JSearch", "secret-key", 3, monthly_limit=5, today=TODAY)
+    assert not ledger.try_debit("JSearch", "secret-key", 3, monthly_limit=5, today=TODAY)
+    assert ledger.try_debit("JSearch", "secret-key", 2, monthly_limit=5, today=TODAY)
+    # Other keys and months have their own budget
+    assert ledger.try_debit("JSearch", "other-key", 5, monthly_limit=5, today=TODAY)
+    assert ledger.used("JSearch", "secret-key", date(2026, 11, 1)) == (0, 0)
+
+    reloaded = QuotaLedger(path)
+    assert reloaded.used("JSearch", "secret-key", TODAY) == (5, 5)
+    assert b"secret-key" not in path.read_bytes()
+
+
+def test_ledgers_sharing_a_file_never_overspend(tmp_path):
+    # One ledger per "process": each keeps its own connection to the file
+    path = tmp_path / "quota.sqlite3"
+    ledgers = [QuotaLedger(path) for _ in range(4)]
+    granted = []
+
+    def spend(ledger):
+        for _ in range(30):
+            if ledger.try_debit("JSearch", "key", 1, monthly_limit=100, today=TODAY):
+                granted.append(1)
+
+    threads = [threading.Thread(target=spend, args=(ledger,)) for ledger in ledgers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(granted) == 100
+    assert QuotaLedger(path).used("JSearch", "key", TODAY) == (100, 100)
+
+
+def test_old_json_ledger_is_imported(tmp_path):
+    legacy = {"JSearch:anonymous": {"2026-10": {"total": 7, "days": {"2026-10-16": 7}}}}
+    (tmp_path / "quota.json").write_text(json.dumps(legacy))
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3")
+    assert ledger.used("JSearch", None, date(2026, 10, 16)) == (7, 7)
+    assert not (tmp_path / "quota.json").exists()
+
+
+def test_daily_allowance_spreads_the_month(tmp_path):
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3")
+    planner = QuotaPlanner(ledger)
+    jsearch = JSearchScraper("key")
+    ledger.try_debit("JSearch", "key", 700, today=date(2026, 10, 16))
+    # 300 calls left over 15 days
+    assert planner.daily_allowance(jsearch, TODAY) == 20
+    ledger.try_debit("JSearch", "key", 5, today=TODAY)
+    assert planner.daily_allowance(jsearch, TODAY) == 15
+    assert planner.daily_allowance(IndeedScraper(), TODAY) is None
+
+
+def test_plan_pages_caps_metered_sources(tmp_path):
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3")
+    planner = QuotaPlanner(ledger)
+    scrapers = [JSearchScraper("key"), IndeedScraper()]
+    assert planner.plan_pages(scrapers, 3, 3, TODAY) == {"JSearch": 3, "Indeed": 3}
+
+    # 3 calls left today: one single-page call per keyword
+    ledger.try_debit("JSearch", "key", 955, today=date(2026, 10, 1))
+    assert planner.daily_allowance(scrapers[0], TODAY) == 3
+    # The two pages JSearch gives up go to the unmetered board
+    assert planner.plan_pages(scrapers, 3, 3, TODAY) == {"JSearch": 1, "Indeed": 5}
+    # A merged query covering all three keywords fits three pages again
+    plan = planner.plan_pages(scrapers, 3, 3, TODAY, query_sizes={"JSearch": [3]})
+    assert plan == {"JSearch": 3, "Indeed": 3}
+    assert planner.plan_pages(scrapers, 4, 3, TODAY) == {"JSearch": 0, "Indeed": 6}
+
+
+def test_reallocation_is_capped_and_spread(tmp_path):
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3")
+    planner = QuotaPlanner(ledger, max_pages=4)
+    scrapers = [JSearchScraper("key"), IndeedScraper(), AdzunaScraper("id", "key")]
+    ledger.try_debit("JSearch", "key", 1000, today=date(2026, 10, 1))
+    plan = planner.plan_pages(scrapers, 2, 3, TODAY)
+    assert plan == {"JSearch": 0, "Indeed": 4, "Adzuna": 4}
+
+
+class _Metered(BaseScraper):
+    name = "QuotaTest"
+    monthly_quota = 2
+    hedge_requests = False
+
+    def fetch_page(self, keywords, location, page, **kwargs):
+        return []
+
+
+def test_spent_quota_stops_requests(tmp_path):
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3")
+    scraper = _Metered(quota_ledger=ledger)
+    sent = []
+    scraper.session.get = lambda url, **kw: sent.append(url)
+    ledger.try_debit("QuotaTest", None, 2)
+    with pytest.raises(QuotaExceeded):
+        scraper._get("http://quota.test/jobs")
+    assert sent == []
+    scraper.close()
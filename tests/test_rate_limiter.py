@@ -0,0 +1,80 @@
+"""
+Per-host GCRA token buckets and Retry-After parsing (no network needed).
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from src.scrapers.rate_limiter import (
+    TokenBucket,
+    configure_rate_limit,
+    get_rate_limiter,
+    parse_retry_after,
+)
+
+
+def test_burst_then_steady_rate():
+    bucket = TokenBucket(rate=10, burst=3)
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+    # The next token is due one interval (0.1s) after the burst
+    assert 0.05 < bucket.reserve() <= 0.1
+    assert 0.15 < bucket.reserve() <= 0.2
+
+
+def test_waiters_are_spread_at_the_rate():
+    bucket = TokenBucket(rate=50, burst=1)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        wait = bucket.reserve()
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    waits.sort()
+    # One immediate token, then one every 20ms in arrival order
+    assert waits[0] == pytest.approx(0, abs=0.005)
+    for n in range(1, 5):
+        assert waits[n] == pytest.approx(n * 0.02, abs=0.01)
+
+
+def test_pause_blocks_every_token():
+    bucket = TokenBucket(rate=100, burst=10)
+    bucket.pause(0.05)
+    assert not bucket.try_acquire()
+    start = time.monotonic()
+    assert bucket.acquire() > 0.03
+    assert time.monotonic() - start >= 0.03
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_retry_after_formats():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after(" 1.5 ") == 1.5
+    assert parse_retry_after("-3") == 0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+
+    later = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(later, usegmt=True)) <= 30
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0
+
+
+def test_buckets_are_shared_per_host():
+    first = get_rate_limiter("shared.test", rate=5, burst=2)
+    assert get_rate_limiter("shared.test", rate=100) is first
+    assert first.rate == 5
+
+    configure_rate_limit("shared.test", 20, 4)
+    override = get_rate_limiter("shared.test")
+    assert override is not first and (override.rate, override.burst) == (20, 4)
@@ -0,0 +1,47 @@
+"""
+Scraper registry: sources are discovered, built and scheduled generically.
+"""
+from typing import List
+
+from src.scrapers import registry
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.replay import ReplayHarness
+from src.scrapers.scraper_manager import ScraperManager
+
+
+def test_builtin_sources_and_capabilities():
+    specs = {spec.key: spec for spec in registry.load_scrapers()}
+    assert sorted(specs) == ["adzuna", "indeed", "jsearch", "linkedin"]
+    assert specs["jsearch"].capabilities.monthly_quota == 1000
+    assert specs["adzuna"].capabilities.max_page_size == 50
+    assert specs["indeed"].capabilities.date_pushdown
+    assert not specs["linkedin"].capabilities.date_pushdown
+    assert specs["linkedin"].build({}) is None  # needs linkedin_api_key
+
+
+def test_manager_schedules_linkedin_and_plugins(monkeypatch):
+    monkeypatch.setattr(registry, "_registry", dict(registry._registry))
+
+    @registry.register_scraper("board", label="Board", enabled_by_default=False)
+    class BoardScraper(BaseScraper):
+        name = "Board"
+
+        def keyword_params(self, query):
+            return {"q": query.keywords[0]}
+
+        def fetch_page(self, keywords, location, page, **kwargs) -> List[dict]:
+            return [{"title": f"{keywords} {page}", "company": "B", "source": self.name}]
+
+    manager = ScraperManager(credentials={"linkedin_api_key": "replay-key"})
+    assert sorted(manager.scrapers) == ["board", "indeed", "linkedin"]
+    # Defaults: Indeed only (JSearch/Adzuna lack keys, the others are opt-in)
+    assert [s.name for s in manager._active_scrapers()] == ["Indeed"]
+
+    with ReplayHarness() as harness:
+        harness.attach_manager(manager)
+        jobs = manager.scrape_keywords(
+            ["Data Engineer"], "United States", 1, sources=["linkedin", "board"]
+        )
+    manager.close()
+    assert {job["source"] for job in jobs} == {"LinkedIn", "Board"}
+    assert manager.last_report["LinkedIn"]["completed"] == 1
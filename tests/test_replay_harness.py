@@ -0,0 +1,79 @@
+"""
+Offline scraper tests against the recorded cassettes (no network needed).
+"""
+import requests
+
+from src.scrapers.adzuna_scraper import AdzunaScraper
+from src.scrapers.indeed_scraper import IndeedScraper
+from src.scrapers.jsearch_scraper import JSearchScraper
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.replay import (
+    CASSETTE_DIR,
+    CassetteRecorder,
+    ReplayHarness,
+    StandInServer,
+    load_cassette,
+)
+
+
+def test_scrapers_parse_replayed_pages():
+    with ReplayHarness() as harness:
+        scrapers = [JSearchScraper("key"), AdzunaScraper("id", "key"), IndeedScraper()]
+        for scraper in scrapers:
+            assert harness.attach(scraper)
+            jobs = scraper.search_jobs("Data Engineer", "United States", num_pages=2)
+            assert len(jobs) == 10
+            assert all(job["source"] == scraper.name for job in jobs)
+            assert all(job["title"] != "N/A" and job["company"] != "N/A" for job in jobs)
+            scraper.close()
+
+        # Sources with larger/multi-page calls cover both pages in one request
+        assert harness.servers["JSearch"].stats["served"] == 1
+        assert harness.servers["Adzuna"].stats["served"] == 1
+        assert harness.servers["Indeed"].stats["served"] == 2
+
+
+def test_injected_errors_and_rate_limit():
+    cassette = load_cassette(CASSETTE_DIR / "jsearch.json")
+    with StandInServer(cassette, error_rate=1.0, seed=0) as server:
+        response = requests.get(server.base_url + "/search", params={"page": "1"})
+        assert response.status_code == 500
+
+    with StandInServer(cassette, rate_limit=1.0) as server:
+        statuses = [
+            requests.get(server.base_url + "/search", params={"page": "1"}).status_code
+            for _ in range(3)
+        ]
+        assert statuses[0] == 200
+        assert 429 in statuses
+        assert server.stats["throttled"] >= 1
+
+
+def test_recorder_strips_credentials(tmp_path):
+    cassette = load_cassette(CASSETTE_DIR / "adzuna.json")
+    with StandInServer(cassette) as server:
+        scraper = AdzunaScraper("secret-id", "secret-key")
+        scraper.base_url = server.base_url + "/v1/api/jobs/us/search"
+        scraper.recorder = CassetteRecorder()
+        scraper.fetch_page("Data Engineer", "United States", 1)
+        scraper.close()
+
+    (path,) = scraper.recorder.save(tmp_path)
+    text = path.read_text(encoding="utf-8")
+    assert "secret-id" not in text and "secret-key" not in text
+    assert load_cassette(path)["interactions"][0]["response"]["status"] == 200
+
+
+def test_indeed_full_descriptions_load_in_background():
+    with ReplayHarness() as harness:
+        # Stand-in host: no need for Indeed's real 1 request / 3 s pacing
+        configure_rate_limit(harness.servers["Indeed"].host, 20, 5)
+        scraper = IndeedScraper(fetch_details=True)
+        harness.attach(scraper)
+        jobs = scraper.search_jobs("Data Engineer", "United States", num_pages=1)
+        assert jobs and not jobs[0].description_loaded
+        assert jobs[0].description_preview.startswith("We are looking for")
+        descriptions = [job["description"] for job in jobs]
+        assert descriptions[0].startswith("Full posting for job 6")
+        assert all("sponsor" in text for text in descriptions)
+        scraper.close()
@@ -0,0 +1,144 @@
+"""
+Retry policy and per-host circuit breaker (no network needed).
+"""
+import time
+from typing import List
+
+import pytest
+import requests
+
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.quota import QuotaExceeded, QuotaLedger
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    get_circuit_breaker,
+)
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(max_attempts=4, base_delay=1.0, max_delay=5.0)
+    for attempt in range(6):
+        cap = min(5.0, 2 ** attempt)
+        delays = [policy.backoff(attempt) for _ in range(50)]
+        assert all(0 <= d <= cap for d in delays)
+    assert max(policy.backoff(10) for _ in range(50)) <= 5.0
+
+
+def test_breaker_state_machine():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05)
+    assert breaker.state == "closed" and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+    assert breaker.allow()  # the single trial
+    assert not breaker.allow()
+
+    # Failed trial re-opens for another cool-down
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_released_trial_can_be_retried():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0.01)
+    breaker.record_failure()
+    time.sleep(0.02)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+
+
+class _Scraper(BaseScraper):
+    name = "BreakerTest"
+    retry_policy = RetryPolicy(max_attempts=1, base_delay=0)
+    breaker_failure_threshold = 1
+    breaker_cooldown = 0.05
+    hedge_requests = False
+
+    def __init__(self, errors: List[Exception]):
+        super().__init__()
+        self.errors = errors
+
+        def get(url, **kwargs):
+            if self.errors:
+                raise self.errors.pop(0)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b"{}"
+            return response
+
+        self.session.get = get
+
+    def fetch_page(self, keywords, location, page, **kwargs):
+        return []
+
+
+@pytest.mark.parametrize(
+    "trial_error",
+    [requests.exceptions.ChunkedEncodingError("cut"), ValueError("bad body")],
+)
+def test_failed_trial_does_not_block_host(trial_error):
+    url = f"http://breaker-{type(trial_error).__name__.lower()}.test/jobs"
+    configure_rate_limit(url.split("/")[2], 100, 10)
+    scraper = _Scraper([requests.ConnectionError("down"), trial_error])
+
+    with pytest.raises(requests.ConnectionError):
+        scraper._get(url)
+    with pytest.raises(CircuitOpenError):
+        scraper._get(url)
+
+    time.sleep(0.06)
+    with pytest.raises(type(trial_error)):
+        scraper._get(url)  # the half-open trial fails oddly
+
+    if isinstance(trial_error, ValueError):
+        # No verdict: the next call is a fresh trial
+        assert scraper._get(url).status_code == 200
+    else:
+        # Transport failure: open again, then recover after the cool-down
+        with pytest.raises(CircuitOpenError):
+            scraper._get(url)
+        time.sleep(0.06)
+        assert scraper._get(url).status_code == 200
+    assert scraper._get(url).status_code == 200
+    scraper.close()
+
+
+def test_rejected_trial_is_not_charged(tmp_path):
+    url = "http://breaker-quota.test/jobs"
+    configure_rate_limit("breaker-quota.test", 100, 10)
+    ledger = QuotaLedger(tmp_path / "quota.sqlite3")
+    scraper = _Scraper([requests.ConnectionError("down")])
+    scraper.quota_ledger = ledger
+    scraper.monthly_quota = 3
+    with pytest.raises(requests.ConnectionError):
+        scraper._get(url)
+    time.sleep(0.06)
+
+    # Another thread holds the half-open trial: no quota is spent
+    breaker = get_circuit_breaker("breaker-quota.test")
+    assert breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        scraper._get(url)
+    assert ledger.used("BreakerTest", None)[0] == 1
+    breaker.release()
+
+    # A spent quota hands the trial back
+    ledger.try_debit("BreakerTest", None, 2)
+    with pytest.raises(QuotaExceeded):
+        scraper._get(url)
+    assert breaker.allow()
+    scraper.close()
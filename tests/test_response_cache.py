@@ -0,0 +1,90 @@
+"""
+On-disk response cache: TTL, ETag revalidation and LRU eviction (no network
+needed).
+"""
+import time
+
+import requests
+
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.response_cache import ResponseCache
+
+URL = "http://cache.test/jobs"
+
+
+def _response(status=200, body=b'{"jobs": []}', headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class _Scraper(BaseScraper):
+    name = "CacheTest"
+    hedge_requests = False
+    cache_ttl = 60
+
+    def __init__(self, cache):
+        super().__init__(cache=cache)
+        self.requests = []
+
+        def get(url, **kwargs):
+            headers = kwargs.get("headers") or {}
+            self.requests.append(headers)
+            if headers.get("If-None-Match") == '"v1"':
+                return _response(304, b"")
+            return _response(headers={"ETag": '"v1"', "Content-Type": "application/json"})
+
+        self.session.get = get
+
+    def fetch_page(self, keywords, location, page, **kwargs):
+        return []
+
+
+def test_key_ignores_credentials_and_param_order():
+    key = ResponseCache.make_key("Adzuna", URL, {"what": "Data ", "app_key": "secret", "page": 1})
+    assert key == ResponseCache.make_key("Adzuna", URL, {"page": "1", "WHAT": "Data", "app_key": "x"})
+    assert key != ResponseCache.make_key("Adzuna", URL, {"what": "Data", "page": 2})
+    assert key != ResponseCache.make_key("Indeed", URL, {"what": "Data", "page": 1})
+
+
+def test_fresh_hit_then_etag_revalidation(tmp_path):
+    configure_rate_limit("cache.test", 1000, 100)
+    cache = ResponseCache(tmp_path / "responses.sqlite3")
+    scraper = _Scraper(cache)
+
+    assert scraper._get(URL, params={"page": 1}).json() == {"jobs": []}
+    hit = scraper._get(URL, params={"page": 1})
+    assert hit.from_cache and hit.json() == {"jobs": []}
+    assert len(scraper.requests) == 1
+
+    # Past the TTL: a conditional request, answered 304, serves the body
+    revalidated = scraper._get(URL, params={"page": 1}, ttl=0)
+    assert scraper.requests[-1]["If-None-Match"] == '"v1"'
+    assert revalidated.status_code == 200 and revalidated.json() == {"jobs": []}
+    # ... and the entry is fresh again
+    scraper._get(URL, params={"page": 1})
+    assert len(scraper.requests) == 2
+
+    cache.clear("CacheTest")
+    scraper._get(URL, params={"page": 1})
+    assert len(scraper.requests) == 3 and "If-None-Match" not in scraper.requests[-1]
+    scraper.close()
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.sqlite3", max_bytes=250)
+    for name in ("a", "b"):
+        cache.put(name, "Test", URL, _response(body=b"x" * 100))
+        time.sleep(0.01)
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    time.sleep(0.01)
+    cache.put("c", "Test", URL, _response(body=b"x" * 100))
+
+    assert cache.get("b") is None
+    assert cache.get("a").body == b"x" * 100
+    assert cache.get("c").headers == {}
+    cache.close()
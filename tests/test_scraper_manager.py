@@ -0,0 +1,76 @@
+"""
+Concurrent (query, source) scraping in ScraperManager (no network needed).
+"""
+import threading
+import time
+
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.replay import ReplayHarness
+from src.scrapers.scraper_manager import ScraperManager
+
+KEYWORDS = ["Data Engineer", "Software Engineer"]
+
+
+def _track_in_flight(manager):
+    """Wrap every scraper's fetch_page to record peak concurrency."""
+    lock = threading.Lock()
+    state = {"total": 0, "peak": 0}
+    per_source = {}
+
+    for scraper in manager.scrapers.values():
+        fetch = scraper.fetch_page
+        per_source[scraper.name] = {"now": 0, "peak": 0}
+
+        def tracked(*args, _fetch=fetch, _name=scraper.name, **kwargs):
+            with lock:
+                state["total"] += 1
+                state["peak"] = max(state["peak"], state["total"])
+                source = per_source[_name]
+                source["now"] += 1
+                source["peak"] = max(source["peak"], source["now"])
+            try:
+                time.sleep(0.05)
+                return _fetch(*args, **kwargs)
+            finally:
+                with lock:
+                    state["total"] -= 1
+                    per_source[_name]["now"] -= 1
+
+        scraper.fetch_page = tracked
+    return state, per_source
+
+
+def test_sources_overlap_within_politeness_limits():
+    with ReplayHarness() as harness:
+        for server in harness.servers.values():
+            configure_rate_limit(server.host, 50, 10)
+        manager = ScraperManager("replay-key", "replay-id", "replay-key", max_workers=6)
+        harness.attach_manager(manager)
+        state, per_source = _track_in_flight(manager)
+        jobs = manager.scrape_keywords(KEYWORDS, "United States", 2)
+        manager.close()
+
+    assert jobs and state["peak"] > 1
+    for name, source in per_source.items():
+        assert source["peak"] <= manager.scrapers[name.lower()].max_in_flight
+    assert manager.last_report["Indeed"]["completed"] == 2
+
+
+def test_result_order_does_not_depend_on_timing():
+    from itertools import groupby
+
+    orders = []
+    for seed in (1, 2):
+        with ReplayHarness(latency_jitter=0.1, seed=seed) as harness:
+            for server in harness.servers.values():
+                configure_rate_limit(server.host, 50, 10)
+            manager = ScraperManager("replay-key", "replay-id", "replay-key")
+            harness.attach_manager(manager)
+            jobs = manager.scrape_keywords(KEYWORDS, "United States", 1)
+            tasks = manager.plan_tasks(KEYWORDS, 1)
+            manager.close()
+        orders.append([(job["source"], job["title"], job["company"]) for job in jobs])
+    assert orders[0] == orders[1]
+    # Task by task (first keyword, then source), whatever finished first
+    blocks = [source for source, _ in groupby(job[0] for job in orders[0])]
+    assert blocks == [scraper.name for _, scraper, _ in tasks]
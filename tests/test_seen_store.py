@@ -0,0 +1,112 @@
+"""
+Incremental scraping: seen-job fingerprints and per-query watermarks (no
+network needed).
+"""
+from src.scrapers.indeed_scraper import IndeedScraper
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.replay import ReplayHarness
+from src.scrapers.seen_store import SeenJobsStore
+
+
+def test_query_key_accepts_keyword_lists():
+    key = SeenJobsStore.query_key("Data Engineer, Cloud Architect ", " United States")
+    assert key == "data engineer, cloud architect|united states"
+    assert SeenJobsStore.query_key(("Data Engineer", " Cloud Architect"), "United States") == key
+    assert SeenJobsStore.query_key(["Data Engineer"], None) == "data engineer|"
+
+
+def test_keyword_tuple_search_uses_store(tmp_path):
+    store = SeenJobsStore(tmp_path / "seen.sqlite3")
+    with ReplayHarness() as harness:
+        scraper = IndeedScraper()
+        harness.attach(scraper)
+        jobs = scraper.search_jobs(("Data Engineer",), "United States", 1, seen_store=store)
+        scraper.close()
+    assert jobs and {job["search_keyword"] for job in jobs} == {"Data Engineer"}
+    store.close()
+
+
+def test_jobs_count_as_seen_only_after_commit(tmp_path):
+    store = SeenJobsStore(tmp_path / "seen.sqlite3")
+    query = SeenJobsStore.query_key("Data Engineer", "United States")
+    with ReplayHarness() as harness:
+        configure_rate_limit(harness.servers["Indeed"].host, 20, 5)
+        scraper = IndeedScraper()
+        harness.attach(scraper)
+        first = scraper.search_jobs("Data Engineer", "United States", 1, seen_store=store)
+        # Not committed (e.g. the run died before saving): scraped again
+        again = scraper.search_jobs("Data Engineer", "United States", 1, seen_store=store)
+        assert len(again) == len(first) > 0
+        assert store.get_watermark("Indeed", query) is None
+
+        store.commit(first)
+        assert store.filter_new(first) == []
+        # Relative dates ("1 day ago"): both scrapes staged a watermark
+        newest = max(job["posted_at"] for job in first if job.get("posted_at"))
+        assert store.get_watermark("Indeed", query) >= newest
+        assert scraper.search_jobs("Data Engineer", "United States", 1, seen_store=store) == []
+        scraper.close()
+    store.close()
+
+
+def test_watermark_never_moves_backwards(tmp_path):
+    from datetime import datetime
+
+    store = SeenJobsStore(tmp_path / "seen.sqlite3")
+    store.stage_watermark("Indeed", "q|", datetime(2024, 5, 2))
+    store.stage_watermark("Indeed", "q|", datetime(2024, 5, 1))
+    store.commit([])
+    assert store.get_watermark("Indeed", "q|") == datetime(2024, 5, 2)
+    store.update_watermark("Indeed", "q|", datetime(2024, 4, 1))
+    assert store.get_watermark("Indeed", "q|") == datetime(2024, 5, 2)
+    store.close()
+
+
+def test_new_requisition_with_same_title_is_new(tmp_path):
+    store = SeenJobsStore(tmp_path / "seen.sqlite3")
+    old = {"title": "Data Engineer", "company": "Acme", "location": "Austin, TX",
+           "source": "Indeed", "url": "https://indeed.com/viewjob?jk=1&from=serp"}
+    store.commit([old])
+    same = dict(old, url="https://www.indeed.com/viewjob?jk=1")
+    repost = dict(old, url="https://indeed.com/viewjob?jk=2")
+    assert store.filter_new([same, repost]) == [repost]
+    store.close()
+
+
+class _RelevanceScraper(IndeedScraper):
+    """Two pages of postings, the older ones first (relevance order)."""
+
+    def fetch_page(self, keywords, location, page, **kwargs):
+        from datetime import datetime, timedelta
+
+        age = 30 if page == 1 else 0
+        return [
+            {"title": f"Engineer {page}.{n}", "company": "Acme", "location": "US",
+             "source": self.name, "url": f"https://x.test/{page}/{n}",
+             "posted_at": datetime.now() - timedelta(days=age + n)}
+            for n in range(10)
+        ]
+
+
+def test_watermark_stops_only_date_sorted_searches(tmp_path):
+    from datetime import datetime, timedelta
+
+    store = SeenJobsStore(tmp_path / "seen.sqlite3")
+    query = SeenJobsStore.query_key("Data Engineer", "US")
+    store.update_watermark("Indeed", query, datetime.now() - timedelta(days=10))
+    scraper = _RelevanceScraper()
+    # No date filter: relevance order, so old page 1 must not end paging
+    jobs = scraper.search_jobs("Data Engineer", "US", 2, seen_store=store)
+    assert len(jobs) == 20
+    store.close()
+
+    # Date-sorted search: a page older than the watermark ends it
+    store = SeenJobsStore(tmp_path / "seen2.sqlite3")
+    store.update_watermark("Indeed", query, datetime.now() - timedelta(days=10))
+    jobs = scraper.search_jobs(
+        "Data Engineer", "US", 2, seen_store=store,
+        posted_after=datetime.now() - timedelta(days=60),
+    )
+    assert len(jobs) == 10 and all(job["title"].startswith("Engineer 1.") for job in jobs)
+    scraper.close()
+    store.close()
@@ -0,0 +1,82 @@
+"""
+Pooled keep-alive sessions shared by a scraper's calls (no network needed).
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.scraper_manager import ScraperManager
+
+
+class _KeepAliveServer:
+    """HTTP/1.1 server recording each request's client port and headers."""
+
+    def __init__(self):
+        self.ports = []
+        self.headers = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.ports.append(self.client_address[1])
+                server.headers.append(dict(self.headers))
+                body = b"{}"
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        self.host = f"127.0.0.1:{self._httpd.server_address[1]}"
+        configure_rate_limit(self.host, 1000, 100)
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class _Scraper(BaseScraper):
+    name = "SessionTest"
+    hedge_requests = False
+
+    def fetch_page(self, keywords, location, page, **kwargs):
+        return []
+
+
+def test_calls_reuse_one_connection():
+    server = _KeepAliveServer()
+    scraper = _Scraper(pool_size=4, connect_timeout=2, read_timeout=7)
+    seen = []
+    real_get = scraper.session.get
+    scraper.session.get = lambda url, **kw: seen.append(kw["timeout"]) or real_get(url, **kw)
+    for page in range(5):
+        assert scraper._get(f"http://{server.host}/jobs", params={"page": page}).ok
+    scraper.close()
+    server.close()
+
+    assert len(set(server.ports)) == 1  # one TCP connection for all pages
+    assert server.headers[0]["Accept-Encoding"] == "gzip, deflate"
+    assert seen == [(2, 7)] * 5
+    adapter = scraper.session.get_adapter("https://example.com")
+    assert adapter._pool_connections == adapter._pool_maxsize == 4
+
+
+def test_manager_forwards_session_options_and_closes():
+    manager = ScraperManager(
+        "key", "id", "key", session_options={"pool_size": 3, "connect_timeout": 1.5}
+    )
+    closed = []
+    for scraper in manager.scrapers.values():
+        assert scraper.connect_timeout == 1.5
+        assert scraper.session.get_adapter("https://example.com")._pool_maxsize == 3
+        scraper.session.close = lambda key=scraper: closed.append(key)
+    manager.close()
+    assert len(closed) == len(manager.scrapers) > 0
@@ -0,0 +1,107 @@
+"""
+Streaming scrapes: pages are yielded as they arrive and closing the stream
+stops the workers (no network needed).
+"""
+import threading
+
+import requests
+
+from src.scrapers.base_scraper import BaseScraper
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.replay import ReplayHarness
+from src.scrapers.resilience import RetryPolicy
+from src.scrapers.scraper_manager import ScraperManager
+
+
+def _manager(harness):
+    manager = ScraperManager("replay-key", "replay-id", "replay-key")
+    harness.attach_manager(manager)
+    return manager
+
+
+def test_pages_arrive_in_completion_order():
+    with ReplayHarness() as harness:
+        configure_rate_limit(harness.servers["Indeed"].host, 20, 5)
+        harness.servers["Indeed"].latency = 0.5
+        manager = _manager(harness)
+        pages = list(manager.iter_scrape(["Data Engineer"], "United States", 2))
+        batch = manager.scrape_keywords(["Data Engineer"], "United States", 2)
+        manager.close()
+
+    sources = [page[0]["source"] for page in pages]
+    # The slow source's pages come last instead of holding up the others
+    assert sources[-1] == "Indeed" and sources[0] != "Indeed"
+    streamed = sorted((job["source"], job["url"]) for page in pages for job in page)
+    assert streamed == sorted((job["source"], job["url"]) for job in batch)
+
+
+def test_closing_the_stream_stops_workers():
+    with ReplayHarness() as harness:
+        configure_rate_limit(harness.servers["Indeed"].host, 20, 5)
+        harness.servers["Indeed"].latency = 1.0
+        manager = _manager(harness)
+        stream = manager.iter_scrape(["Data Engineer"], "United States", 2)
+        first = next(stream)
+        stream.close()
+        assert first and first[0]["source"] != "Indeed"
+        assert manager.last_report["Indeed"]["unfinished"] == 1
+        assert manager.last_report["Indeed"]["jobs"] == 0
+        manager.close()
+
+
+class _EmptyPagesScraper(BaseScraper):
+    """Every page parses to nothing, so the caller never sees a page"""
+
+    name = "StopTest"
+    retry_policy = RetryPolicy(max_attempts=3, base_delay=0)
+    hedge_requests = False
+
+    def __init__(self, host: str, respond):
+        super().__init__()
+        configure_rate_limit(host, 100, 10)
+        self.url = f"http://{host}/jobs"
+        self.sent = 0
+
+        def get(url, **kwargs):
+            self.sent += 1
+            return respond(self.sent)
+
+        self.session.get = get
+
+    def fetch_page(self, keywords, location, page, **kwargs):
+        self._get(self.url, params={"page": page})
+        return []
+
+
+def _ok():
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"{}"
+    return response
+
+
+def test_stop_ends_a_search_that_yields_nothing():
+    stop = threading.Event()
+
+    def respond(sent):
+        if sent == 2:
+            stop.set()  # e.g. the scrape deadline passes mid-request
+        return _ok()
+
+    scraper = _EmptyPagesScraper("stop-pages.test", respond)
+    assert list(scraper.iter_search("Data Engineer", "US", 5, stop=stop)) == []
+    assert scraper.sent == 2
+    scraper.close()
+
+
+def test_stop_skips_retries_of_the_page_in_flight():
+    stop = threading.Event()
+
+    def respond(sent):
+        stop.set()
+        raise requests.ConnectionError("down")
+
+    scraper = _EmptyPagesScraper("stop-retries.test", respond)
+    assert list(scraper.iter_search("Data Engineer", "US", 5, stop=stop)) == []
+    assert scraper.sent == 1
+    scraper.close()
@@ -0,0 +1,112 @@
+"""
+Adaptive page depth: marginal-yield stopping and page budget reallocation.
+"""
+from src.scrapers.indeed_scraper import IndeedScraper
+from src.scrapers.query_planner import SearchQuery
+from src.scrapers.rate_limiter import configure_rate_limit
+from src.scrapers.replay import ReplayHarness
+from src.scrapers.yield_controller import YieldController
+
+
+def _jobs(n, start=0, company="Acme"):
+    return [{"title": f"Engineer {i}", "company": company} for i in range(start, start + n)]
+
+
+def test_rates_and_budget(tmp_path):
+    controller = YieldController(tmp_path / "yield.sqlite3", min_yield=0.5)
+    good, poor = SearchQuery(("Data Engineer",)), SearchQuery(("Sales Engineer",))
+    assert controller.quality("Indeed", good.keywords) == 0.5 * 0.3
+
+    scraped = [
+        {"source": "Indeed", "search_keyword": kw, "title": str(i)}
+        for kw in ("Data Engineer", "Sales Engineer")
+        for i in range(20)
+    ]
+    data_jobs = scraped[:20]
+    controller.record_outcomes(scraped, data_jobs[:15], data_jobs[:10])
+    assert controller.quality("Indeed", good.keywords) > 0.3
+    assert controller.quality("Indeed", poor.keywords) < 0.05
+
+    for query in (good, poor):
+        controller.register("Indeed", query, 3)
+    controller.charge("Indeed", poor)
+    # Five new postings of a poor keyword are worth less than half a good job
+    assert not controller.observe("Indeed", poor, _jobs(5, company="Other"))
+    assert not controller.grant("Indeed", good)  # nothing released yet
+    controller.finish("Indeed", poor)
+
+    for page in range(3):
+        controller.charge("Indeed", good)
+        assert controller.observe("Indeed", good, _jobs(5, start=5 * page))
+    assert controller.grant("Indeed", good) and controller.grant("Indeed", good)
+    assert not controller.grant("Indeed", good)  # poor left only 2 unused
+    # Same postings again: nothing new, stop
+    assert not controller.observe("Indeed", good, _jobs(5))
+
+    # Rates persist across instances
+    controller.close()
+    again = YieldController(tmp_path / "yield.sqlite3")
+    assert again.quality("Indeed", poor.keywords) < 0.05
+    again.close()
+
+
+def test_productive_query_extends_past_its_plan(tmp_path):
+    controller = YieldController(tmp_path / "yield.sqlite3", min_yield=0.5)
+    # Another Indeed query finished without using its 2 pages
+    other = SearchQuery(("Cloud Engineer",))
+    controller.register("Indeed", other, 2)
+    controller.finish("Indeed", other)
+
+    with ReplayHarness() as harness:
+        configure_rate_limit(harness.servers["Indeed"].host, 20, 5)
+        scraper = IndeedScraper()
+        harness.attach(scraper)
+        jobs = scraper.search_jobs(
+            "Data Engineer", "United States", num_pages=1, yield_controller=controller
+        )
+        scraper.close()
+        stats = harness.servers["Indeed"].stats
+
+    # Page 2 came from the released budget; max_extension caps it at 2x plan
+    assert len(jobs) == 10
+    assert stats["served"] == 2 and stats["misses"] == 0
+    controller.close()
+
+
+def test_off_by_default(monkeypatch):
+    import importlib
+
+    import config.settings
+
+    monkeypatch.delenv("ADAPTIVE_PAGING", raising=False)
+    assert importlib.reload(config.settings).ADAPTIVE_PAGING is False
+    monkeypatch.setenv("ADAPTIVE_PAGING", "1")
+    assert importlib.reload(config.settings).ADAPTIVE_PAGING is True
+    monkeypatch.delenv("ADAPTIVE_PAGING")
+    importlib.reload(config.settings)
+
+
+def test_report_shows_queries_stopped_early(tmp_path):
+    from src.scrapers.scraper_manager import ScraperManager
+
+    controller = YieldController(tmp_path / "yield.sqlite3", min_yield=0.5)
+    # Plenty of history: Data Engineer postings rarely pass or match
+    history = [
+        {"source": "Indeed", "search_keyword": "Data Engineer", "title": str(i)}
+        for i in range(200)
+    ]
+    controller.record_outcomes(history, history[:5], history[:1])
+
+    with ReplayHarness() as harness:
+        configure_rate_limit(harness.servers["Indeed"].host, 20, 5)
+        manager = ScraperManager(
+            "replay-key", "replay-id", "replay-key", yield_controller=controller
+        )
+        harness.attach_manager(manager)
+        manager.scrape_keywords(["Data Engineer"], "United States", 2, sources=["indeed"])
+        manager.close()
+
+    report = manager.last_report["Indeed"]
+    assert report["pages"] == 1
+    assert report["stopped_early"] == 1 and report["skipped_calls"] == 1
+    controller.close()